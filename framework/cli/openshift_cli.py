@@ -32,10 +32,10 @@ def derive_api_url_from_console_url(console_url: str) -> Optional[str]:
     if match:
         cluster_domain = match.group(1)
         api_url = f"https://api.{cluster_domain}:6443"
-        logger.info(f"Derived API URL from console URL: {api_url}")
+        logger.info("Derived API URL from console URL: %s", api_url)
         return api_url
     else:
-        logger.warning(f"Could not derive API URL from console URL: {console_url}")
+        logger.warning("Could not derive API URL from console URL: %s", console_url)
         return None
 
 
@@ -62,7 +62,7 @@ class OpenShiftCLI:
         :return: tuple[int, str, str]: (exit_code, stdout, stderr)
         :raises: RuntimeError if check=True and command fails
         """
-        logger.debug(f"Running command: {' '.join(command)}")
+        logger.debug("Running command: %s", " ".join(command))
 
         process = await asyncio.create_subprocess_exec(
             *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
@@ -74,9 +74,9 @@ class OpenShiftCLI:
         exit_code = process.returncode
 
         if exit_code != 0:
-            logger.warning(f"Command failed with exit code {exit_code}: {' '.join(command)}")
-            logger.warning(f"STDOUT: {stdout_str}")
-            logger.warning(f"STDERR: {stderr_str}")
+            logger.warning("Command failed with exit code %s: %s", exit_code, " ".join(command))
+            logger.warning("STDOUT: %s", stdout_str)
+            logger.warning("STDERR: %s", stderr_str)
 
             if check:
                 raise RuntimeError(f"Command failed: {' '.join(command)}\nSTDERR: {stderr_str}")
@@ -102,10 +102,10 @@ class OpenShiftCLI:
             command = ["oc", "login", url, "--token", tkn, "--insecure-skip-tls-verify=true"]
             exit_code, stdout, stderr = await self._run_command(command, check=True)
             self._logged_in = True
-            logger.info(f"Successfully logged in to {url}")
+            logger.info("Successfully logged in to %s", url)
             return True
         except RuntimeError as e:
-            logger.error(f"Login failed: {e}")
+            logger.error("Login failed: %s", e)
             return False
 
     async def login_with_credentials(self, api_url: str, username: str, password: str) -> bool:
@@ -134,10 +134,10 @@ class OpenShiftCLI:
             ]
             exit_code, stdout, stderr = await self._run_command(command, check=True)
             self._logged_in = True
-            logger.info(f"Successfully logged in to {api_url} as {username}")
+            logger.info("Successfully logged in to %s as %s", api_url, username)
             return True
         except RuntimeError as e:
-            logger.error(f"Login with credentials failed: {e}")
+            logger.error("Login with credentials failed: %s", e)
             return False
 
     async def is_logged_in(self) -> bool:
@@ -150,7 +150,7 @@ class OpenShiftCLI:
             exit_code, stdout, stderr = await self._run_command(["oc", "whoami"], check=False)
             return exit_code == 0
         except Exception as e:
-            logger.error(f"Failed to check login status: {e}")
+            logger.error("Failed to check login status: %s", e)
             return False
 
     async def create_project(self, name: str, display_name: Optional[str] = None) -> bool:
@@ -167,10 +167,10 @@ class OpenShiftCLI:
                 command.extend(["--display-name", display_name])
 
             exit_code, stdout, stderr = await self._run_command(command, check=True)
-            logger.info(f"Created project: {name}")
+            logger.info("Created project: %s", name)
             return True
         except RuntimeError as e:
-            logger.error(f"Failed to create project {name}: {e}")
+            logger.error("Failed to create project %s: %s", name, e)
             return False
 
     async def delete_project(self, name: str, wait: bool = False) -> bool:
@@ -187,10 +187,10 @@ class OpenShiftCLI:
                 command.append("--wait")
 
             exit_code, stdout, stderr = await self._run_command(command, check=True)
-            logger.info(f"Deleted project: {name}")
+            logger.info("Deleted project: %s", name)
             return True
         except RuntimeError as e:
-            logger.error(f"Failed to delete project {name}: {e}")
+            logger.error("Failed to delete project %s: %s", name, e)
             return False
 
     async def project_exists(self, name: str) -> bool:
@@ -207,7 +207,7 @@ class OpenShiftCLI:
             # If stdout contains the project name, it exists
             return name in stdout
         except Exception as e:
-            logger.error(f"Failed to check project existence {name}: {e}")
+            logger.error("Failed to check project existence %s: %s", name, e)
             return False
 
     async def switch_project(self, name: str) -> bool:
@@ -220,10 +220,10 @@ class OpenShiftCLI:
         try:
             command = ["oc", "project", name]
             exit_code, stdout, stderr = await self._run_command(command, check=True)
-            logger.info(f"Switched to project: {name}")
+            logger.info("Switched to project: %s", name)
             return True
         except RuntimeError as e:
-            logger.error(f"Failed to switch to project {name}: {e}")
+            logger.error("Failed to switch to project %s: %s", name, e)
             return False
 
     async def get_current_project(self) -> Optional[str]:
@@ -237,9 +237,121 @@ class OpenShiftCLI:
             exit_code, stdout, stderr = await self._run_command(command, check=False)
             return stdout if exit_code == 0 else None
         except Exception as e:
-            logger.error(f"Failed to get current project: {e}")
+            logger.error("Failed to get current project: %s", e)
             return None
 
+    async def get_resource_names(
+        self, kind: str, namespace: Optional[str] = None, label_selector: Optional[str] = None
+    ) -> Optional[list[str]]:
+        """
+        List the names of all resources of a kind.
+
+        :param str kind: Resource kind (e.g., "pipelinerun", "task", "pipelines.tekton.dev")
+        :param Optional[str] namespace: Namespace to list in (uses current if not specified)
+        :param Optional[str] label_selector: Optional label selector (e.g., "app=demo")
+        :return: Optional[list[str]]: Resource names, or None if the listing failed
+        """
+        command = ["oc", "get", kind, "-o", "jsonpath={.items[*].metadata.name}"]
+        if namespace:
+            command.extend(["-n", namespace])
+        if label_selector:
+            command.extend(["-l", label_selector])
+        exit_code, stdout, stderr = await self._run_command(command, check=False)
+        if exit_code != 0:
+            return None
+        return stdout.split()
+
+    async def get_resource_label_values(
+        self, kind: str, label: str, namespace: Optional[str] = None
+    ) -> Optional[dict[str, str]]:
+        """
+        Map the names of all resources of a kind that carry a label to the label's value.
+
+        :param str kind: Resource kind (e.g., "pipelinerun")
+        :param str label: Label key (e.g., "triggers.tekton.dev/triggers-eventid")
+        :param Optional[str] namespace: Namespace to list in (uses current if not specified)
+        :return: Optional[dict[str, str]]: Label value keyed by resource name, or None if the listing failed
+        """
+        escaped_label = label.replace(".", "\\.")
+        jsonpath = f'{{range .items[*]}}{{.metadata.name}}{{" "}}{{.metadata.labels.{escaped_label}}}{{"\\n"}}{{end}}'
+        command = ["oc", "get", kind, "-l", label, "-o", f"jsonpath={jsonpath}"]
+        if namespace:
+            command.extend(["-n", namespace])
+        exit_code, stdout, stderr = await self._run_command(command, check=False)
+        if exit_code != 0:
+            return None
+        values = {}
+        for line in stdout.splitlines():
+            name, _, value = line.strip().partition(" ")
+            if name:
+                values[name] = value
+        return values
+
+    async def get_resource_yaml(self, kind: str, name: str, namespace: Optional[str] = None) -> Optional[str]:
+        """
+        Get a resource as stored in the cluster (``oc get -o yaml``).
+
+        :param str kind: Resource kind (e.g., "pipeline")
+        :param str name: Resource name
+        :param Optional[str] namespace: Namespace of the resource (uses current if not specified)
+        :return: Optional[str]: Resource YAML, or None if the resource could not be read
+        """
+        command = ["oc", "get", kind, name, "-o", "yaml"]
+        if namespace:
+            command.extend(["-n", namespace])
+        exit_code, stdout, stderr = await self._run_command(command, check=False)
+        if exit_code != 0:
+            logger.error("Failed to get %s '%s': %s", kind, name, stderr)
+            return None
+        return stdout
+
+    async def resource_exists(self, kind: str, name: str, namespace: Optional[str] = None) -> bool:
+        """
+        Check if a resource exists.
+
+        :param str kind: Resource kind (e.g., "pipelinerun")
+        :param str name: Resource name, or generateName prefix ending with "-"
+        :param Optional[str] namespace: Namespace to check in (uses current if not specified)
+        :return: bool: True if a matching resource exists, False otherwise
+        :raises RuntimeError: If the resources could not be listed
+        """
+        names = await self.get_resource_names(kind, namespace)
+        if names is None:
+            logger.error("Failed to list %s while checking for '%s'", kind, name)
+            raise RuntimeError(f"Could not list {kind} to check whether '{name}' exists")
+        if name.endswith("-"):
+            return any(existing.startswith(name) for existing in names)
+        return name in names
+
+    async def wait_for_resource_deleted(
+        self,
+        kind: str,
+        name: str,
+        namespace: Optional[str] = None,
+        timeout_seconds: float = 60,
+        poll_interval_seconds: float = 1,
+    ) -> bool:
+        """
+        Wait until a resource no longer exists (finalizers included).
+
+        :param str kind: Resource kind (e.g., "pipelinerun")
+        :param str name: Resource name, or generateName prefix ending with "-"
+        :param Optional[str] namespace: Namespace of the resource (uses current if not specified)
+        :param float timeout_seconds: Maximum time to wait
+        :param float poll_interval_seconds: Time between checks
+        :return: bool: True if the resource is gone, False if it still exists after the timeout
+        :raises RuntimeError: If the resources could not be listed
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout_seconds
+        while await self.resource_exists(kind, name, namespace):
+            if loop.time() >= deadline:
+                logger.error("%s %s still exists after %ss", kind, name, timeout_seconds)
+                return False
+            await asyncio.sleep(poll_interval_seconds)
+        logger.info("Confirmed %s %s is deleted", kind, name)
+        return True
+
     def generate_random_project_name(self, prefix: str = "release-ui-test") -> str:
         """
         Generate a random project name for test isolation.
@@ -276,14 +388,83 @@ class OpenShiftCLI:
             # Execute the command
             exit_code, stdout, stderr = await self._run_command(command, check=True)
             logger.info("Successfully applied YAML content")
-            logger.debug(f"STDOUT: {stdout}")
+            logger.debug("STDOUT: %s", stdout)
 
             return True
         except RuntimeError as e:
-            logger.error(f"Failed to apply YAML: {e}")
+            logger.error("Failed to apply YAML: %s", e)
             return False
         finally:
             # Clean up the temporary file
             if "tmp_file_path" in locals() and os.path.exists(tmp_file_path):
                 os.remove(tmp_file_path)
-                logger.debug(f"Removed temporary file: {tmp_file_path}")
+                logger.debug("Removed temporary file: %s", tmp_file_path)
+
+    async def apply_yaml_documents(
+        self, documents: list[str], namespace: Optional[str] = None, batch_size: int = 50, max_concurrency: int = 4
+    ) -> bool:
+        """
+        Apply many YAML documents with a few batched oc apply calls.
+
+        Documents are joined into multi-document YAML files of batch_size documents each;
+        up to max_concurrency batches are applied at the same time.
+
+        :param list[str] documents: YAML documents to apply
+        :param Optional[str] namespace: Namespace to apply the resources to (uses current if not specified)
+        :param int batch_size: Number of documents per oc apply call
+        :param int max_concurrency: Maximum number of concurrent oc apply calls
+        :return: bool: True if every batch applied successfully, False otherwise
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _apply_batch(batch: list[str]) -> bool:
+            async with semaphore:
+                return await self.apply_yaml("\n---\n".join(doc.strip() for doc in batch) + "\n", namespace)
+
+        batches = [documents[start : start + batch_size] for start in range(0, len(documents), batch_size)]
+        results = await asyncio.gather(*(_apply_batch(batch) for batch in batches))
+        logger.info("Applied %s documents in %s batches (%s succeeded)", len(documents), len(batches), sum(results))
+        return all(results)
+
+    async def expose_eventlistener(
+        self, name: str, namespace: Optional[str] = None, timeout_seconds: int = 120
+    ) -> Optional[str]:
+        """
+        Wait for an EventListener to become ready and expose its service through a Route.
+
+        The EventListener controller creates a service named "el-<name>"; exposing it is idempotent.
+
+        :param str name: EventListener name
+        :param Optional[str] namespace: Namespace of the EventListener (uses current if not specified)
+        :param int timeout_seconds: Maximum time to wait for the EventListener to become ready
+        :return: Optional[str]: Webhook URL (e.g., "http://el-name-ns.apps.example.com"), or None on failure
+        """
+        namespace_args = ["-n", namespace] if namespace else []
+        service = f"el-{name}"
+
+        exit_code, stdout, stderr = await self._run_command(
+            ["oc", "wait", "--for=condition=Ready", f"eventlistener/{name}", f"--timeout={timeout_seconds}s"]
+            + namespace_args,
+            check=False,
+        )
+        if exit_code != 0:
+            logger.error("EventListener %s did not become ready: %s", name, stderr)
+            return None
+
+        exit_code, stdout, stderr = await self._run_command(
+            ["oc", "expose", "service", service] + namespace_args, check=False
+        )
+        if exit_code != 0 and "AlreadyExists" not in stderr:
+            logger.error("Failed to expose EventListener service %s: %s", service, stderr)
+            return None
+
+        exit_code, stdout, stderr = await self._run_command(
+            ["oc", "get", "route", service, "-o", "jsonpath={.spec.host}"] + namespace_args, check=False
+        )
+        if exit_code != 0 or not stdout.strip():
+            logger.error("Failed to read route host of EventListener %s: %s", name, stderr)
+            return None
+
+        url = f"http://{stdout.strip()}"
+        logger.info("EventListener %s is exposed at %s", name, url)
+        return url
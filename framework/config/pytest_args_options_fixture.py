@@ -4,23 +4,151 @@ import pytest
 from pytest import Parser, Session
 
 from framework.config.config import Config
+from framework.helpers.network_conditions import CPU_PROFILES, NETWORK_PROFILES, PROFILE_OFF
 
 logger = logging.getLogger(__name__)
 
 
+def _str_to_bool(value: str) -> bool:
+    """
+    Parses a boolean command line value.
+    :param str value: Option value (e.g., "true", "1", "yes", "on"; anything else is False)
+    :return: bool: Parsed value
+    """
+    return value.lower() in ("true", "1", "yes", "on")
+
+
 def pytest_addoption(parser: Parser) -> None:
     """
-    registers the --ignore-ssl-errors option with Pytest for controlling SSL certificate validation
+    registers the --ignore-ssl-errors option with Pytest for controlling SSL certificate validation,
+    the --network-profile and --cpu-profile options for emulating remote network and CPU conditions,
+    the --failure-artifacts and --artifacts-dir options for failure artifact capture,
+    the --structured-logs and --log-component-levels options for the log pipeline,
+    the --har-* options for HAR record/replay runs, the --browser-daemon and --context-pool options,
+    the --memory-monitor option, and the --perf-* options for the front-end performance collector
     :param Parser parser: Pytest argument parser object
     :return: None
     """
     parser.addoption(
         "--ignore-ssl-errors",
         action="store",
-        type=lambda x: x.lower() in ("true", "1", "yes", "on"),
+        type=_str_to_bool,
         default=True,
         help="Ignore SSL certificate errors (default: True). Set to false to disable.",
     )
+    parser.addoption(
+        "--network-profile",
+        action="store",
+        choices=list(NETWORK_PROFILES),
+        default=PROFILE_OFF,
+        help="Emulated network between browser and console: latency, bandwidth, packet loss (default: off).",
+    )
+    parser.addoption(
+        "--cpu-profile",
+        action="store",
+        choices=list(CPU_PROFILES),
+        default=PROFILE_OFF,
+        help="Emulated CPU slowdown of the browser's renderer (default: off).",
+    )
+    parser.addoption(
+        "--failure-artifacts",
+        action="store",
+        type=_str_to_bool,
+        default=True,
+        help="Save trace, screenshot, DOM and recent console/network events of failed scenarios (default: True).",
+    )
+    parser.addoption(
+        "--artifacts-dir",
+        action="store",
+        default="test-artifacts",
+        help="Directory for failure artifacts (default: test-artifacts).",
+    )
+    parser.addoption(
+        "--structured-logs",
+        action="store",
+        type=_str_to_bool,
+        default=True,
+        help="Write framework and test logs as JSON lines to <artifacts-dir>/logs/<worker>.jsonl (default: True).",
+    )
+    parser.addoption(
+        "--log-component-levels",
+        action="store",
+        default="",
+        help="Per-component log levels, e.g. 'framework.cli=DEBUG,framework.ui_components=WARNING' (default: INFO).",
+    )
+    parser.addoption(
+        "--har-mode",
+        action="store",
+        choices=("off", "record", "replay"),
+        default="off",
+        help="Record each feature's console traffic to a HAR file, or replay features offline from it (default: off).",
+    )
+    parser.addoption(
+        "--har-dir",
+        action="store",
+        default="tests/har",
+        help="Directory of the HAR recordings, one per step module (default: tests/har).",
+    )
+    parser.addoption(
+        "--har-console-version",
+        action="store",
+        default="",
+        help="Console version the recordings must match in replay mode; others are skipped as stale (default: any).",
+    )
+    parser.addoption(
+        "--har-max-age-days",
+        action="store",
+        type=float,
+        default=30,
+        help="Maximum age of a recording in replay mode; older ones are skipped as stale, 0 disables (default: 30).",
+    )
+    parser.addoption(
+        "--browser-daemon",
+        action="store",
+        type=_str_to_bool,
+        default=True,
+        help="Use the warm browser daemon's browser, session and spare projects when it is running (default: True).",
+    )
+    parser.addoption(
+        "--context-pool",
+        action="store",
+        type=_str_to_bool,
+        default=True,
+        help="Lease reset browser contexts from a session pool instead of creating one per module (default: True).",
+    )
+    parser.addoption(
+        "--memory-monitor",
+        action="store",
+        type=_str_to_bool,
+        default=True,
+        help="Sample page memory after each scenario, recycle bloated pages and report leaking routes (default: True).",
+    )
+    parser.addoption(
+        "--perf-collect",
+        action="store",
+        type=_str_to_bool,
+        default=True,
+        help="Collect front-end performance metrics per console route (default: True).",
+    )
+    parser.addoption(
+        "--perf-baseline",
+        action="store",
+        default="",
+        help="Route metrics of a previous console release; routes whose median got worse fail the run (default: none).",
+    )
+    parser.addoption(
+        "--perf-save-baseline",
+        action="store",
+        default="",
+        help="File to save this run's route metrics to, for use as a later --perf-baseline (default: none).",
+    )
+    parser.addoption(
+        "--perf-tolerance",
+        action="store",
+        type=float,
+        default=0.2,
+        help="Allowed relative growth of a route's median over the baseline, e.g. 0.2 for 20%% (default: 0.2).",
+    )
 
 
 @pytest.hookimpl(trylast=True)
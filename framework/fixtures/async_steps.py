@@ -0,0 +1,183 @@
+"""
+Async-native BDD steps.
+
+``async_given``, ``async_when`` and ``async_then`` register coroutine functions as pytest-bdd
+steps. They take the same arguments as ``given``/``when``/``then``; the step coroutine runs on
+the session event loop, so steps no longer need an inner ``_step()`` and ``run_async``.
+
+``ScenarioTaskGroup`` (the ``scenario_tasks`` fixture) lets a step start background work that
+a later step of the same scenario awaits, e.g. a CLI apply that overlaps with UI navigation.
+Background tasks advance whenever a step or fixture runs on the session loop; the group waits
+for, then cancels, whatever is left when the scenario ends.
+
+Examples:
+    @async_given("the trigger prerequisites are created via cli")
+    async def create_prerequisites(openshift_cli: OpenShiftCLI, scenario_tasks: ScenarioTaskGroup) -> None:
+        scenario_tasks.start("prerequisites", openshift_cli.apply_yaml_documents(documents))
+
+    @async_when("the user creates an eventlistener")
+    async def create_eventlistener(page: Dict[str, Any], scenario_tasks: ScenarioTaskGroup) -> None:
+        await scenario_tasks.wait_for("prerequisites")
+        ...
+"""
+
+import asyncio
+import functools
+import inspect
+import logging
+from typing import Any, Callable, Coroutine, Dict, List, Optional, TypeVar, Union
+
+from pytest_bdd import given, then, when
+from pytest_bdd.parsers import StepParser
+
+from framework.fixtures.async_bridge import run_async
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+AsyncStep = Callable[..., Coroutine[Any, Any, T]]
+
+# Session loop fixture the step coroutines run on
+LOOP_FIXTURE = "playwright_event_loop"
+
+
+def _sync_step(func: AsyncStep) -> Callable[..., Any]:
+    """
+    Wraps a step coroutine function in the synchronous function pytest-bdd calls.
+
+    The wrapper has the coroutine's signature (so pytest-bdd resolves the same step arguments
+    and fixtures) plus the session loop fixture, which it uses to run the coroutine.
+
+    :param AsyncStep func: Step coroutine function
+    :return: Callable[..., Any]: Synchronous step function
+    """
+    signature = inspect.signature(func)
+    parameters = list(signature.parameters.values())
+    needs_loop = LOOP_FIXTURE not in signature.parameters
+    if needs_loop:
+        # Required parameters must come before the ones with defaults
+        position = next(
+            (
+                index
+                for index, parameter in enumerate(parameters)
+                if parameter.default is not parameter.empty or parameter.kind is not parameter.POSITIONAL_OR_KEYWORD
+            ),
+            len(parameters),
+        )
+        parameters.insert(position, inspect.Parameter(LOOP_FIXTURE, inspect.Parameter.POSITIONAL_OR_KEYWORD))
+
+    @functools.wraps(func)
+    def step(**kwargs: object) -> object:
+        loop = kwargs.pop(LOOP_FIXTURE) if needs_loop else kwargs[LOOP_FIXTURE]
+        return run_async(loop, func(**kwargs))
+
+    step.__signature__ = signature.replace(parameters=parameters)
+    return step
+
+
+def _async_step_decorator(pytest_bdd_decorator: Callable[..., Callable]) -> Callable[..., Callable]:
+    """
+    Builds an async counterpart of a pytest-bdd step decorator.
+
+    :param Callable[..., Callable] pytest_bdd_decorator: given, when or then
+    :return: Callable[..., Callable]: Decorator factory with the same arguments
+    """
+
+    def decorator_factory(
+        name: Union[str, StepParser],
+        converters: Optional[Dict[str, Callable[[str], Any]]] = None,
+        target_fixture: Optional[str] = None,
+        stacklevel: int = 1,
+    ) -> Callable[[AsyncStep], AsyncStep]:
+        def decorator(func: AsyncStep) -> AsyncStep:
+            if not inspect.iscoroutinefunction(func):
+                raise TypeError(f"Step '{func.__name__}' must be an async function")
+            # stacklevel + 1: pytest-bdd injects the step fixture into the module calling this decorator
+            pytest_bdd_decorator(name, converters=converters, target_fixture=target_fixture, stacklevel=stacklevel + 1)(
+                _sync_step(func)
+            )
+            # Return the coroutine function itself so step decorators can be stacked
+            return func
+
+        return decorator
+
+    return decorator_factory
+
+
+async_given = _async_step_decorator(given)
+async_when = _async_step_decorator(when)
+async_then = _async_step_decorator(then)
+
+
+class ScenarioTaskGroup:
+    """
+    Named background tasks of a scenario, handed off from the step that starts them to the
+    step that needs their result.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty task group."""
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._awaited: set[str] = set()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tasks
+
+    def start(self, name: str, coro: Coroutine[Any, Any, T]) -> "asyncio.Task[T]":
+        """
+        Starts background work on the running (session) loop. Must be called from a step coroutine.
+
+        :param str name: Name later steps use to wait for the result
+        :param Coroutine[Any, Any, T] coro: Work to run
+        :return: asyncio.Task[T]: The background task
+        :raises ValueError: If a task with that name is still running
+        """
+        running = self._tasks.get(name)
+        if running is not None and not running.done():
+            coro.close()
+            raise ValueError(f"Background task '{name}' is already running")
+        task = asyncio.get_running_loop().create_task(coro, name=f"scenario:{name}")
+        self._tasks[name] = task
+        logger.debug("Started background task '%s'", name)
+        return task
+
+    async def wait_for(self, name: str, timeout_seconds: Optional[float] = None) -> object:
+        """
+        Waits for a background task and returns its result (re-raising its exception).
+        The task stays in the group, so several steps can wait for it.
+
+        :param str name: Name the task was started with
+        :param Optional[float] timeout_seconds: Maximum time to wait; None waits indefinitely
+        :return: object: Result of the task
+        :raises KeyError: If no task with that name was started in this scenario
+        """
+        if name not in self._tasks:
+            raise KeyError(f"No background task '{name}' was started; started: {sorted(self._tasks)}")
+        self._awaited.add(name)
+        # shield: a timeout of this wait must not cancel work other steps may still wait for
+        return await asyncio.wait_for(asyncio.shield(self._tasks[name]), timeout_seconds)
+
+    async def close(self, timeout_seconds: float = 60) -> List[str]:
+        """
+        Waits for unfinished tasks, cancels those still running after the timeout, and collects
+        the failures of tasks whose exception no step has seen.
+
+        :param float timeout_seconds: Maximum time to wait for unfinished tasks
+        :return: List[str]: Descriptions of failed or cancelled tasks
+        """
+        tasks, awaited = self._tasks, self._awaited
+        self._tasks, self._awaited = {}, set()
+        pending = [task for task in tasks.values() if not task.done()]
+        if pending:
+            _, still_running = await asyncio.wait(pending, timeout=timeout_seconds)
+            for task in still_running:
+                task.cancel()
+            await asyncio.gather(*still_running, return_exceptions=True)
+
+        problems = []
+        for name, task in tasks.items():
+            if task.cancelled():
+                problems.append(f"'{name}' did not finish within {timeout_seconds}s and was cancelled")
+            elif name not in awaited and task.exception() is not None:
+                problems.append(f"'{name}' failed: {type(task.exception()).__name__}: {task.exception()}")
+        return problems
@@ -5,6 +5,7 @@ Provides pytest fixtures for OpenShift CLI operations, including:
 - Isolated test project creation per feature file
 - Automatic project cleanup on test completion
 - CLI authentication and context management
+- Background application of a feature's declared cluster prerequisites
 
 Configuration Loading:
 - Environment variables are loaded from .env file at module import time
@@ -15,7 +16,7 @@ Configuration Loading:
 import logging
 import os
 from pathlib import Path
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 import pytest
 from _pytest.nodes import Item
@@ -24,6 +25,9 @@ from dotenv import load_dotenv
 
 from framework.cli.openshift_cli import OpenShiftCLI, derive_api_url_from_console_url
 from framework.config.config import Config
+from framework.helpers.browser_daemon import DaemonClient
+from framework.helpers.har_replay import HAR_MODE_REPLAY
+from framework.helpers.prerequisite_scheduler import PrerequisiteScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -74,13 +78,13 @@ async def _perform_cli_login(openshift_cli: OpenShiftCLI) -> None:
                 "Set OC_API_URL environment variable explicitly."
             )
 
-        logger.info(f"Using API URL: {api_url}")
+        logger.info("Using API URL: %s", api_url)
         login_success = await openshift_cli.login_with_credentials(
             api_url=api_url, username=config.username, password=config.password
         )
 
         if login_success:
-            logger.info(f"Successfully logged in as {config.username}")
+            logger.info("Successfully logged in as %s", config.username)
         else:
             raise RuntimeError("Login with username/password failed. Check CONSOLE_USERNAME and CONSOLE_PASSWORD")
 
@@ -91,27 +95,49 @@ async def _perform_cli_login(openshift_cli: OpenShiftCLI) -> None:
         ) from e
 
 
+class _ReplayOpenShiftCLI(OpenShiftCLI):
+    """OpenShift CLI used with ``--har-mode=replay``: skips the scenario instead of running oc commands."""
+
+    async def _run_command(self, command: list[str], check: bool = True) -> tuple[int, str, str]:
+        """
+        Skips the current scenario, since replayed runs have no cluster to run oc commands against.
+
+        :param list[str] command: Command that would have been run (e.g., ["oc", "whoami"])
+        :param bool check: Unused
+        :return: tuple[int, str, str]: Never returns
+        """
+        pytest.skip(f"'{' '.join(command[:3])}' needs a live cluster; not available with --har-mode=replay")
+
+
 @pytest.fixture(scope="session")
-def openshift_cli() -> OpenShiftCLI:
+def openshift_cli(request: pytest.FixtureRequest) -> OpenShiftCLI:
     """
     Session-scoped OpenShift CLI instance.
 
     Reads OC_TOKEN and API URL from environment if available.
     Returns an OpenShiftCLI instance that can be used for cluster operations.
 
+    With ``--har-mode=replay`` the instance skips any scenario that runs an oc command through it,
+    so steps that set up or check resources through the CLI skip instead of failing.
+
+    :param pytest.FixtureRequest request: pytest request object for accessing command line options
     :return: OpenShiftCLI: CLI wrapper instance
     """
     # Get token from environment (optional - may already be logged in via oc login)
     token = os.getenv("OC_TOKEN")
     api_url = os.getenv("OC_API_URL")  # e.g., https://api.cluster.example.com:6443
 
+    if request.config.getoption("--har-mode", default="off") == HAR_MODE_REPLAY:
+        logger.info("HAR replay mode - steps that run oc commands will be skipped")
+        return _ReplayOpenShiftCLI(api_url=api_url, token=token)
+
     cli = OpenShiftCLI(api_url=api_url, token=token)
     logger.info("OpenShift CLI instance created")
     return cli
 
 
 @pytest.fixture(scope="module")
-async def test_project(openshift_cli: OpenShiftCLI, request: pytest.FixtureRequest) -> str:
+async def test_project(openshift_cli: OpenShiftCLI, config: Config, request: pytest.FixtureRequest) -> str:
     """
     Module-scoped fixture that creates an isolated project for each feature file.
 
@@ -122,13 +148,25 @@ async def test_project(openshift_cli: OpenShiftCLI, request: pytest.FixtureReque
     Uses a session-level flag to ensure login only happens once across all test modules,
     avoiding redundant login checks and improving test execution speed.
 
+    When the warm browser daemon is running, a spare project it created ahead of time is claimed
+    instead of creating one; it is deleted after the tests like any other test project. Spares of a
+    daemon running against another console are not claimed.
+
+    With ``--har-mode=replay`` no cluster is used: the fixture only generates a project name,
+    which the HAR replay maps to the project of the recording.
+
     :param OpenShiftCLI openshift_cli: CLI wrapper instance
+    :param Config config: Framework configuration
     :param pytest.FixtureRequest request: pytest request object for accessing test metadata
     :return: str: The created project name
     :raises: RuntimeError if project creation fails
     """
     global _cli_logged_in
 
+    if request.config.getoption("--har-mode", default="off") == HAR_MODE_REPLAY:
+        yield openshift_cli.generate_random_project_name()
+        return
+
     # Check session-level login flag first to avoid redundant login checks
     if not _cli_logged_in:
         logger.info("First test module - checking CLI login status")
@@ -140,18 +178,25 @@ async def test_project(openshift_cli: OpenShiftCLI, request: pytest.FixtureReque
     _cli_logged_in = True
     logger.info("CLI login status confirmed - subsequent modules will skip login check")
 
-    # Generate unique project name
-    project_name = openshift_cli.generate_random_project_name()
+    # Claim a project the warm browser daemon created ahead of time, if it is running
+    project_name = None
+    if request.config.getoption("--browser-daemon", default=True):
+        project_name = await DaemonClient().claim_project(config.base_url)
+    if project_name:
+        logger.info("Using spare test project from the browser daemon: %s", project_name)
+    else:
+        # Generate unique project name
+        project_name = openshift_cli.generate_random_project_name()
 
-    # Get feature file name for display name
-    feature_file = getattr(request.module, "__file__", "unknown")
-    display_name = f"UI Test: {os.path.basename(feature_file)}"
+        # Get feature file name for display name
+        feature_file = getattr(request.module, "__file__", "unknown")
+        display_name = f"UI Test: {os.path.basename(feature_file)}"
 
-    logger.info(f"Creating test project: {project_name}")
-    success = await openshift_cli.create_project(project_name, display_name=display_name)
+        logger.info("Creating test project: %s", project_name)
+        success = await openshift_cli.create_project(project_name, display_name=display_name)
 
-    if not success:
-        raise RuntimeError(f"Failed to create test project: {project_name}")
+        if not success:
+            raise RuntimeError(f"Failed to create test project: {project_name}")
 
     # Switch to the new project
     await openshift_cli.switch_project(project_name)
@@ -175,12 +220,13 @@ async def test_project(openshift_cli: OpenShiftCLI, request: pytest.FixtureReque
         session_failed = False
 
     if not has_failures and not session_failed:
-        logger.info(f"All tests passed - deleting test project: {project_name}")
+        logger.info("All tests passed - deleting test project: %s", project_name)
         await openshift_cli.delete_project(project_name, wait=False)
     else:
         logger.warning(
-            f"Tests failed - keeping project {project_name} for debugging. "
-            f"Delete manually with: oc delete project {project_name}"
+            "Tests failed - keeping project %s for debugging. Delete manually with: oc delete project %s",
+            project_name,
+            project_name,
         )
 
     # Restore original project context (optional)
@@ -188,6 +234,43 @@ async def test_project(openshift_cli: OpenShiftCLI, request: pytest.FixtureReque
         await openshift_cli.switch_project(original_project)
 
 
+@pytest.fixture(scope="module")
+async def cluster_prerequisites(
+    openshift_cli: OpenShiftCLI, test_project: str, request: pytest.FixtureRequest
+) -> AsyncGenerator[PrerequisiteScheduler, None]:
+    """
+    Module-scoped fixture that starts applying the module's declared cluster prerequisites
+    (``CLUSTER_PREREQUISITES``, a list of Prerequisite) to the test project in the background.
+
+    Steps that need a prerequisite await it with ``cluster_prerequisites.apply(...)``.
+    Modules that declare prerequisites need a live cluster and are skipped with ``--har-mode=replay``.
+
+    :param OpenShiftCLI openshift_cli: CLI wrapper instance
+    :param str test_project: The test project name (module-scoped)
+    :param pytest.FixtureRequest request: pytest request object for accessing the step module
+    :return: AsyncGenerator[PrerequisiteScheduler, None]: The scheduler of the module
+    """
+    if request.config.getoption("--har-mode", default="off") == HAR_MODE_REPLAY:
+        pytest.skip("Cluster prerequisites need a live cluster; not available with --har-mode=replay")
+    scheduler = PrerequisiteScheduler(openshift_cli, test_project)
+    scheduler.schedule(getattr(request.module, "CLUSTER_PREREQUISITES", []))
+    yield scheduler
+    await scheduler.close()
+
+
+@pytest.fixture(autouse=True)
+def schedule_cluster_prerequisites(request: pytest.FixtureRequest) -> None:
+    """
+    Starts the cluster_prerequisites fixture before the first step of a scenario runs, for modules
+    that declare ``CLUSTER_PREREQUISITES``, so the CLI work overlaps with the UI Background steps.
+
+    :param pytest.FixtureRequest request: pytest request object
+    :return: None
+    """
+    if getattr(request.module, "CLUSTER_PREREQUISITES", None):
+        request.getfixturevalue("cluster_prerequisites")
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item: Item, call: CallInfo[None]) -> Generator[None, None, None]:
     """
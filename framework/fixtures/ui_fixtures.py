@@ -1,23 +1,63 @@
 import asyncio
-from collections.abc import AsyncGenerator
-from typing import Any, Dict
+import logging
+import os
+import re
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
 
 import pytest
 import pytest_asyncio
-from playwright.async_api import Browser, Page
+from playwright.async_api import Browser, Page, Playwright
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from pytest import FixtureRequest
 
 import framework.ui_components.overview_page as overview_page_module
 from framework.config.config import Config
 
 # Import CLI fixtures to make them available when tests import ui_fixtures
-from framework.fixtures.cli_fixtures import openshift_cli, test_project  # noqa: F401
+from framework.fixtures.async_steps import ScenarioTaskGroup
+from framework.fixtures.cli_fixtures import (  # noqa: F401
+    cluster_prerequisites,
+    openshift_cli,
+    schedule_cluster_prerequisites,
+    test_project,
+)
+from framework.helpers.browser_daemon import DaemonClient
+from framework.helpers.context_pool import ContextPool, PooledContext, close_context
+from framework.helpers.failure_capture import FailureCapture
+from framework.helpers.frontend_perf import (
+    FrontendPerfCollector,
+    PerfResults,
+    load_baseline,
+)
+from framework.helpers.har_replay import (
+    HAR_MODE_RECORD,
+    HAR_MODE_REPLAY,
+    HarMetadata,
+    HarRecorder,
+    HarReplayer,
+    har_path_for,
+)
+from framework.helpers.log_pipeline import worker_id
+from framework.helpers.memory_monitor import MemoryMonitor, MemoryReport
+from framework.helpers.network_conditions import EmulatedConditions
+from framework.helpers.step_reporter import StepReporter
 from framework.ui_components.commons.confirmation_modal import ConfirmationModal
 from framework.ui_components.commons.left_navigation_bar import LeftNavigationBar
 from framework.ui_components.commons.login_page import LoginPage
 from framework.ui_components.commons.project_selector import ProjectSelector
+from framework.ui_components.console_router import ConsoleRouter
+from framework.ui_components.console_state import ConsoleState
 from framework.ui_components.overview_page import OverViewPage
-from framework.ui_components.page_containers import PipelinesPages, TasksPages, TriggersPages
+from framework.ui_components.page_containers import (
+    PipelinesPages,
+    TasksPages,
+    TriggersPages,
+)
+
+logger = logging.getLogger(__name__)
 
 
 @pytest.fixture(scope="session")
@@ -38,6 +78,67 @@ def playwright_event_loop(request: FixtureRequest) -> asyncio.AbstractEventLoop:
     return request.getfixturevalue("_session_event_loop")
 
 
+def _reportportal_setting(pytest_config: pytest.Config, name: str) -> Optional[str]:
+    """
+    Reads a pytest-reportportal ini setting (e.g., rp_endpoint); None if unset or the plugin is absent.
+    :param pytest.Config pytest_config: Pytest config object
+    :param str name: Ini setting name
+    :return: Optional[str]: Setting value
+    """
+    try:
+        return pytest_config.getini(name) or None
+    except ValueError:
+        return None
+
+
+@pytest.fixture(scope="session")
+def emulated_conditions(request: FixtureRequest) -> EmulatedConditions:
+    """
+    Network and CPU conditions emulated in every page of the run, selected with ``--network-profile``
+    and ``--cpu-profile`` (see framework/helpers/network_conditions.py). Their tag is attached to
+    step timings, route performance results and load reports.
+    :param FixtureRequest request: Pytest fixture request object
+    :return: EmulatedConditions: The run's conditions (nothing is throttled by default)
+    """
+    return EmulatedConditions.from_names(
+        request.config.getoption("--network-profile", default="off"),
+        request.config.getoption("--cpu-profile", default="off"),
+    )
+
+
+@pytest.fixture(scope="session")
+def step_reporter(
+    request: FixtureRequest, emulated_conditions: EmulatedConditions
+) -> Generator[Optional[StepReporter], None, None]:
+    """
+    Session-wide non-blocking reporter for step results, timings and attachments.
+    Active only when ReportPortal reporting is on (``--reportportal``); yields None otherwise.
+    Entries are streamed to the launch of the pytest-reportportal agent (RP_LAUNCH_UUID overrides it),
+    or spooled to ``<artifacts-dir>/reportportal-spool`` if ReportPortal is unreachable or not configured.
+    :param FixtureRequest request: Pytest fixture request object
+    :param EmulatedConditions emulated_conditions: The run's conditions, tagged on step timings
+    :return: Generator[Optional[StepReporter], None, None]: The reporter, or None if reporting is off
+    """
+    pytest_config = request.config
+    if not pytest_config.getoption("--reportportal", default=False):
+        yield None
+        return
+
+    rp_service = getattr(pytest_config, "py_test_service", None)
+    launch_uuid = os.getenv("RP_LAUNCH_UUID") or getattr(getattr(rp_service, "rp", None), "launch_uuid", None)
+    artifacts_dir = Path(pytest_config.getoption("--artifacts-dir", default="test-artifacts"))
+    reporter = StepReporter(
+        endpoint=_reportportal_setting(pytest_config, "rp_endpoint"),
+        project=_reportportal_setting(pytest_config, "rp_project"),
+        api_key=_reportportal_setting(pytest_config, "rp_api_key"),
+        launch_uuid=launch_uuid,
+        spool_dir=artifacts_dir / "reportportal-spool",
+        conditions=emulated_conditions.tag,
+    ).start()
+    yield reporter
+    reporter.close()
+
+
 @pytest.fixture(scope="session")
 def browser_context_args(browser_context_args: Dict[str, Any], request: FixtureRequest) -> Dict[str, Any]:
     """
@@ -59,20 +160,243 @@ def browser_context_args(browser_context_args: Dict[str, Any], request: FixtureR
     }
 
 
-@pytest.fixture(scope="module")
-def bdd_openshift_console_session() -> Dict[str, Any]:
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser_daemon(request: FixtureRequest, config: Config, browser_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Connection details of the warm browser daemon (see framework/helpers/browser_daemon.py), if it is
+    running against the console under test and ``--browser-daemon=false`` is not given; None otherwise.
+    The daemon only shares a headless Chromium, so it is also skipped for other browsers and ``--headed``.
+    :param FixtureRequest request: Pytest fixture request object
+    :param Config config: Framework configuration
+    :param str browser_name: Browser requested with ``--browser``
+    :return: Optional[Dict[str, Any]]: CDP endpoint and saved session of the daemon, or None
+    """
+    if not request.config.getoption("--browser-daemon", default=True):
+        return None
+    info = await DaemonClient().info(config.base_url)
+    if info is None:
+        return None
+    if browser_name != "chromium":
+        logger.warning(f"Ignoring the browser daemon: it runs Chromium, but --browser {browser_name} was requested")
+        return None
+    if request.config.getoption("--headed", default=False) and info.get("headless", True):
+        logger.warning("Ignoring the browser daemon: it runs headless, but --headed was requested")
+        return None
+    logger.info(f"Using the warm browser daemon at {info['cdp_endpoint']}")
+    return info
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def browser(
+    launch_browser: Callable[[], Awaitable[Browser]],
+    playwright: Playwright,
+    browser_daemon: Optional[Dict[str, Any]],
+) -> AsyncGenerator[Browser, None]:
+    """
+    Session browser: the warm browser daemon's browser over CDP when it is running, otherwise a
+    browser launched by pytest-playwright-asyncio (whose fixture of the same name this overrides).
+    :param Callable[[], Awaitable[Browser]] launch_browser: Launcher of pytest-playwright-asyncio
+    :param Playwright playwright: Playwright instance
+    :param Optional[Dict[str, Any]] browser_daemon: Daemon connection details, or None
+    :return: AsyncGenerator[Browser, None]: The browser
+    """
+    if browser_daemon is not None:
+        session_browser = await playwright.chromium.connect_over_cdp(browser_daemon["cdp_endpoint"])
+    else:
+        session_browser = await launch_browser()
+    yield session_browser
+    # Over CDP this only disconnects; the daemon's browser stays up for the next run
+    await session_browser.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def context_pool(
+    browser: Browser,
+    browser_context_args: Dict[str, Any],
+    browser_daemon: Optional[Dict[str, Any]],
+    request: FixtureRequest,
+) -> AsyncGenerator[Optional[ContextPool], None]:
+    """
+    Session pool of browser contexts that modules lease instead of creating their own (see
+    framework/helpers/context_pool.py). Contexts are seeded with the warm browser daemon's session
+    when it is running. Yields None with ``--context-pool=false``.
+    :param Browser browser: Session browser
+    :param Dict[str, Any] browser_context_args: Browser context arguments
+    :param Optional[Dict[str, Any]] browser_daemon: Daemon connection details, or None
+    :param FixtureRequest request: Pytest fixture request object
+    :return: AsyncGenerator[Optional[ContextPool], None]: The pool, or None if pooling is off
+    """
+    if not request.config.getoption("--context-pool", default=True):
+        yield None
+        return
+    pool = ContextPool(
+        browser,
+        browser_context_args,
+        storage_state=browser_daemon["storage_state"] if browser_daemon is not None else None,
+    )
+    yield pool
+    await pool.close()
+
+
+@pytest.fixture(scope="session")
+def memory_report(request: FixtureRequest) -> Generator[Optional[MemoryReport], None, None]:
+    """
+    Session-wide time series of renderer memory samples (see framework/helpers/memory_monitor.py),
+    written with a per-route leak report to ``<artifacts-dir>/memory`` at the end of the run.
+    Yields None with ``--memory-monitor=false``.
+    :param FixtureRequest request: Pytest fixture request object
+    :return: Generator[Optional[MemoryReport], None, None]: The report, or None if monitoring is off
+    """
+    if not request.config.getoption("--memory-monitor", default=True):
+        yield None
+        return
+    artifacts_dir = Path(request.config.getoption("--artifacts-dir", default="test-artifacts"))
+    report = MemoryReport(artifacts_dir / "memory", worker_id())
+    yield report
+    report.write()
+
+
+@pytest.fixture(scope="session")
+def perf_results(
+    request: FixtureRequest, emulated_conditions: EmulatedConditions
+) -> Generator[Optional[PerfResults], None, None]:
+    """
+    Session-wide front-end metrics per console route (see framework/helpers/frontend_perf.py),
+    written to ``<artifacts-dir>/perf`` at the end of the run. With ``--perf-save-baseline`` they
+    are also saved as a baseline; with ``--perf-baseline`` routes whose median got worse than the
+    baseline's by more than ``--perf-tolerance`` are stored on ``config.perf_regressions``, which
+    fails the run (see ``pytest_sessionfinish`` in tests/conftest.py).
+    Results are tagged with the emulated conditions; a baseline taken under other conditions is not
+    compared. Yields None with ``--perf-collect=false``.
+    :param FixtureRequest request: Pytest fixture request object
+    :param EmulatedConditions emulated_conditions: The run's conditions
+    :return: Generator[Optional[PerfResults], None, None]: The results, or None if collection is off
+    """
+    if not request.config.getoption("--perf-collect", default=True):
+        yield None
+        return
+    artifacts_dir = Path(request.config.getoption("--artifacts-dir", default="test-artifacts"))
+    results = PerfResults(artifacts_dir / "perf", worker_id())
+    results.conditions = emulated_conditions.tag
+    yield results
+    results.write()
+    save_path = request.config.getoption("--perf-save-baseline", default="")
+    if save_path:
+        results.write(Path(save_path))
+    baseline_path = request.config.getoption("--perf-baseline", default="")
+    if baseline_path:
+        request.config.perf_regressions = results.compare(
+            load_baseline(Path(baseline_path)), request.config.getoption("--perf-tolerance", default=0.2)
+        )
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def scenario_tasks() -> AsyncGenerator[ScenarioTaskGroup, None]:
     """
-    Per-module (feature-registration module) state for BDD steps.
-    Used to run full OpenShift login only once per feature file when the Background step
-    ``the user is logged into openshift console with auth kube:admin`` is used.
+    Background tasks of the current scenario, for async steps (see framework/fixtures/async_steps.py)
+    that start work a later step awaits. Unfinished tasks are awaited (and cancelled after a timeout)
+    when the scenario ends; failures no step has awaited fail the scenario's teardown.
+    :return: AsyncGenerator[ScenarioTaskGroup, None]: Task group of the scenario
     """
-    return {"kube_admin_logged_in": False}
+    group = ScenarioTaskGroup()
+    yield group
+    problems = await group.close()
+    assert not problems, f"Background tasks of the scenario did not complete: {problems}"
+
+
+def _har_session(request: FixtureRequest) -> Optional[Union[HarRecorder, HarReplayer]]:
+    """
+    Returns the HAR recorder or replayer of a module's browser context, depending on ``--har-mode``.
+    Skips the module in replay mode if it has no recording or the recording is stale.
+    :param FixtureRequest request: Pytest fixture request object of the module
+    :return: Optional[Union[HarRecorder, HarReplayer]]: Recorder, replayer, or None with --har-mode=off
+    """
+    har_mode = request.config.getoption("--har-mode", default="off")
+    har_path = har_path_for(Path(request.config.getoption("--har-dir", default="tests/har")), request.module.__name__)
+    if har_mode == HAR_MODE_RECORD:
+        return HarRecorder(har_path)
+    if har_mode != HAR_MODE_REPLAY:
+        return None
+
+    metadata = HarMetadata.load(har_path)
+    if metadata is None:
+        pytest.skip(f"No HAR recording {har_path}; record it with --har-mode=record")
+    stale = metadata.stale_reason(
+        request.config.getoption("--har-console-version", default="") or None,
+        request.config.getoption("--har-max-age-days", default=30),
+    )
+    if stale:
+        pytest.skip(f"HAR recording {har_path} is stale: {stale}; re-record it with --har-mode=record")
+    return HarReplayer(har_path, metadata)
+
+
+async def _open_page(
+    browser: Browser,
+    browser_context_args: Dict[str, Any],
+    pool: Optional[ContextPool],
+    browser_daemon: Optional[Dict[str, Any]],
+    config: Config,
+) -> PooledContext:
+    """
+    Leases a module's browser context and page from the pool, or creates them without one. With the
+    warm browser daemon, the context starts from the daemon's saved console session and the page opens
+    the console right away; the page's ConsoleState counts as logged in unless the console redirects to
+    OAuth, so the login step has nothing left to do.
+    :param Browser browser: Session browser
+    :param Dict[str, Any] browser_context_args: Browser context arguments
+    :param Optional[ContextPool] pool: Context pool, or None for a context of its own
+    :param Optional[Dict[str, Any]] browser_daemon: Daemon connection details, or None
+    :param Config config: Config object containing application configuration
+    :return: PooledContext: The context and its page
+    """
+    if pool is not None:
+        lease = await pool.acquire()
+    else:
+        if browser_daemon is not None:
+            browser_context_args = {**browser_context_args, "storage_state": browser_daemon["storage_state"]}
+        context = await browser.new_context(**browser_context_args)
+        lease = PooledContext(context, await context.new_page())
+    if browser_daemon is None:
+        return lease
+
+    try:
+        await lease.page.goto(config.base_url)
+        await lease.page.wait_for_url(re.compile(r".*(oauth|dashboards).*"), timeout=30000)
+    except PlaywrightTimeoutError:
+        return lease
+    ConsoleState.for_page(lease.page).logged_in = "oauth" not in lease.page.url.lower()
+    return lease
+
+
+async def _attach_monitors(
+    page: Page, memory_report: Optional[MemoryReport], perf_results: Optional[PerfResults], request: FixtureRequest
+) -> None:
+    """
+    Attaches the memory monitor and the front-end performance collector of a module's page to the
+    module node, for the ``page_memory`` and ``route_performance`` fixtures.
+    :param Page page: The module's page
+    :param Optional[MemoryReport] memory_report: Memory report, or None if monitoring is off
+    :param Optional[PerfResults] perf_results: Route metrics, or None if collection is off
+    :param FixtureRequest request: Pytest fixture request object of the module
+    :return: None
+    """
+    if memory_report is not None:
+        request.node.memory_monitor = await MemoryMonitor.attach(page, memory_report, request.module.__name__)
+    if perf_results is not None:
+        request.node.perf_collector = await FrontendPerfCollector.attach(page, perf_results)
 
 
 @pytest_asyncio.fixture(scope="module", loop_scope="session")
 async def playwright_page(
     browser: Browser,
     browser_context_args: Dict[str, Any],
+    browser_daemon: Optional[Dict[str, Any]],
+    context_pool: Optional[ContextPool],
+    memory_report: Optional[MemoryReport],
+    perf_results: Optional[PerfResults],
+    emulated_conditions: EmulatedConditions,
+    config: Config,
+    request: FixtureRequest,
 ) -> AsyncGenerator[Page, None]:
     """
     One Playwright Page (and its BrowserContext) per test module that registers scenarios.
@@ -80,33 +404,150 @@ async def playwright_page(
     file by registering each ``.feature`` from its own step module (one ``scenarios(...)`` module
     per feature is the supported layout).
 
-    Uses ``browser.new_context`` directly because the plugin's ``new_context`` fixture is
-    function-scoped and cannot be requested from module-scoped fixtures.
+    The context is leased from the session ``context_pool`` and reset when the module is done, which
+    is cheaper than creating and closing one per module (the plugin's ``new_context`` fixture is
+    function-scoped and cannot be requested from module-scoped fixtures anyway). Without the pool,
+    or for HAR recording/replay, the module gets a context of its own that is closed afterwards.
 
-    Cleanup is immediate and efficient - no delays after tests complete.
+    Unless ``--failure-artifacts=false`` is given, a FailureCapture is attached to the module node;
+    the ``failure_artifacts`` fixture records each scenario as a trace chunk with it. The scenario
+    that creates the page is already running, so its chunk starts right away. Likewise a MemoryMonitor
+    is attached unless ``--memory-monitor=false`` is given; the ``page_memory`` fixture samples the
+    page with it after each scenario. A FrontendPerfCollector is attached unless
+    ``--perf-collect=false`` is given; the ``route_performance`` fixture collects with it.
+
+    The page runs under the network and CPU conditions of ``--network-profile`` and ``--cpu-profile``
+    (unthrottled by default, Chromium only).
+
+    With ``--har-mode=record`` the context's traffic is recorded to the module's HAR file; with
+    ``--har-mode=replay`` it is served from that file, and modules without an up-to-date recording
+    are skipped (see framework/helpers/har_replay.py).
+
+    With the warm browser daemon, the context starts from the daemon's saved console session and
+    the page opens the console right away, so the login step is skipped.
     """
-    context = await browser.new_context(**browser_context_args)
-    pw_page = await context.new_page()
+    har = _har_session(request)
+    # HAR routes and recordings belong to one module's context; recordings need the full login traffic
+    pool = context_pool if har is None else None
+    lease = await _open_page(browser, browser_context_args, pool, browser_daemon if har is None else None, config)
+    pw_page = lease.page
+    await emulated_conditions.apply(pw_page)
+    if har is not None:
+        await har.start(lease.context)
+    capture = None
+    if request.config.getoption("--failure-artifacts", default=True):
+        capture = FailureCapture(pw_page, Path(request.config.getoption("--artifacts-dir", default="test-artifacts")))
+        await capture.start()
+        request.node.failure_capture = capture
+    await _attach_monitors(pw_page, memory_report, perf_results, request)
     try:
         yield pw_page
     finally:
-        # Aggressive immediate cleanup to prevent browser hanging open
-        # Close page first (visible window), then context (underlying resources)
-        import asyncio
+        request.node.memory_monitor = None
+        request.node.perf_collector = None
+        if capture is not None:
+            request.node.failure_capture = None
+            try:
+                # Stop tracing first; an unfinished chunk is discarded
+                await asyncio.wait_for(capture.stop(), timeout=5.0)
+            except (asyncio.TimeoutError, PlaywrightError) as e:
+                logger.warning(f"Could not stop the failure capture of {request.module.__name__}: {e!r}")
+
+        if isinstance(har, HarRecorder):
+            await har.read_console_version(pw_page)
+
+        if pool is not None:
+            await pool.release(lease)
+        else:
+            # Longer timeout while recording: the HAR file is written when the context closes
+            await close_context(lease, timeout_seconds=60.0 if isinstance(har, HarRecorder) else 5.0)
+
+        if har is not None:
+            har.finish()
+
+
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
+async def page_memory(request: FixtureRequest) -> AsyncGenerator[None, None]:
+    """
+    Samples the renderer memory of the module's page after every scenario and recycles the page
+    (reload of the current URL) when it crossed a threshold. Scenarios that never open a browser
+    page are not affected.
+
+    :param FixtureRequest request: Pytest fixture request object
+    :return: AsyncGenerator[None, None]: Yields control to the scenario
+    """
+    yield
+    # The page (and its monitor) may have been created during this scenario
+    monitor = getattr(request.node.getparent(pytest.Module), "memory_monitor", None)
+    if monitor is not None:
+        await monitor.check(request.node.name)
+
+
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
+async def route_performance(request: FixtureRequest, page_memory: None) -> AsyncGenerator[None, None]:
+    """
+    Collects the console routes the scenario visited, with their front-end metrics, into the
+    session's ``perf_results``. Scenarios that never open a browser page are not affected.
+
+    :param FixtureRequest request: Pytest fixture request object
+    :param None page_memory: Memory sampling; requested so that a recycle happens after the collection
+    :return: AsyncGenerator[None, None]: Yields control to the scenario
+    """
+    yield
+    # The page (and its collector) may have been created during this scenario
+    collector = getattr(request.node.getparent(pytest.Module), "perf_collector", None)
+    if collector is not None:
+        await collector.collect()
+
+
+def _scenario_failed(item: pytest.Item) -> bool:
+    """
+    Checks whether the setup or call phase of a scenario failed (a skip is not a failure).
+    :param pytest.Item item: The scenario's test item
+    :return: bool: True if a phase report exists and failed
+    """
+    reports = (getattr(item, "rep_setup", None), getattr(item, "rep_call", None))
+    return any(report is not None and report.failed for report in reports)
+
+
+@pytest_asyncio.fixture(autouse=True, loop_scope="session")
+async def failure_artifacts(
+    request: FixtureRequest, step_reporter: Optional[StepReporter], page_memory: None
+) -> AsyncGenerator[None, None]:
+    """
+    Records every scenario as a trace chunk of its module's browser context and, if the scenario
+    fails, saves the trace with a screenshot, the DOM and recent console/network events.
+    Passing scenarios' chunks are discarded, so tracing costs close to nothing for them.
+    Scenarios that never open a browser page are not affected.
+
+    Relies on ``item.rep_setup``/``item.rep_call`` set by the ``pytest_runtest_makereport`` hook in
+    tests/conftest.py; skipped scenarios are not failures.
+    The failure screenshot is also attached to the ReportPortal launch when reporting is on.
+
+    :param FixtureRequest request: Pytest fixture request object
+    :param Optional[StepReporter] step_reporter: Step reporter, or None if reporting is off
+    :param None page_memory: Memory sampling; requested so that a recycle happens after the capture
+    :return: AsyncGenerator[None, None]: Yields control to the scenario
+    """
+    module_node = request.node.getparent(pytest.Module)
+    capture = getattr(module_node, "failure_capture", None)
+    if capture is not None and not capture.in_scenario:
+        await capture.start(request.node.name)
 
-        try:
-            # Close page with short timeout to prevent hanging
-            await asyncio.wait_for(pw_page.close(), timeout=5.0)
-        except (asyncio.TimeoutError, Exception):
-            # Force close if taking too long
-            pass
+    yield
 
-        try:
-            # Close context with timeout
-            await asyncio.wait_for(context.close(), timeout=5.0)
-        except (asyncio.TimeoutError, Exception):
-            # Force close if taking too long
-            pass
+    # The page (and its capture) may have been created during this scenario
+    capture = getattr(module_node, "failure_capture", None)
+    if capture is not None and capture.in_scenario:
+        failed = _scenario_failed(request.node)
+        archive = await capture.finish(failed, scenario=request.node.name)
+        if archive is not None and step_reporter is not None and capture.last_screenshot:
+            step_reporter.attach(
+                "screenshot.png",
+                capture.last_screenshot,
+                "image/png",
+                f"Failure screenshot of {request.node.name} (all artifacts: {archive})",
+            )
 
 
 @pytest_asyncio.fixture(scope="module", loop_scope="session")
@@ -124,8 +565,11 @@ async def page(playwright_page: Page, config: Config) -> Dict[str, Any]:
     :param Config config: Config object containing application configuration
     :return: Dict[str, Any]: Dictionary containing hierarchical page containers:
         - "raw_page": The raw Page object for direct access if needed.
+        - "state": ConsoleState of the page (route, namespace, login, Pipelines menu expansion, project),
+          kept up to date from navigation events so Background steps can skip work that already holds.
         - "login": LoginPage instance for login-related operations.
         - "nav": LeftNavigationBar instance for navigation operations.
+        - "router": ConsoleRouter instance for direct-URL navigation to sections and resource pages.
         - "modal": ConfirmationModal instance for modal interactions (delete confirmations, etc.).
         - "project_selector": ProjectSelector instance for switching between projects.
         - "overview": OverViewPage instance for overview page operations.
@@ -180,8 +624,10 @@ async def page(playwright_page: Page, config: Config) -> Dict[str, Any]:
 
     return {
         "raw_page": playwright_page,
+        "state": ConsoleState.for_page(playwright_page),
         "login": LoginPage(playwright_page, config),
         "nav": LeftNavigationBar(playwright_page, config),
+        "router": ConsoleRouter(playwright_page, config),
         "modal": ConfirmationModal(playwright_page, config),
         "project_selector": ProjectSelector(playwright_page, config),
         "overview": OverViewPage(playwright_page, config),
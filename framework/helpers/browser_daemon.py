@@ -0,0 +1,334 @@
+"""
+Warm browser daemon for local iteration.
+
+Every pytest run normally launches a browser, logs in through OAuth and creates a project before
+the first real step runs. The daemon keeps that work done between runs:
+
+- a Chromium browser, reachable over CDP (``connect_over_cdp``), that stays up between runs
+- an authenticated console session, saved as Playwright storage state and refreshed periodically
+- spare test projects, created ahead of time; each run claims one and deletes it as usual
+
+The fixtures ask the daemon over a local Unix socket and fall back to launching and logging in
+themselves when it is not running, so CI is unaffected.
+
+Usage:
+    python -m framework.helpers.browser_daemon start [--headed] [--spare-projects 2]
+    python -m framework.helpers.browser_daemon status
+    python -m framework.helpers.browser_daemon stop
+
+Python Playwright has no ``launch_server``; the daemon launches Chromium with a remote debugging
+port instead, so the browser is shared over CDP (Chromium only).
+
+Follows SOLID Principles:
+- Single Responsibility: Handles only keeping browser, session and projects warm
+- Dependency Inversion: Works with the login page objects and the OpenShiftCLI wrapper
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import Browser, async_playwright
+from playwright.async_api import Error as PlaywrightError
+
+from framework.cli.openshift_cli import OpenShiftCLI
+from framework.config.config import Config
+from framework.ui_components.commons.login_page import LoginPage
+from framework.ui_components.overview_page import OverViewPage
+
+logger = logging.getLogger(__name__)
+
+# Directory of the daemon's socket and saved session (RELEASE_UI_DAEMON_DIR overrides it)
+DEFAULT_DAEMON_DIR = Path.home() / ".cache" / "release-ui-tests"
+DEFAULT_CDP_PORT = 9333
+
+
+def daemon_dir() -> Path:
+    """
+    Returns the directory of the daemon's socket and saved session.
+
+    :return: Path: Daemon directory
+    """
+    return Path(os.getenv("RELEASE_UI_DAEMON_DIR", str(DEFAULT_DAEMON_DIR)))
+
+
+class DaemonClient:
+    """
+    Talks to a running daemon; every request returns None if the daemon is not running.
+
+    Examples:
+        client = DaemonClient()
+        info = await client.info(config.base_url)  # {"cdp_endpoint": ..., "storage_state": ...} or None
+        project = await client.claim_project(config.base_url)  # "release-ui-test-a7k2m" or None
+    """
+
+    def __init__(self, socket_path: Optional[Path] = None, timeout_seconds: float = 2.0) -> None:
+        """
+        Initialize the client.
+
+        :param Optional[Path] socket_path: Daemon socket (defaults to <daemon dir>/daemon.sock)
+        :param float timeout_seconds: Maximum time to wait for an answer
+        """
+        self.socket_path = socket_path or daemon_dir() / "daemon.sock"
+        self.timeout_seconds = timeout_seconds
+
+    async def request(self, command: str) -> Optional[Dict[str, Any]]:
+        """
+        Sends a command and returns the daemon's answer.
+
+        :param str command: "info", "claim_project" or "stop"
+        :return: Optional[Dict[str, Any]]: Answer, or None if the daemon is not running
+        """
+        if not self.socket_path.exists():
+            return None
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(str(self.socket_path)), self.timeout_seconds
+            )
+            try:
+                writer.write(json.dumps({"command": command}).encode() + b"\n")
+                await writer.drain()
+                answer = await asyncio.wait_for(reader.readline(), self.timeout_seconds)
+            finally:
+                writer.close()
+            return json.loads(answer)
+        except (OSError, asyncio.TimeoutError, ValueError) as e:
+            logger.debug("Browser daemon at %s is not available: %s", self.socket_path, e)
+            return None
+
+    async def info(self, base_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the daemon's connection details, if it serves the console of the test run.
+        A daemon started against another console is ignored with a warning.
+
+        :param str base_url: Console URL of the test run
+        :return: Optional[Dict[str, Any]]: Connection details, or None if the daemon is not running or not usable
+        """
+        info = await self.request("info")
+        if info is None:
+            return None
+        if str(info.get("base_url") or "").rstrip("/") != base_url.rstrip("/"):
+            logger.warning(f"Ignoring the browser daemon: it serves {info.get('base_url')}, not {base_url}")
+            return None
+        return info
+
+    async def claim_project(self, base_url: str) -> Optional[str]:
+        """
+        Claims a spare test project; the caller owns (and deletes) it from now on.
+
+        :param str base_url: Console URL of the test run; spares of a daemon serving another console are not claimed
+        :return: Optional[str]: Project name, or None if the daemon is not running, not usable or has no spare project
+        """
+        if await self.info(base_url) is None:
+            return None
+        answer = await self.request("claim_project")
+        return answer.get("project") if answer else None
+
+
+class BrowserDaemon:
+    """
+    Keeps a browser, an authenticated console session and spare test projects warm.
+
+    Examples:
+        asyncio.run(BrowserDaemon(Config(), OpenShiftCLI()).run())
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        openshift_cli: OpenShiftCLI,
+        directory: Optional[Path] = None,
+        cdp_port: int = DEFAULT_CDP_PORT,
+        spare_projects: int = 2,
+        headless: bool = True,
+        ignore_ssl_errors: bool = True,
+        session_refresh_seconds: float = 3600,
+        project_retry_seconds: float = 30,
+    ) -> None:
+        """
+        Initialize the daemon; run() starts it.
+
+        :param Config config: Console URL and credentials
+        :param OpenShiftCLI openshift_cli: CLI wrapper used to create spare projects (uses the current oc login)
+        :param Optional[Path] directory: Directory of the socket and saved session (defaults to daemon_dir())
+        :param int cdp_port: Remote debugging port of the browser
+        :param int spare_projects: Number of projects kept ready; 0 disables project warming
+        :param bool headless: Run the browser headless
+        :param bool ignore_ssl_errors: Ignore SSL certificate errors of the console
+        :param float session_refresh_seconds: Interval of console re-logins, before the session expires
+        :param float project_retry_seconds: Backoff before retrying a spare project that could not be created
+        """
+        self.config = config
+        self.openshift_cli = openshift_cli
+        self.directory = directory or daemon_dir()
+        self.socket_path = self.directory / "daemon.sock"
+        self.storage_state = self.directory / "storage_state.json"
+        self.cdp_port = cdp_port
+        self.spare_projects = spare_projects
+        self.headless = headless
+        self.ignore_ssl_errors = ignore_ssl_errors
+        self.session_refresh_seconds = session_refresh_seconds
+        self.project_retry_seconds = project_retry_seconds
+        self._spares: List[str] = []
+        self._spares_changed = asyncio.Event()
+        self._stopped = asyncio.Event()
+        self._browser: Optional[Browser] = None
+
+    async def run(self) -> None:
+        """
+        Launches the browser, logs in, warms projects and serves requests until stopped.
+
+        :return: None
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+        async with async_playwright() as playwright:
+            self._browser = await playwright.chromium.launch(
+                headless=self.headless, args=[f"--remote-debugging-port={self.cdp_port}"]
+            )
+            await self._login()
+            server = await asyncio.start_unix_server(self._handle, path=str(self.socket_path))
+            background = [asyncio.create_task(self._keep_projects_warm()), asyncio.create_task(self._keep_session())]
+            logger.info(f"Browser daemon ready on {self.socket_path} (CDP port {self.cdp_port})")
+            try:
+                async with server:
+                    await self._stopped.wait()
+            finally:
+                for task in background:
+                    task.cancel()
+                await asyncio.gather(*background, return_exceptions=True)
+                await asyncio.gather(*(self.openshift_cli.delete_project(name) for name in self._spares))
+                self.socket_path.unlink(missing_ok=True)
+                await self._browser.close()
+        logger.info("Browser daemon stopped")
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Answers a single JSON-line request.
+
+        :param asyncio.StreamReader reader: Request stream
+        :param asyncio.StreamWriter writer: Answer stream
+        :return: None
+        """
+        try:
+            command = json.loads(await reader.readline()).get("command")
+            if command == "info":
+                answer = {
+                    "cdp_endpoint": f"http://127.0.0.1:{self.cdp_port}",
+                    "storage_state": str(self.storage_state),
+                    "base_url": self.config.base_url,
+                    "headless": self.headless,
+                    "spare_projects": list(self._spares),
+                }
+            elif command == "claim_project":
+                answer = {"project": self._spares.pop(0) if self._spares else None}
+                self._spares_changed.set()
+            elif command == "stop":
+                answer = {"stopping": True}
+                self._stopped.set()
+            else:
+                answer = {"error": f"Unknown command '{command}'"}
+            writer.write(json.dumps(answer).encode() + b"\n")
+            await writer.drain()
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Invalid browser daemon request: {e}")
+        finally:
+            writer.close()
+
+    async def _login(self) -> None:
+        """
+        Logs into the console in a fresh context and saves the session as storage state.
+
+        :return: None
+        :raises RuntimeError: If the login fails
+        """
+        context = await self._browser.new_context(ignore_https_errors=self.ignore_ssl_errors)
+        try:
+            page = await context.new_page()
+            page.set_default_timeout(self.config.timeout_ms)
+            login_page = LoginPage(page, self.config)
+            logged_in = (
+                await login_page.goto()
+                and await login_page.verify_successful_navigation_to_login_page()
+                and await login_page.choose_login_auth_type("kube:admin")
+                and await login_page.login()
+                and await OverViewPage(page, self.config).verify_on_page()
+            )
+            if not logged_in:
+                raise RuntimeError(f"Browser daemon could not log into {self.config.base_url}")
+            await context.storage_state(path=str(self.storage_state))
+            logger.info(f"Console session saved to {self.storage_state}")
+        finally:
+            await context.close()
+
+    async def _keep_session(self) -> None:
+        """
+        Re-logs in periodically, so runs never start with an expired session.
+
+        :return: None
+        """
+        while True:
+            await asyncio.sleep(self.session_refresh_seconds)
+            try:
+                await self._login()
+            except (RuntimeError, asyncio.TimeoutError, PlaywrightError) as e:
+                logger.error(f"Console session refresh failed: {e}")
+
+    async def _keep_projects_warm(self) -> None:
+        """
+        Keeps the configured number of spare projects ready, replacing claimed ones.
+
+        :return: None
+        """
+        while True:
+            self._spares_changed.clear()
+            while len(self._spares) < self.spare_projects:
+                name = self.openshift_cli.generate_random_project_name()
+                if not await self.openshift_cli.create_project(name, display_name="UI Test: spare (browser daemon)"):
+                    logger.error(
+                        f"Browser daemon could not create spare project {name}; is oc logged in? "
+                        f"Retrying in {self.project_retry_seconds}s"
+                    )
+                    await asyncio.sleep(self.project_retry_seconds)
+                    continue
+                self._spares.append(name)
+                logger.info(f"Spare project {name} ready")
+            await self._spares_changed.wait()
+
+
+def main() -> None:
+    """
+    Command line entry point: start, stop or query the daemon.
+
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Warm browser daemon for local test runs")
+    parser.add_argument("command", choices=("start", "stop", "status"))
+    parser.add_argument("--headed", action="store_true", help="Show the browser window")
+    parser.add_argument("--cdp-port", type=int, default=DEFAULT_CDP_PORT, help="Remote debugging port of the browser")
+    parser.add_argument("--spare-projects", type=int, default=2, help="Number of test projects kept ready")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    if args.command == "start":
+        openshift_cli = OpenShiftCLI(api_url=os.getenv("OC_API_URL"), token=os.getenv("OC_TOKEN"))
+        daemon = BrowserDaemon(
+            Config(),
+            openshift_cli,
+            cdp_port=args.cdp_port,
+            spare_projects=args.spare_projects,
+            headless=not args.headed,
+        )
+        asyncio.run(daemon.run())
+        return
+    answer = asyncio.run(DaemonClient().request("info" if args.command == "status" else "stop"))
+    print(json.dumps(answer, indent=2) if answer else "Browser daemon is not running")
+
+
+if __name__ == "__main__":
+    main()
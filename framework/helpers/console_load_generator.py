@@ -0,0 +1,909 @@
+"""
+Multi-user Console Load Generator.
+
+Runs concurrent virtual users against the Pipelines console plugin and records the latency and
+outcome of every user action:
+
+- Browser users each get a BrowserContext of their own (seeded with an authenticated console
+  session) and walk weighted journeys through the existing page objects and ConsoleRouter:
+  list PipelineRuns, open a PipelineRun's logs, edit a Pipeline's YAML, list Tasks.
+- API users are lightweight background load: they send the Kubernetes API requests the console
+  pages make (through the console's ``/api/kubernetes`` proxy) with the same session cookies,
+  without a browser.
+
+The number of users follows a ramp profile (e.g., ramp up to 50 users in a minute, hold for
+three, ramp down); users removed on a ramp-down finish their current journey first.
+
+``LocalConsoleStandIn`` answers the API users' requests like the console proxy does, with
+synthetic PipelineRuns and a configurable response delay, so the generator (and ramping) can be
+exercised when no cluster is available.
+
+Follows SOLID Principles:
+- Single Responsibility: Handles only driving virtual users and recording action latencies
+- Open/Closed: New journeys are added as Journey entries without changes to the generator
+- Dependency Inversion: Browser journeys work through the page objects, API journeys with any URL
+  that answers like the console's Kubernetes proxy
+"""
+
+import asyncio
+import json
+import logging
+import random
+import re
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import TracebackType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlsplit
+
+import yaml
+from playwright.async_api import Browser, BrowserContext, Page
+
+from framework.config.config import Config
+from framework.helpers.network_conditions import EmulatedConditions
+from framework.ui_components.console_router import ConsoleRouter
+from framework.ui_components.page_containers import PipelinesPages, TasksPages
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Kubernetes API as proxied by the console
+KUBERNETES_PROXY = "/api/kubernetes"
+TEKTON_API = f"{KUBERNETES_PROXY}/apis/tekton.dev/v1"
+
+# Annotation the YAML editing journey changes, so every save is a real update
+LOAD_EDIT_ANNOTATION = "release-ui-tests/load-edit"
+
+# Ramp stage duration, e.g. "30s", "2m", "1m30s", "90"
+_DURATION = re.compile(r"^(?:(\d+(?:\.\d+)?)m)?(?:(\d+(?:\.\d+)?)s?)?$")
+
+
+def _parse_duration(text: str) -> float:
+    """
+    Parse a stage duration.
+
+    :param str text: Duration such as "30s", "2m", "1m30s" or "90" (seconds)
+    :return: float: Duration in seconds
+    :raises ValueError: If the duration cannot be parsed
+    """
+    match = _DURATION.match(text.strip())
+    if not text.strip() or match is None:
+        raise ValueError(f"Invalid ramp stage duration '{text}' (expected e.g. 30s, 2m, 1m30s)")
+    minutes, seconds = match.groups()
+    return float(minutes or 0) * 60 + float(seconds or 0)
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """
+    Returns a percentile of sorted values (nearest rank).
+
+    :param List[float] values: Values in ascending order
+    :param float fraction: Percentile as a fraction (e.g., 0.95)
+    :return: float: The percentile, 0.0 for no values
+    """
+    return values[min(len(values) - 1, int(fraction * len(values)))] if values else 0.0
+
+
+@dataclass(frozen=True)
+class RampStage:
+    """Ramp linearly to a number of users over a duration."""
+
+    duration_seconds: float
+    users: int
+
+
+@dataclass(frozen=True)
+class RampProfile:
+    """
+    Number of concurrent users over time, as consecutive linear stages.
+
+    Examples:
+        profile = RampProfile.parse("1m:50, 3m:50, 30s:0")  # ramp up, hold, ramp down
+        profile.users_at(30)  # -> 25
+    """
+
+    stages: Tuple[RampStage, ...]
+    start_users: int = 0
+
+    @classmethod
+    def parse(cls, text: str) -> "RampProfile":
+        """
+        Parse a profile of comma-separated "<duration>:<users>" stages.
+
+        :param str text: Profile such as "1m:50, 3m:50, 30s:0"
+        :return: RampProfile: The profile
+        :raises ValueError: If a stage cannot be parsed
+        """
+        stages = []
+        for part in text.split(","):
+            duration, separator, users = part.strip().partition(":")
+            if not separator or not users.strip().isdigit():
+                raise ValueError(f"Invalid ramp stage '{part.strip()}' (expected <duration>:<users>, e.g. 1m:50)")
+            stages.append(RampStage(_parse_duration(duration), int(users)))
+        return cls(tuple(stages))
+
+    def __str__(self) -> str:
+        return ", ".join(f"{stage.duration_seconds:g}s:{stage.users}" for stage in self.stages)
+
+    @property
+    def duration_seconds(self) -> float:
+        """Total duration of the profile."""
+        return sum(stage.duration_seconds for stage in self.stages)
+
+    @property
+    def peak_users(self) -> int:
+        """Highest number of users in the profile."""
+        return max([self.start_users, *(stage.users for stage in self.stages)])
+
+    def users_at(self, elapsed_seconds: float) -> int:
+        """
+        Number of users the profile asks for at a point in time.
+
+        :param float elapsed_seconds: Time since the start of the run
+        :return: int: Number of users (the last stage's users after the end of the profile)
+        """
+        users, stage_start = self.start_users, 0.0
+        for stage in self.stages:
+            if elapsed_seconds < stage_start + stage.duration_seconds:
+                progress = (elapsed_seconds - stage_start) / stage.duration_seconds
+                return round(users + (stage.users - users) * progress)
+            users, stage_start = stage.users, stage_start + stage.duration_seconds
+        return users
+
+
+@dataclass(frozen=True)
+class LoadTargets:
+    """Resources the journeys work on."""
+
+    namespace: str
+    pipelines: Tuple[str, ...] = ()
+    pipelineruns: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class ActionSample:
+    """Outcome of a single user action."""
+
+    user: str
+    journey: str
+    action: str
+    started_at: float
+    latency_seconds: float
+    error: str = ""
+
+    @property
+    def failed(self) -> bool:
+        """True if the action raised an error."""
+        return bool(self.error)
+
+
+@dataclass
+class ConsoleLoadReport:
+    """Outcome of a load run: every user action, in completion order."""
+
+    target_url: str
+    started_at: float
+    profile: str = ""
+    duration_seconds: float = 0.0
+    peak_users: int = 0
+    conditions: str = ""
+    samples: List[ActionSample] = field(default_factory=list)
+
+    @property
+    def failed(self) -> List[ActionSample]:
+        """Actions that raised an error."""
+        return [sample for sample in self.samples if sample.failed]
+
+    @property
+    def error_rate(self) -> float:
+        """Share of failed actions (0.0 - 1.0)."""
+        return len(self.failed) / len(self.samples) if self.samples else 0.0
+
+    def actions(self) -> Dict[str, Dict[str, float]]:
+        """
+        Latency percentiles and error counts per action; percentiles cover successful actions only.
+
+        :return: Dict[str, Dict[str, float]]: Per action: count, errors, p50/p90/p95/p99 in milliseconds
+        """
+        grouped: Dict[str, List[ActionSample]] = {}
+        for sample in self.samples:
+            grouped.setdefault(sample.action, []).append(sample)
+        stats = {}
+        for action, samples in sorted(grouped.items()):
+            latencies = sorted(sample.latency_seconds * 1000 for sample in samples if not sample.failed)
+            stats[action] = {
+                "count": len(samples),
+                "errors": sum(sample.failed for sample in samples),
+                **{f"p{int(q * 100)}_ms": round(_percentile(latencies, q)) for q in (0.5, 0.9, 0.95, 0.99)},
+            }
+        return stats
+
+    def summary(self) -> str:
+        """Multi-line summary for logs and assertion messages."""
+        lines = [
+            f"{len(self.samples)} actions by up to {self.peak_users} users against {self.target_url} "
+            f"in {self.duration_seconds:.0f}s, {self.error_rate:.1%} failed"
+            + (f" (browser users under {self.conditions})" if self.conditions else "")
+        ]
+        for action, stats in self.actions().items():
+            lines.append(
+                f"  {action}: {stats['count']} ({stats['errors']} failed), "
+                f"p50 {stats['p50_ms']}ms, p95 {stats['p95_ms']}ms, p99 {stats['p99_ms']}ms"
+            )
+        return "\n".join(lines)
+
+    def write(self, path: Path) -> Path:
+        """
+        Writes the per-action statistics and every sample as JSON.
+
+        :param Path path: Target file
+        :return: Path: The written file
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "target_url": self.target_url,
+            "profile": self.profile,
+            "started_at": self.started_at,
+            "duration_seconds": round(self.duration_seconds, 1),
+            "peak_users": self.peak_users,
+            "conditions": self.conditions,
+            "error_rate": round(self.error_rate, 4),
+            "actions": self.actions(),
+            "samples": [asdict(sample) for sample in self.samples],
+        }
+        path.write_text(json.dumps(data, indent=2))
+        return path
+
+
+class VirtualUser:
+    """A simulated console user; records every action it takes in the report."""
+
+    kind = "user"
+
+    def __init__(self, index: int, targets: LoadTargets, report: ConsoleLoadReport, rng: random.Random) -> None:
+        """
+        Initialize the user.
+
+        :param int index: Index of the user in the run
+        :param LoadTargets targets: Resources the journeys work on
+        :param ConsoleLoadReport report: Report the actions are recorded in
+        :param random.Random rng: Random source for journey and resource choices
+        """
+        self.index = index
+        self.name = f"{self.kind}-{index}"
+        self.targets = targets
+        self.report = report
+        self.rng = rng
+        self.journey = ""
+
+    async def timed(self, action: str, awaitable: Awaitable[T]) -> T:
+        """
+        Awaits an action and records its latency; a failed action is recorded with its error and re-raised.
+        Actions that report failure by returning False (e.g., a page wait that timed out) are recorded
+        as failed too, and their result is returned.
+
+        :param str action: Action name (e.g., "open PipelineRun logs")
+        :param Awaitable[T] awaitable: The action
+        :return: T: Result of the action
+        """
+        started_at = time.time()
+        started = time.perf_counter()
+        try:
+            result = await awaitable
+        except Exception as e:
+            self._record(action, started_at, time.perf_counter() - started, f"{type(e).__name__}: {e}")
+            raise
+        self._record(
+            action, started_at, time.perf_counter() - started, "action returned False" if result is False else ""
+        )
+        return result
+
+    def _record(self, action: str, started_at: float, latency_seconds: float, error: str = "") -> None:
+        """
+        Adds an action sample to the report.
+
+        :param str action: Action name
+        :param float started_at: Start of the action (epoch seconds)
+        :param float latency_seconds: Duration of the action
+        :param str error: Error of a failed action
+        :return: None
+        """
+        self.report.samples.append(ActionSample(self.name, self.journey, action, started_at, latency_seconds, error))
+
+    async def close(self) -> None:
+        """
+        Releases the user's resources.
+
+        :return: None
+        """
+
+
+class BrowserUser(VirtualUser):
+    """A user with a browser context of its own, driving the console through the page objects."""
+
+    kind = "browser"
+
+    def __init__(
+        self,
+        index: int,
+        targets: LoadTargets,
+        report: ConsoleLoadReport,
+        rng: random.Random,
+        context: BrowserContext,
+        page: Page,
+        config: Config,
+    ) -> None:
+        """
+        Initialize the user; use start() to create one.
+
+        :param BrowserContext context: The user's browser context
+        :param Page page: The user's page
+        :param Config config: Config object containing application configuration
+        """
+        super().__init__(index, targets, report, rng)
+        self.context = context
+        self.page = page
+        self.router = ConsoleRouter(page, config)
+        self.pipelines = PipelinesPages(page, config)
+        self.tasks = TasksPages(page, config)
+
+    @classmethod
+    async def start(
+        cls,
+        index: int,
+        targets: LoadTargets,
+        report: ConsoleLoadReport,
+        rng: random.Random,
+        browser: Browser,
+        context_args: Dict[str, Any],
+        config: Config,
+        conditions: Optional[EmulatedConditions] = None,
+    ) -> "BrowserUser":
+        """
+        Opens the user's browser context (recorded as the "start browser session" action).
+
+        :param Browser browser: Browser to open the context in
+        :param Dict[str, Any] context_args: Arguments of browser.new_context, including the session's storage_state
+        :param Config config: Config object containing application configuration
+        :param Optional[EmulatedConditions] conditions: Network and CPU conditions of the user's page
+        :return: BrowserUser: The user
+        """
+        started_at = time.time()
+        started = time.perf_counter()
+        context = await browser.new_context(**context_args)
+        page = await context.new_page()
+        page.set_default_timeout(config.timeout_ms)
+        if conditions is not None:
+            await conditions.apply(page)
+        user = cls(index, targets, report, rng, context, page, config)
+        user._record("start browser session", started_at, time.perf_counter() - started)
+        return user
+
+    async def close(self) -> None:
+        """
+        Closes the user's browser context.
+
+        :return: None
+        """
+        try:
+            await asyncio.wait_for(self.context.close(), timeout=5.0)
+        except Exception:
+            # A hanging or already closed context must not block the run
+            pass
+
+
+class ApiUser(VirtualUser):
+    """A user without a browser, sending the console pages' API requests with the session cookies."""
+
+    kind = "api"
+
+    def __init__(
+        self,
+        index: int,
+        targets: LoadTargets,
+        report: ConsoleLoadReport,
+        rng: random.Random,
+        base_url: str,
+        cookie_header: str,
+        verify_ssl: bool = False,
+        request_timeout_seconds: float = 30,
+    ) -> None:
+        """
+        Initialize the user.
+
+        :param str base_url: Console URL
+        :param str cookie_header: Cookie header of the authenticated console session
+        :param bool verify_ssl: Verify TLS certificates of https consoles
+        :param float request_timeout_seconds: Timeout of a single request
+        """
+        super().__init__(index, targets, report, rng)
+        self.base_url = base_url.rstrip("/")
+        self.headers = {"Accept": "application/json", **({"Cookie": cookie_header} if cookie_header else {})}
+        self.request_timeout_seconds = request_timeout_seconds
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        if not verify_ssl:
+            # Test clusters serve self-signed certificates
+            self._ssl_context = ssl.create_default_context()
+            self._ssl_context.check_hostname = False
+            self._ssl_context.verify_mode = ssl.CERT_NONE
+
+    async def get(self, path: str, as_json: bool = True) -> Union[Dict[str, Any], str]:
+        """
+        Sends a GET request through the console (in a worker thread).
+
+        :param str path: Path below the console URL (e.g., "/api/kubernetes/apis/tekton.dev/v1/...")
+        :param bool as_json: Parse the response as JSON
+        :return: Union[Dict[str, Any], str]: Parsed JSON or response text
+        :raises RuntimeError: If the console answers with an error status
+        """
+        return await asyncio.to_thread(self._get, path, as_json)
+
+    def _get(self, path: str, as_json: bool) -> Union[Dict[str, Any], str]:
+        """
+        Sends a GET request (blocking; runs in a worker thread).
+
+        :param str path: Path below the console URL
+        :param bool as_json: Parse the response as JSON
+        :return: Union[Dict[str, Any], str]: Parsed JSON or response text
+        :raises RuntimeError: If the console answers with an error status or cannot be reached
+        """
+        request = urllib.request.Request(self.base_url + path, headers=self.headers)
+        try:
+            with urllib.request.urlopen(
+                request, timeout=self.request_timeout_seconds, context=self._ssl_context
+            ) as response:
+                body = response.read()
+        except urllib.error.HTTPError as e:
+            raise RuntimeError(f"GET {path} answered {e.code}") from None
+        except (urllib.error.URLError, OSError) as e:
+            raise RuntimeError(f"GET {path} failed: {e}") from None
+        return json.loads(body) if as_json else body.decode(errors="replace")
+
+
+Journey = Callable[[Any], Awaitable[None]]
+
+
+# Browser journeys
+
+
+async def browse_pipelineruns(user: BrowserUser) -> None:
+    """List the PipelineRuns of the namespace."""
+    await user.timed(
+        "open PipelineRuns list",
+        user.router.open_section("pipelines", namespace=user.targets.namespace, tab="pipeline-runs"),
+    )
+    await user.timed("PipelineRuns list loaded", user.pipelines.runs.verify_pipeline_runs_tab_data_load())
+
+
+async def read_pipelinerun_logs(user: BrowserUser) -> None:
+    """Open the logs of a PipelineRun."""
+    name = user.rng.choice(user.targets.pipelineruns)
+    await user.timed(
+        "open PipelineRun logs",
+        user.router.open_resource("PipelineRun", name, namespace=user.targets.namespace, tab="logs"),
+    )
+    await user.timed("PipelineRun logs loaded", user.pipelines.pipelinerun.logs.wait_for_logs_to_load())
+
+
+async def edit_pipeline_yaml(user: BrowserUser) -> None:
+    """Change an annotation of a Pipeline in its YAML editor and save it."""
+    name = user.targets.pipelines[user.index % len(user.targets.pipelines)]
+    yaml_page = user.pipelines.pipeline.yaml
+    await user.timed(
+        "open Pipeline YAML", user.router.open_resource("Pipeline", name, namespace=user.targets.namespace, tab="yaml")
+    )
+    if not await user.timed("Pipeline YAML editor ready", yaml_page.monaco_editor.wait_for_editor_ready()):
+        return
+
+    async def _edit() -> bool:
+        resource = yaml.safe_load(await yaml_page.monaco_editor.get_content())
+        resource["metadata"].setdefault("annotations", {})[LOAD_EDIT_ANNOTATION] = f"{user.name}-{time.time():.0f}"
+        return await yaml_page.monaco_editor.set_content(yaml.safe_dump(resource, sort_keys=False))
+
+    if not await user.timed("edit Pipeline YAML", _edit()):
+        return
+    await user.timed("save Pipeline YAML", yaml_page.save_changes())
+
+
+async def browse_tasks(user: BrowserUser) -> None:
+    """List the Tasks of the namespace."""
+    await user.timed("open Tasks list", user.router.open_section("tasks", namespace=user.targets.namespace))
+    await user.timed("Tasks list loaded", user.tasks.list.verify_tasks_tab_data_load())
+
+
+# API journeys (the requests the corresponding console pages make)
+
+
+async def api_list_pipelineruns(user: ApiUser) -> None:
+    """Request the PipelineRuns list, as the PipelineRuns page does."""
+    await user.timed(
+        "API list PipelineRuns", user.get(f"{TEKTON_API}/namespaces/{user.targets.namespace}/pipelineruns?limit=250")
+    )
+
+
+async def api_read_pipelinerun_logs(user: ApiUser) -> None:
+    """Request a PipelineRun, its TaskRuns and the log of the first step, as the logs page does."""
+    namespace, name = user.targets.namespace, user.rng.choice(user.targets.pipelineruns)
+    await user.timed("API get PipelineRun", user.get(f"{TEKTON_API}/namespaces/{namespace}/pipelineruns/{name}"))
+    taskruns = await user.timed(
+        "API list TaskRuns of PipelineRun",
+        user.get(f"{TEKTON_API}/namespaces/{namespace}/taskruns?labelSelector=tekton.dev%2FpipelineRun%3D{name}"),
+    )
+    for taskrun in taskruns.get("items", [])[:1]:
+        status = taskrun.get("status", {})
+        steps = status.get("steps") or [{}]
+        if status.get("podName") and steps[0].get("container"):
+            await user.timed(
+                "API get step log",
+                user.get(
+                    f"{KUBERNETES_PROXY}/api/v1/namespaces/{namespace}/pods/{status['podName']}/log"
+                    f"?container={steps[0]['container']}",
+                    as_json=False,
+                ),
+            )
+
+
+async def api_get_pipeline(user: ApiUser) -> None:
+    """Request a Pipeline, as its details page does."""
+    name = user.rng.choice(user.targets.pipelines)
+    await user.timed("API get Pipeline", user.get(f"{TEKTON_API}/namespaces/{user.targets.namespace}/pipelines/{name}"))
+
+
+# Weighted journey mixes: (journey, weight)
+BROWSER_JOURNEYS: Sequence[Tuple[Journey, float]] = (
+    (browse_pipelineruns, 4),
+    (read_pipelinerun_logs, 3),
+    (edit_pipeline_yaml, 1),
+    (browse_tasks, 1),
+)
+API_JOURNEYS: Sequence[Tuple[Journey, float]] = (
+    (api_list_pipelineruns, 5),
+    (api_read_pipelinerun_logs, 3),
+    (api_get_pipeline, 2),
+)
+
+
+class ConsoleLoadGenerator:
+    """
+    Runs virtual users against the console along a ramp profile.
+
+    Examples:
+        generator = ConsoleLoadGenerator(
+            config.base_url, targets, storage_state, browser=browser, config=config, browser_share=0.2
+        )
+        report = await generator.run(RampProfile.parse("1m:50, 3m:50, 30s:0"))
+        # report.actions() -> latency percentiles and errors per action
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        targets: LoadTargets,
+        storage_state: Optional[Dict[str, Any]] = None,
+        browser: Optional[Browser] = None,
+        config: Optional[Config] = None,
+        context_args: Optional[Dict[str, Any]] = None,
+        browser_share: float = 0.2,
+        browser_journeys: Sequence[Tuple[Journey, float]] = BROWSER_JOURNEYS,
+        api_journeys: Sequence[Tuple[Journey, float]] = API_JOURNEYS,
+        think_time_seconds: Tuple[float, float] = (1.0, 3.0),
+        verify_ssl: bool = False,
+        seed: Optional[int] = None,
+        tick_seconds: float = 0.5,
+        conditions: Optional[EmulatedConditions] = None,
+    ) -> None:
+        """
+        Initialize the generator.
+
+        :param str base_url: Console URL (or the URL of a LocalConsoleStandIn)
+        :param LoadTargets targets: Resources the journeys work on
+        :param Optional[Dict[str, Any]] storage_state: Authenticated console session (BrowserContext.storage_state());
+            seeds the browser users' contexts and provides the API users' cookies
+        :param Optional[Browser] browser: Browser for browser users; None runs API users only
+        :param Optional[Config] config: Config object for the page objects (required with a browser)
+        :param Optional[Dict[str, Any]] context_args: Further arguments of browser.new_context (viewport, SSL errors)
+        :param float browser_share: Share of the users that are browser users (0.0 - 1.0)
+        :param Sequence[Tuple[Journey, float]] browser_journeys: Weighted journeys of browser users
+        :param Sequence[Tuple[Journey, float]] api_journeys: Weighted journeys of API users
+        :param Tuple[float, float] think_time_seconds: Range of the pause between a user's journeys
+        :param bool verify_ssl: Verify TLS certificates of https consoles (API users)
+        :param Optional[int] seed: Seed of the journey choices, for reproducible mixes
+        :param float tick_seconds: Interval at which the number of users is adjusted to the profile
+        :param Optional[EmulatedConditions] conditions: Network and CPU conditions of the browser users' pages
+            (API users are not throttled)
+        """
+        if browser is not None and config is None:
+            raise ValueError("Browser users need a Config for the page objects")
+        self.base_url = base_url
+        self.targets = targets
+        self.storage_state = storage_state or {}
+        self.browser = browser
+        self.config = config
+        self.context_args = {**(context_args or {}), "storage_state": self.storage_state}
+        self.browser_share = browser_share if browser is not None else 0.0
+        self.browser_journeys = browser_journeys
+        self.api_journeys = api_journeys
+        self.think_time_seconds = think_time_seconds
+        self.verify_ssl = verify_ssl
+        self.tick_seconds = tick_seconds
+        self.conditions = conditions
+        self._rng = random.Random(seed)
+        self._cookie_header = self._session_cookies()
+
+    def _session_cookies(self) -> str:
+        """
+        Builds the Cookie header of the API users from the session cookies of the console's host.
+
+        :return: str: Cookie header ("" without a session)
+        """
+        host = urlsplit(self.base_url).hostname or ""
+        cookies = [
+            f"{cookie['name']}={cookie['value']}"
+            for cookie in self.storage_state.get("cookies", [])
+            if host == cookie.get("domain", "").lstrip(".") or host.endswith("." + cookie.get("domain", "").lstrip("."))
+        ]
+        return "; ".join(cookies)
+
+    async def run(self, profile: RampProfile, drain_timeout_seconds: float = 60) -> ConsoleLoadReport:
+        """
+        Runs users along the profile, then waits for the remaining users to finish their journeys.
+
+        :param RampProfile profile: Number of users over time
+        :param float drain_timeout_seconds: Maximum time users get to finish after the profile ended
+        :return: ConsoleLoadReport: Every user action of the run
+        """
+        report = ConsoleLoadReport(
+            target_url=self.base_url,
+            started_at=time.time(),
+            peak_users=profile.peak_users,
+            profile=str(profile),
+            conditions=self.conditions.tag if self.conditions is not None and self.browser_share > 0 else "",
+        )
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        slots: List[_UserSlot] = []
+        logger.info(f"Console load: up to {profile.peak_users} users for {profile.duration_seconds:.0f}s")
+
+        while (elapsed := loop.time() - start) < profile.duration_seconds:
+            running = [slot for slot in slots if not slot.stopping and not slot.task.done()]
+            wanted = profile.users_at(elapsed)
+            while len(running) < wanted:
+                browser_users = sum(slot.as_browser for slot in running)
+                slot = _UserSlot(len(slots), browser_users < round((len(running) + 1) * self.browser_share))
+                slot.task = asyncio.create_task(self._run_user(slot, report))
+                slots.append(slot)
+                running.append(slot)
+            # Ramp-down: the most recent users finish their current journey and leave
+            for slot in running[wanted:]:
+                slot.stopping = True
+            await asyncio.sleep(self.tick_seconds)
+
+        for slot in slots:
+            slot.stopping = True
+        tasks = [slot.task for slot in slots]
+        if tasks:
+            _, pending = await asyncio.wait(tasks, timeout=drain_timeout_seconds)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        report.duration_seconds = loop.time() - start
+        logger.info(report.summary())
+        return report
+
+    async def _start_user(self, slot: "_UserSlot", report: ConsoleLoadReport) -> Optional[VirtualUser]:
+        """
+        Creates the user of a slot; a browser context that cannot be opened is recorded as a failed action.
+
+        :param _UserSlot slot: The user's slot
+        :param ConsoleLoadReport report: Report the actions are recorded in
+        :return: Optional[VirtualUser]: The user, or None if its browser context could not be opened
+        """
+        rng = random.Random(self._rng.random())
+        if not slot.as_browser:
+            return ApiUser(
+                slot.index, self.targets, report, rng, self.base_url, self._cookie_header, verify_ssl=self.verify_ssl
+            )
+        started_at = time.time()
+        try:
+            return await BrowserUser.start(
+                slot.index, self.targets, report, rng, self.browser, self.context_args, self.config, self.conditions
+            )
+        except Exception as e:
+            report.samples.append(
+                ActionSample(
+                    f"{BrowserUser.kind}-{slot.index}",
+                    "",
+                    "start browser session",
+                    started_at,
+                    time.time() - started_at,
+                    f"{type(e).__name__}: {e}",
+                )
+            )
+            return None
+
+    async def _run_user(self, slot: "_UserSlot", report: ConsoleLoadReport) -> None:
+        """
+        Runs weighted journeys with think time until the slot is stopped. A failed journey is
+        recorded (by its failed action) and the user goes on with the next one, like a real user would.
+
+        :param _UserSlot slot: The user's slot
+        :param ConsoleLoadReport report: Report the actions are recorded in
+        :return: None
+        """
+        user = await self._start_user(slot, report)
+        if user is None:
+            return
+        journeys, weights = zip(*(self.browser_journeys if slot.as_browser else self.api_journeys))
+        try:
+            while not slot.stopping:
+                journey = user.rng.choices(journeys, weights=weights)[0]
+                user.journey = journey.__name__
+                try:
+                    await journey(user)
+                except Exception as e:
+                    # Any failure of the console under load is a result, not a reason to stop the run
+                    logger.debug(f"{user.name}: journey {user.journey} failed: {e}")
+                await asyncio.sleep(user.rng.uniform(*self.think_time_seconds))
+        finally:
+            await user.close()
+
+
+@dataclass
+class _UserSlot:
+    """A running user as seen by the generator."""
+
+    index: int
+    as_browser: bool
+    stopping: bool = False
+    task: Optional["asyncio.Task[None]"] = None
+
+
+class LocalConsoleStandIn:
+    """
+    Local stand-in for the console's Kubernetes API proxy: answers the API users' requests with
+    synthetic Pipelines, PipelineRuns, TaskRuns and step logs after a configurable delay, and counts
+    the requests it receives.
+
+    Examples:
+        with LocalConsoleStandIn(pipelineruns=20, response_delay_seconds=0.05) as console:
+            generator = ConsoleLoadGenerator(console.url, console.targets)
+            report = await generator.run(RampProfile.parse("5s:10, 5s:10, 2s:0"))
+    """
+
+    def __init__(self, namespace: str = "local", pipelineruns: int = 20, response_delay_seconds: float = 0.0) -> None:
+        """
+        Initialize the stand-in; call start() (or use it as a context manager) to listen.
+
+        :param str namespace: Namespace of the synthetic resources
+        :param int pipelineruns: Number of synthetic PipelineRuns (of one Pipeline, "load-pipeline")
+        :param float response_delay_seconds: Delay of every response, to emulate a loaded backend
+        """
+        self.namespace = namespace
+        self.response_delay_seconds = response_delay_seconds
+        self.pipeline = "load-pipeline"
+        self.pipelineruns = tuple(f"load-pipeline-run-{index}" for index in range(pipelineruns))
+        self.requests = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        """URL the stand-in listens on."""
+        if self._server is None:
+            raise RuntimeError("LocalConsoleStandIn is not started")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def targets(self) -> LoadTargets:
+        """Load targets matching the synthetic resources."""
+        return LoadTargets(self.namespace, (self.pipeline,), self.pipelineruns)
+
+    def _resource(self, kind: str, name: str, status: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Builds a synthetic Tekton resource.
+
+        :param str kind: Resource kind
+        :param str name: Resource name
+        :param Optional[Dict[str, Any]] status: Status fields
+        :return: Dict[str, Any]: The resource
+        """
+        return {
+            "apiVersion": "tekton.dev/v1",
+            "kind": kind,
+            "metadata": {"name": name, "namespace": self.namespace},
+            "status": status or {},
+        }
+
+    def answer(self, path: str) -> Tuple[int, Union[Dict[str, Any], str]]:
+        """
+        Answers a request path like the console proxy would.
+
+        :param str path: Request path with query
+        :return: Tuple[int, Union[Dict[str, Any], str]]: Status and JSON body (or log text)
+        """
+        route = urlsplit(path).path
+        prefix = f"{TEKTON_API}/namespaces/{self.namespace}"
+        if route == f"{prefix}/pipelineruns":
+            return 200, {"items": [self._resource("PipelineRun", name) for name in self.pipelineruns]}
+        if route.startswith(f"{prefix}/pipelineruns/") and route.rsplit("/", 1)[1] in self.pipelineruns:
+            return 200, self._resource("PipelineRun", route.rsplit("/", 1)[1])
+        if route == f"{prefix}/taskruns":
+            run = urlsplit(path).query.rpartition("%3D")[2]
+            step = {"name": "say-hello", "container": "step-say-hello"}
+            return 200, {
+                "items": [self._resource("TaskRun", f"{run}-greet", {"podName": f"{run}-greet-pod", "steps": [step]})]
+            }
+        if route == f"{prefix}/pipelines/{self.pipeline}":
+            return 200, self._resource("Pipeline", self.pipeline)
+        if route.startswith(f"{KUBERNETES_PROXY}/api/v1/namespaces/{self.namespace}/pods/") and route.endswith("/log"):
+            return 200, "Hello from pipeline!\n"
+        return 404, {"kind": "Status", "status": "Failure", "reason": "NotFound", "code": 404}
+
+    def start(self) -> "LocalConsoleStandIn":
+        """
+        Start listening on a free local port in a background thread.
+
+        :return: LocalConsoleStandIn: self
+        """
+        stand_in = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                with stand_in._lock:
+                    stand_in.requests += 1
+                if stand_in.response_delay_seconds:
+                    time.sleep(stand_in.response_delay_seconds)
+                status, body = stand_in.answer(self.path)
+                is_text = isinstance(body, str)
+                response = (body if is_text else json.dumps(body)).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "text/plain" if is_text else "application/json")
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, format: str, *args: object) -> None:
+                logger.debug(f"LocalConsoleStandIn: {format % args}")
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        logger.info(f"Local console stand-in listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop listening and release the port."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "LocalConsoleStandIn":
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
@@ -0,0 +1,201 @@
+"""
+Browser context pool.
+
+Creating and closing a browser context for every feature module costs more than resetting one.
+The pool hands warmed contexts to modules and takes them back afterwards: it replaces the page
+(which drops session storage, history and page listeners), clears cookies, permissions, routes
+and the storage of every origin the module visited, and re-seeds the authentication cookies the
+pool was created with. Contexts are recycled after a number of uses, when their JS heap grows
+past a threshold, or when a reset fails.
+
+Storage is cleared through the Chrome DevTools Protocol; on other browsers the reset fails and
+every context is recycled, which keeps isolation at the cost of the pooling benefit.
+
+Follows SOLID Principles:
+- Single Responsibility: Handles only leasing, resetting and recycling browser contexts
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+from urllib.parse import urlsplit
+
+from playwright.async_api import Browser, BrowserContext, Error, Page
+
+logger = logging.getLogger(__name__)
+
+# JS heap of the page (Chromium only; None elsewhere)
+_HEAP_SCRIPT = "() => performance.memory ? performance.memory.usedJSHeapSize : null"
+
+
+@dataclass
+class PooledContext:
+    """A browser context leased to a module, with its page."""
+
+    context: BrowserContext
+    page: Page
+    uses: int = 0
+
+
+async def close_context(lease: PooledContext, timeout_seconds: float = 5.0) -> None:
+    """
+    Closes the page, then the context, each with a timeout so a hanging browser never blocks teardown.
+
+    :param PooledContext lease: Context and page to close
+    :param float timeout_seconds: Maximum time per close call
+    :return: None
+    """
+    for close in (lease.page.close, lease.context.close):
+        try:
+            await asyncio.wait_for(close(), timeout=timeout_seconds)
+        except (asyncio.TimeoutError, Error):
+            # Force close if taking too long
+            pass
+
+
+class ContextPool:
+    """
+    Leases reset browser contexts to modules.
+
+    Examples:
+        pool = ContextPool(browser, {"viewport": {"width": 1920, "height": 1080}})
+        lease = await pool.acquire()
+        await lease.page.goto(url)
+        await pool.release(lease)  # reset and kept, or closed if it is worn out
+        await pool.close()
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        context_args: Dict[str, Any],
+        storage_state: Optional[str] = None,
+        max_uses: int = 10,
+        max_heap_mb: float = 512,
+        reset_timeout_seconds: float = 10,
+    ) -> None:
+        """
+        Initialize an empty pool; contexts are created on demand.
+
+        :param Browser browser: Browser the contexts belong to
+        :param Dict[str, Any] context_args: Arguments of browser.new_context (viewport, SSL errors, ...)
+        :param Optional[str] storage_state: Storage state file whose cookies seed every leased context (authentication)
+        :param int max_uses: Number of modules a context serves before it is recycled
+        :param float max_heap_mb: JS heap size of the page above which the context is recycled
+        :param float reset_timeout_seconds: Maximum time a reset may take before the context is recycled
+        """
+        self.browser = browser
+        self.context_args = context_args
+        self.storage_state = storage_state
+        self.max_uses = max_uses
+        self.max_heap_mb = max_heap_mb
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.created = 0
+        self.reused = 0
+        self._idle: List[PooledContext] = []
+        self._seed_cookies: List[Dict[str, Any]] = []
+        if storage_state:
+            self._seed_cookies = json.loads(Path(storage_state).read_text()).get("cookies", [])
+
+    async def acquire(self) -> PooledContext:
+        """
+        Leases an idle context, or creates one if none is idle.
+
+        :return: PooledContext: Context and page for the module
+        """
+        if self._idle:
+            lease = self._idle.pop()
+            self.reused += 1
+        else:
+            context = await self.browser.new_context(**self.context_args)
+            if self._seed_cookies:
+                await context.add_cookies(self._seed_cookies)
+            lease = PooledContext(context, await context.new_page())
+            self.created += 1
+        lease.uses += 1
+        return lease
+
+    async def release(self, lease: PooledContext) -> None:
+        """
+        Takes a context back: resets it for the next module, or closes it if it is worn out.
+
+        :param PooledContext lease: Leased context
+        :return: None
+        """
+        reason = await self._recycle_reason(lease)
+        if reason is None:
+            try:
+                if await asyncio.wait_for(self._reset(lease), timeout=self.reset_timeout_seconds):
+                    self._idle.append(lease)
+                    return
+            except asyncio.TimeoutError:
+                reason = f"reset took longer than {self.reset_timeout_seconds:g}s"
+        logger.debug("Recycling browser context: %s", reason or "reset failed")
+        await close_context(lease)
+
+    async def close(self) -> None:
+        """
+        Closes all idle contexts.
+
+        :return: None
+        """
+        idle, self._idle = self._idle, []
+        for lease in idle:
+            await close_context(lease)
+        logger.info(f"Context pool: {self.created} contexts created, {self.reused} reused")
+
+    async def _recycle_reason(self, lease: PooledContext) -> Optional[str]:
+        """
+        Checks whether a context should be closed instead of reused.
+
+        :param PooledContext lease: Leased context
+        :return: Optional[str]: Why the context is recycled, or None to reuse it
+        """
+        if lease.uses >= self.max_uses:
+            return f"served {lease.uses} modules"
+        try:
+            heap_bytes = await lease.page.evaluate(_HEAP_SCRIPT)
+        except Error as e:
+            return f"page is not usable ({e})"
+        if heap_bytes is not None and heap_bytes / (1024 * 1024) > self.max_heap_mb:
+            return f"JS heap of {heap_bytes / (1024 * 1024):.0f} MB exceeds {self.max_heap_mb:g} MB"
+        return None
+
+    async def _reset(self, lease: PooledContext) -> bool:
+        """
+        Resets a context to the state of a new one: fresh page, no routes, cookies, permissions or
+        origin storage, and the seed cookies.
+
+        :param PooledContext lease: Leased context
+        :return: bool: True if the context was reset, False if it has to be recycled
+        """
+        context = lease.context
+        try:
+            origins: Set[str] = {entry["origin"] for entry in (await context.storage_state())["origins"]}
+            for page in context.pages:
+                parts = urlsplit(page.url)
+                if parts.scheme in ("http", "https"):
+                    origins.add(f"{parts.scheme}://{parts.netloc}")
+            # A new page drops session storage, history and the listeners of the previous module
+            lease.page = await context.new_page()
+            for page in context.pages:
+                if page != lease.page:
+                    await page.close()
+
+            cdp = await context.new_cdp_session(lease.page)
+            for origin in origins:
+                await cdp.send("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+            await cdp.detach()
+
+            await context.unroute_all(behavior="ignoreErrors")
+            await context.clear_cookies()
+            await context.clear_permissions()
+            if self._seed_cookies:
+                await context.add_cookies(self._seed_cookies)
+            return True
+        except Error as e:
+            logger.warning(f"Could not reset browser context: {e}")
+            return False
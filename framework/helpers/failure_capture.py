@@ -0,0 +1,217 @@
+"""
+Failure-only artifact capture.
+
+Keeps Playwright tracing running for the whole browser context and records every scenario as
+a trace chunk (``tracing.start_chunk`` / ``tracing.stop_chunk``). A passing scenario's chunk is
+discarded without being written; a failing scenario's chunk is persisted together with a
+screenshot, the DOM, and the last console messages and network events, in one compressed,
+size-bounded archive per failure.
+
+Follows SOLID Principles:
+- Single Responsibility: Handles only capturing and persisting post-mortem artifacts
+- Dependency Inversion: Works with any Playwright page and its browser context
+"""
+
+import json
+import logging
+import re
+import tempfile
+import time
+import zipfile
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional
+
+from playwright.async_api import ConsoleMessage, Page, Request, Response
+
+logger = logging.getLogger(__name__)
+
+# Number of console messages and network events kept per scenario
+DEFAULT_EVENT_BUFFER_SIZE = 200
+
+# Size bounds: per archive entry (DOM, screenshot, trace) and for the whole artifacts directory
+MAX_ENTRY_BYTES = 20 * 1024 * 1024
+MAX_DIRECTORY_BYTES = 500 * 1024 * 1024
+
+
+def _safe_file_name(name: str, max_length: int = 80) -> str:
+    """
+    Turns a scenario name into a file name.
+
+    :param str name: Scenario or test name
+    :param int max_length: Maximum length of the result
+    :return: str: File name made of letters, digits, "-" and "_"
+    """
+    return re.sub(r"[^A-Za-z0-9_-]+", "-", name).strip("-")[:max_length] or "scenario"
+
+
+class FailureCapture:
+    """
+    Captures trace chunks per scenario and persists them, with page state, only for failures.
+
+    Examples:
+        capture = FailureCapture(page, Path("test-artifacts"))
+        await capture.start("test_create_pipeline")
+        ...  # run the scenario
+        await capture.finish(failed=True)  # -> test-artifacts/test_create_pipeline-<time>.zip
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        artifacts_dir: Path,
+        event_buffer_size: int = DEFAULT_EVENT_BUFFER_SIZE,
+        max_entry_bytes: int = MAX_ENTRY_BYTES,
+        max_directory_bytes: int = MAX_DIRECTORY_BYTES,
+    ) -> None:
+        """
+        Initialize failure capture for a page and its browser context.
+
+        :param Page page: Playwright page to capture
+        :param Path artifacts_dir: Directory for failure archives
+        :param int event_buffer_size: Number of console messages and network events kept per scenario
+        :param int max_entry_bytes: Maximum size of a single archive entry; larger entries are truncated or skipped
+        :param int max_directory_bytes: Maximum size of the artifacts directory; oldest archives are removed first
+        """
+        self.page = page
+        self.artifacts_dir = artifacts_dir
+        self.max_entry_bytes = max_entry_bytes
+        self.max_directory_bytes = max_directory_bytes
+        self.console_events: Deque[Dict[str, Any]] = deque(maxlen=event_buffer_size)
+        self.network_events: Deque[Dict[str, Any]] = deque(maxlen=event_buffer_size)
+        self.last_screenshot: Optional[bytes] = None
+        self._tracing_started = False
+        self._scenario: Optional[str] = None
+
+        page.on("console", self._on_console)
+        page.on("response", self._on_response)
+        page.on("requestfailed", self._on_request_failed)
+
+    @property
+    def in_scenario(self) -> bool:
+        """True while a scenario's trace chunk is being recorded."""
+        return self._scenario is not None
+
+    async def start(self, scenario: str = "scenario") -> None:
+        """
+        Starts recording a scenario: a new trace chunk and empty event buffers.
+
+        :param str scenario: Scenario (test) name; can be replaced when finishing
+        :return: None
+        """
+        if not self._tracing_started:
+            await self.page.context.tracing.start(screenshots=True, snapshots=True)
+            self._tracing_started = True
+        await self.page.context.tracing.start_chunk(title=scenario)
+        self.console_events.clear()
+        self.network_events.clear()
+        self._scenario = scenario
+
+    async def finish(self, failed: bool, scenario: Optional[str] = None) -> Optional[Path]:
+        """
+        Stops recording the current scenario. Discards the chunk on pass; persists artifacts on failure.
+
+        :param bool failed: Whether the scenario failed
+        :param Optional[str] scenario: Scenario name for the archive (defaults to the name given to start)
+        :return: Optional[Path]: Path of the failure archive, or None if nothing was persisted
+        """
+        if self._scenario is None:
+            return None
+        scenario, self._scenario = scenario or self._scenario, None
+        if not failed:
+            await self.page.context.tracing.stop_chunk()
+            return None
+        try:
+            return await self._persist(scenario)
+        except Exception as e:
+            logger.error(f"Failed to persist failure artifacts for '{scenario}': {e}")
+            return None
+
+    async def stop(self) -> None:
+        """
+        Stops tracing for the browser context; an open chunk is discarded.
+
+        :return: None
+        """
+        if self._tracing_started:
+            await self.page.context.tracing.stop()
+            self._tracing_started = False
+        self._scenario = None
+
+    async def _persist(self, scenario: str) -> Path:
+        """
+        Writes trace, screenshot, DOM and recent events of a failed scenario into one zip archive.
+
+        :param str scenario: Scenario (test) name
+        :return: Path: Path of the archive
+        """
+        self.artifacts_dir.mkdir(parents=True, exist_ok=True)
+        archive_path = self.artifacts_dir / f"{_safe_file_name(scenario)}-{time.strftime('%Y%m%d-%H%M%S')}.zip"
+
+        self.last_screenshot = None
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            trace_path = Path(tmp_dir) / "trace.zip"
+            await self.page.context.tracing.stop_chunk(path=str(trace_path))
+            entries: Dict[str, bytes] = {"url.txt": self.page.url.encode()}
+            entries["console.json"] = json.dumps(list(self.console_events), indent=2).encode()
+            entries["network.json"] = json.dumps(list(self.network_events), indent=2).encode()
+            try:
+                self.last_screenshot = await self.page.screenshot(full_page=True)
+                entries["screenshot.png"] = self.last_screenshot
+            except Exception as e:
+                logger.warning(f"Could not take failure screenshot: {e}")
+            try:
+                dom = (await self.page.content()).encode()
+                entries["dom.html"] = dom[: self.max_entry_bytes]
+            except Exception as e:
+                logger.warning(f"Could not read failure DOM: {e}")
+
+            with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+                for name, content in entries.items():
+                    if len(content) > self.max_entry_bytes:
+                        logger.warning(f"Skipping {name} for '{scenario}': {len(content)} bytes exceeds the limit")
+                        continue
+                    archive.writestr(name, content)
+                if trace_path.exists() and trace_path.stat().st_size <= self.max_entry_bytes:
+                    # The trace is a zip already; store it as is (open with `playwright show-trace`)
+                    archive.write(trace_path, "trace.zip", compress_type=zipfile.ZIP_STORED)
+                elif trace_path.exists():
+                    logger.warning(
+                        f"Skipping trace for '{scenario}': {trace_path.stat().st_size} bytes exceeds the limit"
+                    )
+
+        self._enforce_directory_budget()
+        logger.info(f"Saved failure artifacts for '{scenario}' to {archive_path}")
+        return archive_path
+
+    def _enforce_directory_budget(self) -> None:
+        """
+        Removes the oldest archives until the artifacts directory fits its size budget.
+
+        :return: None
+        """
+        archives = sorted(self.artifacts_dir.glob("*.zip"), key=lambda path: path.stat().st_mtime)
+        total = sum(path.stat().st_size for path in archives)
+        while archives and total > self.max_directory_bytes:
+            oldest = archives.pop(0)
+            total -= oldest.stat().st_size
+            oldest.unlink()
+            logger.info(f"Removed old failure archive {oldest.name} to stay within the artifacts size budget")
+
+    def _on_console(self, message: ConsoleMessage) -> None:
+        self.console_events.append({"time": time.time(), "type": message.type, "text": message.text})
+
+    def _on_response(self, response: Response) -> None:
+        self.network_events.append(
+            {
+                "time": time.time(),
+                "method": response.request.method,
+                "url": response.url,
+                "status": response.status,
+            }
+        )
+
+    def _on_request_failed(self, request: Request) -> None:
+        self.network_events.append(
+            {"time": time.time(), "method": request.method, "url": request.url, "failure": request.failure}
+        )
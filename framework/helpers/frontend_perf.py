@@ -0,0 +1,327 @@
+"""
+Console front-end performance collector.
+
+Records the front-end performance of every console route the tests visit and compares it with
+a baseline of the previous console release:
+
+- An init script installs PerformanceObservers in the page. It splits the page's life into
+  visits (a document load or an SPA history navigation) and records per visit: navigation timing
+  and LCP (document loads only), long tasks, and the number and transfer size of API calls.
+  Visits that end with a document unload are kept in sessionStorage for the next document.
+  A drain reports the current visit; what the page does after that on the same route is not
+  counted as another visit, so only navigations become samples.
+- After each scenario the collector drains the visits, samples the JS heap through CDP
+  ``Performance.getMetrics``, and classifies each visit by the URL patterns of
+  console_url_patterns (e.g., PIPELINERUN_LOGS).
+- PerfResults aggregates the metrics per route (median, p90) and reports routes whose median got
+  worse than the baseline's by more than a tolerance.
+
+Follows SOLID Principles:
+- Single Responsibility: Handles only collecting, aggregating and comparing front-end metrics
+- Open/Closed: New console routes are picked up from console_url_patterns without changes here
+"""
+
+import json
+import logging
+import statistics
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Pattern
+
+from playwright.async_api import CDPSession, Error, Page
+
+from framework.helpers.har_replay import CONSOLE_VERSION_SCRIPT
+from framework.helpers.network_conditions import EmulatedConditions
+from framework.ui_components import console_url_patterns
+
+logger = logging.getLogger(__name__)
+
+# Route name (pattern name without "_URL") -> pattern, e.g. "PIPELINERUN_LOGS"
+ROUTE_PATTERNS: Dict[str, Pattern[str]] = {
+    name[: -len("_URL")]: pattern
+    for name, pattern in vars(console_url_patterns).items()
+    if name.endswith("_URL") and isinstance(pattern, Pattern)
+}
+
+# Metrics compared with the baseline, and the smallest change of each that counts as a regression
+REGRESSION_FLOORS = {
+    "lcp_ms": 200,
+    "dom_content_loaded_ms": 200,
+    "load_ms": 200,
+    "long_task_ms": 100,
+    "api_calls": 2,
+    "api_kb": 50,
+    "js_heap_mb": 10,
+}
+
+_OBSERVER_SCRIPT = """
+(() => {
+    if (window !== window.top || window.__routePerf) return;
+    const KEY = "__routePerfPending";
+    const pending = JSON.parse(sessionStorage.getItem(KEY) || "[]");
+    sessionStorage.removeItem(KEY);
+    const newVisit = (start, documentLoad) => ({
+        url: location.href, start, documentLoad, lcp_ms: null, long_tasks: 0, long_task_ms: 0, api_calls: 0, api_kb: 0,
+    });
+    let visit = newVisit(0, true);
+    const finish = () => {
+        // The rest of a visit that was already drained is not a navigation of its own
+        if (visit.continuation) return;
+        if (visit.documentLoad) {
+            const nav = performance.getEntriesByType("navigation")[0];
+            if (nav) {
+                visit.dom_content_loaded_ms = nav.domContentLoadedEventEnd || null;
+                visit.load_ms = nav.loadEventEnd || null;
+            }
+        }
+        pending.push(visit);
+    };
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(callback)).observe({ type, buffered: true });
+        } catch (e) { /* entry type not supported by this browser */ }
+    };
+    observe("largest-contentful-paint", (entry) => { if (visit.documentLoad) visit.lcp_ms = entry.startTime; });
+    observe("longtask", (entry) => { visit.long_tasks += 1; visit.long_task_ms += entry.duration; });
+    observe("resource", (entry) => {
+        const apiCall = entry.initiatorType === "fetch" || entry.initiatorType === "xmlhttprequest";
+        if (apiCall && entry.name.includes("/api/")) {
+            visit.api_calls += 1;
+            visit.api_kb += (entry.transferSize || entry.encodedBodySize || 0) / 1024;
+        }
+    });
+    const routeChanged = (before) => {
+        if (location.pathname !== before) { finish(); visit = newVisit(performance.now(), false); }
+    };
+    for (const method of ["pushState", "replaceState"]) {
+        const original = history[method];
+        history[method] = function (...args) {
+            const before = location.pathname;
+            const result = original.apply(this, args);
+            routeChanged(before);
+            return result;
+        };
+    }
+    let lastPath = location.pathname;
+    addEventListener("popstate", () => { routeChanged(lastPath); lastPath = location.pathname; });
+    addEventListener("pagehide", () => { finish(); sessionStorage.setItem(KEY, JSON.stringify(pending)); });
+    window.__routePerf = {
+        drain: () => {
+            finish();
+            visit = { ...newVisit(performance.now(), false), continuation: true };
+            return pending.splice(0);
+        },
+    };
+})();
+"""
+
+
+def classify_route(url: str) -> Optional[str]:
+    """
+    Classifies a URL by the console URL patterns; the most specific (longest) match wins.
+
+    :param str url: Page URL
+    :return: Optional[str]: Route name (e.g., "PIPELINERUN_LOGS"), or None for other pages (login, dashboards)
+    """
+    path = url.split("?", 1)[0].split("#", 1)[0]
+    best, best_length = None, 0
+    for name, pattern in ROUTE_PATTERNS.items():
+        match = pattern.search(path)
+        if match and len(match.group()) > best_length:
+            best, best_length = name, len(match.group())
+    return best
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """
+    Returns a percentile of the values (nearest rank).
+
+    :param List[float] values: Values
+    :param float fraction: Percentile as a fraction (e.g., 0.9)
+    :return: float: The percentile
+    """
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class PerfResults:
+    """
+    Session-wide metrics per console route.
+
+    Examples:
+        results = PerfResults(Path("test-artifacts/perf"), "main")
+        results.add("PIPELINERUN_LOGS", {"lcp_ms": 840.0, "api_calls": 12})
+        results.write()  # -> main-routes.json
+        regressions = results.compare(load_baseline(Path("perf-baseline.json")), tolerance=0.2)
+    """
+
+    def __init__(self, output_dir: Path, worker: str) -> None:
+        """
+        Initialize empty results.
+
+        :param Path output_dir: Directory of the results file
+        :param str worker: Worker ID, used in the file name
+        """
+        self.output_dir = output_dir
+        self.worker = worker
+        self.console_version: Optional[str] = None
+        # Emulated network/CPU conditions the metrics were taken under (see network_conditions.py)
+        self.conditions = EmulatedConditions().tag
+        self._values: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+
+    def add(self, route: str, metrics: Dict[str, Any]) -> None:
+        """
+        Adds the metrics of one visit (None values are skipped).
+
+        :param str route: Route name
+        :param Dict[str, Any] metrics: Metric name -> value
+        :return: None
+        """
+        for name, value in metrics.items():
+            if value is not None:
+                self._values[route][name].append(float(value))
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Aggregates the metrics per route.
+
+        :return: Dict[str, Any]: {"console_version": ..., "conditions": ..., "routes": {route: {metric: {...}}}}
+        """
+        routes = {
+            route: {
+                name: {
+                    "count": len(values),
+                    "median": round(statistics.median(values), 1),
+                    "p90": round(_percentile(values, 0.9), 1),
+                }
+                for name, values in metrics.items()
+            }
+            for route, metrics in sorted(self._values.items())
+        }
+        return {"console_version": self.console_version, "conditions": self.conditions, "routes": routes}
+
+    def write(self, path: Optional[Path] = None) -> Optional[Path]:
+        """
+        Writes the summary.
+
+        :param Optional[Path] path: Target file (defaults to <output dir>/<worker>-routes.json)
+        :return: Optional[Path]: Written file, or None if no route was visited
+        """
+        if not self._values:
+            return None
+        path = path or self.output_dir / f"{self.worker}-routes.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.summary(), indent=2))
+        return path
+
+    def compare(self, baseline: Dict[str, Any], tolerance: float = 0.2, min_samples: int = 3) -> List[str]:
+        """
+        Compares the route medians with a baseline summary taken under the same emulated conditions.
+
+        :param Dict[str, Any] baseline: Summary of the baseline run (see summary())
+        :param float tolerance: Allowed relative growth of a median (0.2 = 20%)
+        :param int min_samples: Samples a metric needs in both runs to be compared
+        :return: List[str]: Descriptions of the regressions
+        """
+        # Baselines saved before condition tagging were taken unthrottled
+        baseline_conditions = baseline.get("conditions") or EmulatedConditions().tag
+        if baseline_conditions != self.conditions:
+            logger.warning(
+                f"Performance baseline was taken under '{baseline_conditions}' conditions, "
+                f"this run under '{self.conditions}'; routes are not compared"
+            )
+            return []
+        regressions = []
+        current = self.summary()["routes"]
+        for route, metrics in baseline.get("routes", {}).items():
+            for name, floor in REGRESSION_FLOORS.items():
+                before, now = metrics.get(name), current.get(route, {}).get(name)
+                if not before or not now or min(before["count"], now["count"]) < min_samples:
+                    continue
+                if now["median"] > before["median"] * (1 + tolerance) and now["median"] - before["median"] >= floor:
+                    regressions.append(
+                        f"{route} {name}: median {now['median']:g} vs {before['median']:g} "
+                        f"in {baseline.get('console_version') or 'baseline'}"
+                    )
+        return regressions
+
+
+class FrontendPerfCollector:
+    """
+    Collects the route visits of a page after each scenario.
+
+    Examples:
+        collector = await FrontendPerfCollector.attach(page, results)
+        ...  # run a scenario
+        await collector.collect()
+    """
+
+    def __init__(self, page: Page, results: PerfResults, cdp: Optional[CDPSession]) -> None:
+        """
+        Initialize the collector; use attach() to create one.
+
+        :param Page page: Page to collect from
+        :param PerfResults results: Results the visits are added to
+        :param Optional[CDPSession] cdp: CDP session with the Performance domain enabled (None without CDP)
+        """
+        self.page = page
+        self.results = results
+        self.cdp = cdp
+
+    @classmethod
+    async def attach(cls, page: Page, results: PerfResults) -> "FrontendPerfCollector":
+        """
+        Installs the observers in the page (for the current and every following document).
+
+        :param Page page: Page to collect from
+        :param PerfResults results: Results the visits are added to
+        :return: FrontendPerfCollector: The collector
+        """
+        await page.add_init_script(_OBSERVER_SCRIPT)
+        await page.evaluate(_OBSERVER_SCRIPT)
+        try:
+            cdp = await page.context.new_cdp_session(page)
+            await cdp.send("Performance.enable")
+        except Error:
+            # Firefox and WebKit have no CDP; the heap is not sampled there
+            cdp = None
+        return cls(page, results, cdp)
+
+    async def collect(self) -> int:
+        """
+        Drains the visits recorded since the last call and adds the classified ones to the results.
+
+        :return: int: Number of visits added
+        """
+        try:
+            visits = await self.page.evaluate("() => window.__routePerf ? window.__routePerf.drain() : []")
+            if self.results.console_version is None:
+                self.results.console_version = await self.page.evaluate(CONSOLE_VERSION_SCRIPT)
+            if visits and self.cdp is not None:
+                metrics = (await self.cdp.send("Performance.getMetrics"))["metrics"]
+                heap = next((metric["value"] for metric in metrics if metric["name"] == "JSHeapUsedSize"), None)
+                visits[-1]["js_heap_mb"] = heap / (1024 * 1024) if heap is not None else None
+        except Error as e:
+            logger.debug("Could not collect route performance: %s", e)
+            return 0
+
+        added = 0
+        for visit in visits:
+            route = classify_route(visit.pop("url"))
+            if route is None:
+                continue
+            visit.pop("start", None)
+            visit.pop("documentLoad", None)
+            self.results.add(route, visit)
+            added += 1
+        return added
+
+
+def load_baseline(path: Path) -> Dict[str, Any]:
+    """
+    Loads a baseline summary.
+
+    :param Path path: Baseline file written with --perf-save-baseline
+    :return: Dict[str, Any]: Baseline summary
+    """
+    return json.loads(path.read_text())
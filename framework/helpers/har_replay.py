@@ -0,0 +1,366 @@
+"""
+HAR record/replay of a feature's console traffic.
+
+Record mode (``--har-mode=record``) runs a feature against a live cluster and saves the traffic
+of its browser context to ``<har-dir>/<step module>.har`` with ``context.route_from_har``.
+Credentials (cookies, authorization headers, login form passwords) are redacted afterwards, and
+a ``.meta.json`` file next to it stores the console version and the recording time.
+
+Replay mode (``--har-mode=replay``) serves the same scenarios from the recording: fast,
+deterministic and offline. Requests are matched on method and a normalized URL, so dynamic parts
+of a run (``release-ui-test-*`` project names, ``generateName`` suffixes, OAuth state) still match.
+Responses recorded several times for one request (e.g., a list polled while a run finishes) are
+served in recorded order. WebSocket watches are left silent; the console shows the recorded lists.
+
+Follows SOLID Principles:
+- Single Responsibility: Handles only recording, matching and serving HAR traffic
+- Open/Closed: Matching rules are configured, not coded
+"""
+
+import base64
+import json
+import logging
+import re
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Pattern, Sequence, Tuple
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit, urlunsplit
+
+from playwright.async_api import BrowserContext, Error, Page, Route, WebSocketRoute
+
+logger = logging.getLogger(__name__)
+
+HAR_MODE_OFF = "off"
+HAR_MODE_RECORD = "record"
+HAR_MODE_REPLAY = "replay"
+HAR_MODES = (HAR_MODE_OFF, HAR_MODE_RECORD, HAR_MODE_REPLAY)
+
+# Test project names created by OpenShiftCLI.generate_random_project_name()
+PROJECT_NAME = re.compile(r"release-ui-test-[a-z0-9]{5}")
+
+# Query parameters that differ on every run
+VOLATILE_QUERY_PARAMS = frozenset({"resourceVersion", "_", "state", "code"})
+
+# Headers and form fields that must not end up in a recording
+REDACTED_HEADERS = frozenset({"cookie", "set-cookie", "authorization", "x-csrftoken"})
+PASSWORD_FIELD = re.compile(r"(password=)[^&]*")
+REDACTED = "[redacted]"
+
+# Headers that describe the recorded transfer, not the (decoded) body that is served
+_TRANSFER_HEADERS = frozenset({"content-length", "content-encoding", "transfer-encoding"})
+
+# Console build the page shows (recordings and performance baselines are tied to it)
+CONSOLE_VERSION_SCRIPT = (
+    "() => (window.SERVER_FLAGS || {}).consoleVersion || (window.SERVER_FLAGS || {}).releaseVersion"
+)
+
+
+@dataclass(frozen=True)
+class MatchRule:
+    """Rewrites the dynamic part of a request URL to a placeholder before matching."""
+
+    pattern: Pattern[str]
+    replacement: str
+
+    def apply(self, url: str) -> str:
+        return self.pattern.sub(self.replacement, url)
+
+
+DEFAULT_MATCH_RULES: Tuple[MatchRule, ...] = (
+    MatchRule(PROJECT_NAME, "release-ui-test-*"),
+    # PipelineRuns/TaskRuns created with generateName (e.g., simple-pipeline-x7k2p)
+    MatchRule(
+        re.compile(r"((?:/pipelineruns|/taskruns|~PipelineRun|~TaskRun)/[a-z0-9][a-z0-9.-]*?)-[a-z0-9]{5}(?=[/?]|$)"),
+        r"\1-*",
+    ),
+)
+
+
+@dataclass(frozen=True)
+class HarMetadata:
+    """What a recording was made against."""
+
+    recorded_at: float
+    console_version: Optional[str]
+    project: Optional[str]
+    entries: int
+
+    @staticmethod
+    def path_for(har_path: Path) -> Path:
+        """
+        Returns the metadata file of a recording.
+
+        :param Path har_path: HAR file
+        :return: Path: Metadata file next to the HAR file
+        """
+        return har_path.with_suffix(".meta.json")
+
+    @classmethod
+    def load(cls, har_path: Path) -> Optional["HarMetadata"]:
+        """
+        Loads the metadata of a recording.
+
+        :param Path har_path: HAR file
+        :return: Optional[HarMetadata]: Metadata, or None if the feature was not recorded
+        """
+        meta_path = cls.path_for(har_path)
+        if not har_path.exists() or not meta_path.exists():
+            return None
+        return cls(**json.loads(meta_path.read_text()))
+
+    def save(self, har_path: Path) -> None:
+        """
+        Writes the metadata next to the HAR file.
+
+        :param Path har_path: HAR file
+        :return: None
+        """
+        self.path_for(har_path).write_text(json.dumps(asdict(self), indent=2))
+
+    def stale_reason(self, console_version: Optional[str], max_age_days: float) -> Optional[str]:
+        """
+        Checks whether the recording still represents the console under test.
+
+        :param Optional[str] console_version: Expected console version; None skips the version check
+        :param float max_age_days: Maximum age of the recording; 0 or less skips the age check
+        :return: Optional[str]: Why the recording is stale, or None if it can be replayed
+        """
+        if console_version and self.console_version != console_version:
+            return f"recorded against console {self.console_version}, expected {console_version}"
+        age_days = (time.time() - self.recorded_at) / 86400
+        if max_age_days > 0 and age_days > max_age_days:
+            return f"recorded {age_days:.0f} days ago (maximum {max_age_days:g})"
+        return None
+
+
+def har_path_for(har_dir: Path, module_name: str) -> Path:
+    """
+    Returns the recording of a step module (one feature file per step module).
+
+    :param Path har_dir: Directory of the recordings
+    :param str module_name: Step module name (e.g., "tests.steps.test_pipeline_navigation_steps")
+    :return: Path: HAR file
+    """
+    return har_dir / f"{module_name.rsplit('.', 1)[-1]}.har"
+
+
+def normalize_url(url: str, rules: Sequence[MatchRule] = DEFAULT_MATCH_RULES) -> str:
+    """
+    Normalizes a URL for matching: drops the fragment and volatile query parameters, sorts the
+    query and applies the match rules.
+
+    :param str url: Request URL
+    :param Sequence[MatchRule] rules: Match rules
+    :return: str: Normalized URL
+    """
+    parts = urlsplit(url)
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name not in VOLATILE_QUERY_PARAMS
+    )
+    normalized = unquote(urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), "")))
+    for rule in rules:
+        normalized = rule.apply(normalized)
+    return normalized
+
+
+def _redact(har: Dict[str, Any]) -> None:
+    """
+    Removes credentials from a HAR log in place.
+
+    :param Dict[str, Any] har: Parsed HAR file
+    :return: None
+    """
+    for entry in har["log"]["entries"]:
+        for message in (entry["request"], entry["response"]):
+            for header in message.get("headers", []):
+                if header["name"].lower() in REDACTED_HEADERS:
+                    header["value"] = REDACTED
+            message["cookies"] = []
+        post_data = entry["request"].get("postData")
+        if post_data and "text" in post_data:
+            post_data["text"] = PASSWORD_FIELD.sub(rf"\g<1>{REDACTED}", post_data["text"])
+            for param in post_data.get("params", []):
+                if param.get("name") == "password":
+                    param["value"] = REDACTED
+
+
+class HarRecorder:
+    """
+    Records the traffic of a browser context into a HAR file.
+
+    Examples:
+        recorder = HarRecorder(Path("tests/har/test_pipeline_navigation_steps.har"))
+        await recorder.start(context)
+        ...  # run the feature; read the console version before the page closes
+        await recorder.read_console_version(page)
+        await context.close()  # Playwright writes the HAR file
+        recorder.finish()
+    """
+
+    def __init__(self, har_path: Path) -> None:
+        """
+        Initialize the recorder.
+
+        :param Path har_path: HAR file to write
+        """
+        self.har_path = har_path
+        self.console_version: Optional[str] = None
+
+    async def start(self, context: BrowserContext) -> None:
+        """
+        Starts recording all requests of the context (requests still go to the cluster).
+
+        :param BrowserContext context: Browser context of the feature
+        :return: None
+        """
+        self.har_path.parent.mkdir(parents=True, exist_ok=True)
+        await context.route_from_har(self.har_path, update=True, update_content="embed", update_mode="minimal")
+        logger.info(f"Recording console traffic to {self.har_path}")
+
+    async def read_console_version(self, page: Page) -> None:
+        """
+        Reads the version of the console the page shows, for the staleness check of the replay.
+
+        :param Page page: Page on the console
+        :return: None
+        """
+        try:
+            self.console_version = await page.evaluate(CONSOLE_VERSION_SCRIPT)
+        except Error as e:
+            logger.warning(f"Could not read the console version for {self.har_path.name}: {e}")
+
+    def finish(self) -> Optional[HarMetadata]:
+        """
+        Redacts credentials from the HAR file written by the closed context and saves its metadata.
+
+        :return: Optional[HarMetadata]: Metadata, or None if the context did not write the HAR file
+        """
+        if not self.har_path.exists():
+            logger.error(f"Browser context did not write {self.har_path}")
+            return None
+        har = json.loads(self.har_path.read_text(encoding="utf-8"))
+        _redact(har)
+        self.har_path.write_text(json.dumps(har), encoding="utf-8")
+
+        projects = PROJECT_NAME.findall(" ".join(entry["request"]["url"] for entry in har["log"]["entries"]))
+        metadata = HarMetadata(
+            recorded_at=time.time(),
+            console_version=self.console_version,
+            project=max(set(projects), key=projects.count) if projects else None,
+            entries=len(har["log"]["entries"]),
+        )
+        metadata.save(self.har_path)
+        logger.info(f"Recorded {metadata.entries} requests to {self.har_path} (console {metadata.console_version})")
+        return metadata
+
+
+class HarReplayer:
+    """
+    Serves the requests of a browser context from a recording and aborts everything else.
+
+    Examples:
+        replayer = HarReplayer(Path("tests/har/test_pipeline_navigation_steps.har"), metadata)
+        await replayer.start(context)
+        ...  # run the feature offline
+        replayer.finish()
+    """
+
+    def __init__(self, har_path: Path, metadata: HarMetadata, rules: Sequence[MatchRule] = DEFAULT_MATCH_RULES) -> None:
+        """
+        Load a recording.
+
+        :param Path har_path: HAR file
+        :param HarMetadata metadata: Metadata of the recording
+        :param Sequence[MatchRule] rules: Match rules applied to recorded and replayed URLs
+        """
+        self.har_path = har_path
+        self.metadata = metadata
+        self.rules = rules
+        self.project: Optional[str] = None
+        self.misses: List[str] = []
+        self._responses: Dict[Tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
+        self._served: Dict[Tuple[str, str], int] = defaultdict(int)
+        har = json.loads(har_path.read_text(encoding="utf-8"))
+        for entry in har["log"]["entries"]:
+            request = entry["request"]
+            self._responses[(request["method"], normalize_url(request["url"], rules))].append(entry["response"])
+
+    async def start(self, context: BrowserContext) -> None:
+        """
+        Routes all requests and WebSockets of the context to the recording.
+
+        :param BrowserContext context: Browser context of the feature
+        :return: None
+        """
+        await context.route("**/*", self._handle)
+        await context.route_web_socket(re.compile(".*"), self._silence)
+        logger.info(f"Replaying {self.metadata.entries} recorded requests from {self.har_path}")
+
+    def finish(self) -> None:
+        """
+        Logs the requests the recording had no response for (call when the context is closed).
+
+        :return: None
+        """
+        if self.misses:
+            logger.warning(
+                f"{len(self.misses)} requests were not in {self.har_path.name} and were aborted "
+                f"(re-record with --har-mode=record), e.g. {self.misses[:5]}"
+            )
+
+    async def _handle(self, route: Route) -> None:
+        """
+        Fulfills a request with the next recorded response for it.
+
+        :param Route route: Intercepted request
+        :return: None
+        """
+        request = route.request
+        match = PROJECT_NAME.search(request.url)
+        if match and match.group() != self.metadata.project:
+            # The test project of this run; recorded responses name the recorded project instead
+            self.project = match.group()
+
+        key = (request.method, normalize_url(request.url, self.rules))
+        responses = self._responses.get(key)
+        if not responses:
+            self.misses.append(f"{request.method} {request.url}")
+            await route.abort()
+            return
+        # Serve responses in recorded order; keep serving the last one
+        response = responses[min(self._served[key], len(responses) - 1)]
+        self._served[key] += 1
+
+        headers = {
+            header["name"]: header["value"]
+            for header in response.get("headers", [])
+            if header["name"].lower() not in _TRANSFER_HEADERS and header["value"] != REDACTED
+        }
+        await route.fulfill(status=response["status"], headers=headers, body=self._body(response["content"]))
+
+    def _body(self, content: Dict[str, Any]) -> bytes:
+        """
+        Decodes a recorded response body and renames the recorded test project to this run's.
+
+        :param Dict[str, Any] content: HAR response content
+        :return: bytes: Response body
+        """
+        text = content.get("text", "")
+        if content.get("encoding") == "base64":
+            return base64.b64decode(text)
+        if self.project and self.metadata.project:
+            text = text.replace(self.metadata.project, self.project)
+        return text.encode("utf-8")
+
+    @staticmethod
+    def _silence(websocket: WebSocketRoute) -> None:
+        """
+        Keeps a WebSocket (e.g., a resource watch) open without connecting it to the cluster.
+
+        :param WebSocketRoute websocket: Intercepted WebSocket
+        :return: None
+        """
@@ -0,0 +1,265 @@
+"""
+Structured, non-blocking log pipeline.
+
+Framework and test loggers hand their records to a bounded in-memory queue; a background
+``QueueListener`` thread formats them as JSON lines and writes them to a per-worker log file.
+Message formatting (``%``-style arguments) therefore happens on the listener thread, not in
+the step that logged, and records below a component's level are discarded before anything
+is built. Every record carries the worker, scenario and step it was logged from, so the log
+of a single scenario can be filtered out of a parallel run, and the emulated network/CPU
+conditions of the run, so timings from throttled runs are not mixed up with others.
+
+Records still propagate to the root logger, so pytest's own log capture keeps working. That
+capture handler formats every record it receives synchronously on the logging thread, so only
+the JSON file is written off the step's thread; hot paths log with ``%``-style arguments, which
+skip formatting for records no handler accepts.
+
+Follows SOLID Principles:
+- Single Responsibility: Handles only routing, correlating and writing log records
+- Open/Closed: Per-component levels are configured, not coded
+"""
+
+import copy
+import json
+import logging
+import os
+import queue
+import time
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Loggers routed through the pipeline: everything under framework/ and tests/
+DEFAULT_LOGGERS = ("framework", "tests")
+
+_scenario: ContextVar[str] = ContextVar("log_scenario", default="")
+_step: ContextVar[str] = ContextVar("log_step", default="")
+
+
+def worker_id() -> str:
+    """
+    Returns the pytest-xdist worker ID (e.g., "gw0"), or "main" when not running distributed.
+
+    :return: str: Worker ID
+    """
+    return os.getenv("PYTEST_XDIST_WORKER", "main")
+
+
+def set_log_context(scenario: Optional[str] = None, step: Optional[str] = None) -> None:
+    """
+    Sets the scenario and/or step that following records are correlated with. Context variables
+    are copied into asyncio tasks, so records logged from ``run_async`` steps are correlated too.
+
+    :param Optional[str] scenario: Scenario name; None keeps the current one
+    :param Optional[str] step: Step text; None keeps the current one
+    :return: None
+    """
+    if scenario is not None:
+        _scenario.set(scenario)
+    if step is not None:
+        _step.set(step)
+
+
+def clear_log_context() -> None:
+    """
+    Clears the scenario and step correlation.
+
+    :return: None
+    """
+    _scenario.set("")
+    _step.set("")
+
+
+def parse_component_levels(spec: str) -> Dict[str, int]:
+    """
+    Parses per-component log levels.
+
+    :param str spec: Comma-separated logger=LEVEL pairs
+        (e.g., "framework.cli=DEBUG,framework.ui_components.base_page=WARNING")
+    :return: Dict[str, int]: Level per logger name
+    :raises ValueError: If a pair or level name is invalid
+    """
+    levels: Dict[str, int] = {}
+    for pair in filter(None, (item.strip() for item in spec.split(","))):
+        name, separator, level_name = pair.partition("=")
+        level = logging.getLevelName(level_name.strip().upper())
+        if not separator or not name.strip() or not isinstance(level, int):
+            raise ValueError(f"Invalid log level setting '{pair}', expected logger=LEVEL (e.g., framework.cli=DEBUG)")
+        levels[name.strip()] = level
+    return levels
+
+
+class CorrelationFilter(logging.Filter):
+    """Stamps records with the worker, scenario and step they were logged from."""
+
+    def __init__(self, worker: str, conditions: str = "") -> None:
+        """
+        Initialize the filter.
+
+        :param str worker: Worker ID stamped on every record
+        :param str conditions: Tag of the run's emulated conditions stamped on every record
+        """
+        super().__init__()
+        self.worker = worker
+        self.conditions = conditions
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.worker = self.worker
+        record.scenario = _scenario.get()
+        record.step = _step.get()
+        record.conditions = self.conditions
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(record.created)) + f".{record.msecs:03.0f}",
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "worker": getattr(record, "worker", ""),
+            "scenario": getattr(record, "scenario", ""),
+            "step": getattr(record, "step", ""),
+            "conditions": getattr(record, "conditions", ""),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    Queue handler that leaves formatting to the listener thread and never blocks: when the
+    queue is full, records are dropped and counted instead of waiting.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        """
+        Initialize the handler.
+
+        :param queue.Queue log_queue: Queue read by the listener
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # QueueHandler.prepare() formats the message here; keep the arguments for the listener instead
+        return copy.copy(record)
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LogPipeline:
+    """
+    Routes framework and test loggers through a queue to a background JSON-lines writer.
+
+    Examples:
+        pipeline = LogPipeline(Path("test-artifacts/logs/main.jsonl"), {"framework.cli": logging.DEBUG}).start()
+        set_log_context(scenario="test_create_pipeline")
+        logging.getLogger("framework.cli.openshift_cli").info("Applied %d resources", 12)
+        pipeline.stop()
+    """
+
+    def __init__(
+        self,
+        log_file: Path,
+        component_levels: Optional[Dict[str, int]] = None,
+        level: int = logging.INFO,
+        logger_names: Iterable[str] = DEFAULT_LOGGERS,
+        queue_size: int = 10000,
+        conditions: str = "",
+    ) -> None:
+        """
+        Initialize the pipeline; call start() to install it.
+
+        :param Path log_file: JSON-lines log file
+        :param Optional[Dict[str, int]] component_levels: Level per logger name (e.g., {"framework.cli": DEBUG})
+        :param int level: Lowest level written to the log file for loggers without a component level
+        :param Iterable[str] logger_names: Loggers routed through the pipeline (their children included)
+        :param int queue_size: Maximum number of queued records; further records are dropped and counted
+        :param str conditions: Tag of the run's emulated network/CPU conditions (see network_conditions.py)
+        """
+        self.log_file = log_file
+        self.component_levels = component_levels or {}
+        self.level = level
+        self.logger_names = tuple(logger_names)
+        self.conditions = conditions
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._handler: Optional[DeferredQueueHandler] = None
+        self._listener: Optional[QueueListener] = None
+        self._file_handler: Optional[logging.FileHandler] = None
+        self._previous_levels: Dict[str, int] = {}
+
+    def start(self) -> "LogPipeline":
+        """
+        Installs the queue handler and the component levels, and starts the background writer.
+        Other loggers keep their level, so pytest's ``--log-level``/``--log-cli-level`` still decide
+        what they emit; the default level only applies to what the file receives.
+
+        :return: LogPipeline: self
+        """
+        self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        self._file_handler = logging.FileHandler(self.log_file, encoding="utf-8")
+        self._file_handler.setFormatter(JsonFormatter())
+        self._listener = QueueListener(self._queue, self._file_handler)
+        self._listener.start()
+
+        self._handler = DeferredQueueHandler(self._queue)
+        self._handler.setLevel(min([self.level, *self.component_levels.values()]))
+        self._handler.addFilter(self._is_written)
+        self._handler.addFilter(CorrelationFilter(worker_id(), self.conditions))
+        for name, level in self.component_levels.items():
+            component_logger = logging.getLogger(name)
+            self._previous_levels[name] = component_logger.level
+            component_logger.setLevel(level)
+        for name in self.logger_names:
+            logging.getLogger(name).addHandler(self._handler)
+        logger.debug("Log pipeline started, writing to %s", self.log_file)
+        return self
+
+    def _is_written(self, record: logging.LogRecord) -> bool:
+        """
+        Checks a record against the level of its closest configured component (the default level otherwise).
+
+        :param logging.LogRecord record: Record handed to the queue handler
+        :return: bool: True if the record is written to the log file
+        """
+        name = record.name
+        while name:
+            if name in self.component_levels:
+                return record.levelno >= self.component_levels[name]
+            name = name.rpartition(".")[0]
+        return record.levelno >= self.level
+
+    def stop(self) -> None:
+        """
+        Removes the queue handler, writes the remaining records and closes the log file.
+
+        :return: None
+        """
+        if self._handler is None:
+            return
+        for name in self.logger_names:
+            logging.getLogger(name).removeHandler(self._handler)
+        for name, level in self._previous_levels.items():
+            logging.getLogger(name).setLevel(level)
+        if self._listener is not None:
+            self._listener.stop()
+        if self._file_handler is not None:
+            self._file_handler.close()
+        if self._handler.dropped:
+            logger.warning("Log pipeline dropped %d records (queue full)", self._handler.dropped)
+        self._handler = None
+        self._listener = None
+        self._file_handler = None
+        self._previous_levels = {}
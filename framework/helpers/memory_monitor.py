@@ -0,0 +1,293 @@
+"""
+Browser memory and leak monitor.
+
+A feature module keeps one page for all of its scenarios, so a console route that leaks (e.g.,
+PipelineRun logs, large YAML editors) slows every later scenario. After each scenario the monitor
+samples the renderer through CDP ``Performance.getMetrics`` (JS heap, DOM nodes, event listeners)
+and records the sample with the console route the scenario ended on. When a threshold is crossed
+it first forces a garbage collection and, if that does not help, recycles the page by reloading
+the current URL: the document's heap is released while the Page object, its URL and the context's
+session stay the same, so page objects and steps are not affected.
+
+At the end of the run the report lists the samples as a time series and flags routes whose
+scenarios leave the heap or DOM larger than they found it.
+
+Follows SOLID Principles:
+- Single Responsibility: Handles only sampling, recycling and reporting renderer memory
+"""
+
+import json
+import logging
+import re
+import time
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from playwright.async_api import CDPSession, Error, Page
+
+logger = logging.getLogger(__name__)
+
+_MB = 1024 * 1024
+
+# Route templates: namespaces and resource names are replaced, so scenarios on the same page type share a route
+_ROUTE_RULES = (
+    (re.compile(r"/ns/[^/]+"), "/ns/:namespace"),
+    (re.compile(r"(~[A-Za-z]+)/[^/]+"), r"\1/:name"),
+)
+
+
+def route_template(url: str) -> str:
+    """
+    Returns the console route of a URL, with namespace and resource name replaced.
+
+    :param str url: Page URL (e.g., ".../k8s/ns/release-ui-test-a7k2m/tekton.dev~v1~PipelineRun/run-x/logs")
+    :return: str: Route (e.g., "/k8s/ns/:namespace/tekton.dev~v1~PipelineRun/:name/logs")
+    """
+    route = urlsplit(url).path.rstrip("/") or "/"
+    for pattern, replacement in _ROUTE_RULES:
+        route = pattern.sub(replacement, route)
+    return route
+
+
+@dataclass(frozen=True)
+class MemoryThresholds:
+    """Renderer limits above which the page is recycled."""
+
+    js_heap_mb: float = 400
+    nodes: int = 150_000
+    listeners: int = 20_000
+
+
+@dataclass(frozen=True)
+class MemorySample:
+    """Renderer metrics after a scenario."""
+
+    time: float
+    module: str
+    scenario: str
+    route: str
+    js_heap_mb: float
+    nodes: int
+    listeners: int
+    recycled: bool = False
+
+
+class MemoryReport:
+    """
+    Session-wide time series of memory samples, with leak detection per console route.
+
+    Examples:
+        report = MemoryReport(Path("test-artifacts/memory"), "main")
+        report.add(sample)
+        report.write()  # -> main-samples.jsonl, main-leaks.json
+    """
+
+    def __init__(self, output_dir: Path, worker: str, leak_heap_mb: float = 10, leak_nodes: int = 5000) -> None:
+        """
+        Initialize an empty report.
+
+        :param Path output_dir: Directory of the report files
+        :param str worker: Worker ID, used in the file names
+        :param float leak_heap_mb: Mean JS heap growth per scenario from which a route counts as leaking
+        :param int leak_nodes: Mean DOM node growth per scenario from which a route counts as leaking
+        """
+        self.output_dir = output_dir
+        self.worker = worker
+        self.leak_heap_mb = leak_heap_mb
+        self.leak_nodes = leak_nodes
+        self.samples: List[MemorySample] = []
+
+    def add(self, sample: MemorySample) -> None:
+        """
+        Adds a sample to the time series.
+
+        :param MemorySample sample: Sample to add
+        :return: None
+        """
+        self.samples.append(sample)
+
+    def leaks(self) -> Dict[str, Dict[str, float]]:
+        """
+        Attributes the growth between consecutive samples of a page to the route the later scenario
+        ended on, and flags routes that grow the heap or DOM on average. Growth across a recycle
+        is not counted.
+
+        :return: Dict[str, Dict[str, float]]: Per route: scenarios, mean heap/node growth and a leaking flag
+        """
+        deltas: Dict[str, Dict[str, float]] = defaultdict(lambda: {"scenarios": 0, "heap_mb": 0.0, "nodes": 0.0})
+        previous: Dict[str, MemorySample] = {}
+        for sample in self.samples:
+            before = previous.get(sample.module)
+            previous[sample.module] = sample
+            if before is None or before.recycled:
+                continue
+            entry = deltas[sample.route]
+            entry["scenarios"] += 1
+            entry["heap_mb"] += sample.js_heap_mb - before.js_heap_mb
+            entry["nodes"] += sample.nodes - before.nodes
+
+        report = {}
+        for route, entry in deltas.items():
+            mean_heap_mb = entry["heap_mb"] / entry["scenarios"]
+            mean_nodes = entry["nodes"] / entry["scenarios"]
+            report[route] = {
+                "scenarios": entry["scenarios"],
+                "mean_heap_growth_mb": round(mean_heap_mb, 1),
+                "mean_node_growth": round(mean_nodes),
+                "leaking": entry["scenarios"] >= 2
+                and (mean_heap_mb >= self.leak_heap_mb or mean_nodes >= self.leak_nodes),
+            }
+        return report
+
+    def write(self) -> Optional[Path]:
+        """
+        Writes the time series and the leak report, and logs leaking routes.
+
+        :return: Optional[Path]: Leak report file, or None if nothing was sampled
+        """
+        if not self.samples:
+            return None
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.output_dir / f"{self.worker}-samples.jsonl", "w") as samples_file:
+            for sample in self.samples:
+                samples_file.write(json.dumps(asdict(sample)) + "\n")
+        leaks = self.leaks()
+        leak_path = self.output_dir / f"{self.worker}-leaks.json"
+        leak_path.write_text(json.dumps(leaks, indent=2))
+        for route, entry in leaks.items():
+            if entry["leaking"]:
+                logger.warning(
+                    f"Console route {route} leaks: +{entry['mean_heap_growth_mb']} MB heap, "
+                    f"+{entry['mean_node_growth']} DOM nodes per scenario ({entry['scenarios']} scenarios)"
+                )
+        return leak_path
+
+
+class MemoryMonitor:
+    """
+    Samples a page's renderer memory after each scenario and recycles the page when it grows too large.
+
+    Examples:
+        monitor = await MemoryMonitor.attach(page, report, "test_pipelinerun_logs_steps")
+        if monitor:
+            await monitor.check("test_view_logs")  # sample, recycle if needed
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        cdp: CDPSession,
+        report: MemoryReport,
+        module: str,
+        thresholds: MemoryThresholds = MemoryThresholds(),
+    ) -> None:
+        """
+        Initialize the monitor; use attach() to create one.
+
+        :param Page page: Page to monitor
+        :param CDPSession cdp: CDP session of the page with the Performance domain enabled
+        :param MemoryReport report: Report the samples are added to
+        :param str module: Module the page belongs to
+        :param MemoryThresholds thresholds: Limits above which the page is recycled
+        """
+        self.page = page
+        self.cdp = cdp
+        self.report = report
+        self.module = module
+        self.thresholds = thresholds
+        self.recycles = 0
+
+    @classmethod
+    async def attach(
+        cls, page: Page, report: MemoryReport, module: str, thresholds: MemoryThresholds = MemoryThresholds()
+    ) -> Optional["MemoryMonitor"]:
+        """
+        Creates a monitor for a page.
+
+        :param Page page: Page to monitor
+        :param MemoryReport report: Report the samples are added to
+        :param str module: Module the page belongs to
+        :param MemoryThresholds thresholds: Limits above which the page is recycled
+        :return: Optional[MemoryMonitor]: The monitor, or None if the browser has no CDP (Firefox, WebKit)
+        """
+        try:
+            cdp = await page.context.new_cdp_session(page)
+            await cdp.send("Performance.enable")
+        except Error as e:
+            logger.info(f"Memory monitor is not available for this browser: {e}")
+            return None
+        return cls(page, cdp, report, module, thresholds)
+
+    async def check(self, scenario: str) -> Optional[MemorySample]:
+        """
+        Samples the page after a scenario and recycles it if a threshold is crossed.
+
+        :param str scenario: Scenario that just finished
+        :return: Optional[MemorySample]: The recorded sample, or None if the page could not be sampled
+        """
+        try:
+            sample = await self._sample(scenario)
+            exceeded = self._exceeded(sample)
+            if exceeded:
+                recycled = await self._recycle(scenario, exceeded)
+                sample = MemorySample(**{**asdict(sample), "recycled": recycled})
+        except Error as e:
+            logger.debug("Could not sample page memory after %s: %s", scenario, e)
+            return None
+        self.report.add(sample)
+        return sample
+
+    async def _sample(self, scenario: str) -> MemorySample:
+        """
+        Reads the renderer metrics of the page.
+
+        :param str scenario: Scenario the sample belongs to
+        :return: MemorySample: The sample
+        """
+        metrics = {
+            metric["name"]: metric["value"] for metric in (await self.cdp.send("Performance.getMetrics"))["metrics"]
+        }
+        return MemorySample(
+            time=time.time(),
+            module=self.module,
+            scenario=scenario,
+            route=route_template(self.page.url),
+            js_heap_mb=round(metrics.get("JSHeapUsedSize", 0) / _MB, 1),
+            nodes=int(metrics.get("Nodes", 0)),
+            listeners=int(metrics.get("JSEventListeners", 0)),
+        )
+
+    def _exceeded(self, sample: MemorySample) -> Optional[str]:
+        """
+        Checks a sample against the thresholds.
+
+        :param MemorySample sample: Sample to check
+        :return: Optional[str]: The crossed threshold, or None
+        """
+        if sample.js_heap_mb > self.thresholds.js_heap_mb:
+            return f"JS heap {sample.js_heap_mb:.0f} MB > {self.thresholds.js_heap_mb:g} MB"
+        if sample.nodes > self.thresholds.nodes:
+            return f"{sample.nodes} DOM nodes > {self.thresholds.nodes}"
+        if sample.listeners > self.thresholds.listeners:
+            return f"{sample.listeners} event listeners > {self.thresholds.listeners}"
+        return None
+
+    async def _recycle(self, scenario: str, exceeded: str) -> bool:
+        """
+        Collects garbage and, if the page is still over a threshold, reloads its URL.
+
+        :param str scenario: Scenario after which the threshold was crossed
+        :param str exceeded: The crossed threshold
+        :return: bool: True if the page was reloaded
+        """
+        await self.cdp.send("HeapProfiler.collectGarbage")
+        if self._exceeded(await self._sample(scenario)) is None:
+            logger.info(f"Garbage collection brought the page back under the limits after {scenario} ({exceeded})")
+            return False
+        logger.warning(f"Recycling the page after {scenario}: {exceeded}; reloading {self.page.url}")
+        await self.page.goto(self.page.url)
+        self.recycles += 1
+        return True
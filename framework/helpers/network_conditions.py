@@ -0,0 +1,167 @@
+"""
+Network and CPU condition emulation.
+
+Tests normally run next to the cluster, while engineers use the console across continents and on
+slower machines. Named profiles emulate those conditions in the browser through the Chrome
+DevTools Protocol: network profiles set latency, bandwidth and packet loss
+(``Network.emulateNetworkConditions``), CPU profiles slow down the renderer
+(``Emulation.setCPUThrottlingRate``). The active profiles are selected per run with
+``--network-profile`` and ``--cpu-profile``, and their tag is attached to the run's timings (step
+durations, structured logs, route performance and load reports), so timings taken under different
+conditions are never mixed up.
+
+Emulation needs CDP, so it is Chromium only; other browsers run unthrottled with a warning.
+
+Follows SOLID Principles:
+- Single Responsibility: Handles only defining and applying emulated conditions
+- Open/Closed: New conditions are added as profile entries without changes to the callers
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict
+from weakref import WeakKeyDictionary
+
+from playwright.async_api import CDPSession, Error, Page
+
+logger = logging.getLogger(__name__)
+
+PROFILE_OFF = "off"
+
+# Emulation ends when its CDP session detaches, so the session is kept for as long as its page lives
+_SESSIONS: "WeakKeyDictionary[Page, CDPSession]" = WeakKeyDictionary()
+
+
+@dataclass(frozen=True)
+class NetworkProfile:
+    """Network conditions between the browser and the console."""
+
+    name: str
+    latency_ms: float = 0
+    download_kbps: float = -1
+    upload_kbps: float = -1
+    packet_loss_percent: float = 0
+
+    @property
+    def active(self) -> bool:
+        """True if the profile changes anything."""
+        return self.latency_ms > 0 or self.download_kbps >= 0 or self.upload_kbps >= 0 or self.packet_loss_percent > 0
+
+    def cdp_parameters(self) -> Dict[str, float]:
+        """
+        Parameters of ``Network.emulateNetworkConditions`` (throughput in bytes per second, -1 unthrottled).
+
+        :return: Dict[str, float]: CDP parameters
+        """
+        parameters = {
+            "offline": False,
+            "latency": self.latency_ms,
+            "downloadThroughput": self.download_kbps * 1000 / 8 if self.download_kbps >= 0 else -1,
+            "uploadThroughput": self.upload_kbps * 1000 / 8 if self.upload_kbps >= 0 else -1,
+        }
+        if self.packet_loss_percent:
+            parameters["packetLoss"] = self.packet_loss_percent
+        return parameters
+
+
+@dataclass(frozen=True)
+class CpuProfile:
+    """Renderer speed relative to the machine running the tests."""
+
+    name: str
+    slowdown: float = 1
+
+    @property
+    def active(self) -> bool:
+        """True if the profile changes anything."""
+        return self.slowdown > 1
+
+
+NETWORK_PROFILES: Dict[str, NetworkProfile] = {
+    profile.name: profile
+    for profile in (
+        NetworkProfile(PROFILE_OFF),
+        # Same region, office or home broadband
+        NetworkProfile("regional", latency_ms=30, download_kbps=50_000, upload_kbps=10_000),
+        # Cluster on another continent (e.g., Europe to US East)
+        NetworkProfile("intercontinental", latency_ms=150, download_kbps=20_000, upload_kbps=5_000),
+        # Cluster on the far side of the world (e.g., India to US West), some loss
+        NetworkProfile("antipodal", latency_ms=300, download_kbps=10_000, upload_kbps=2_000, packet_loss_percent=0.5),
+        # VPN over a congested or mobile link
+        NetworkProfile("degraded", latency_ms=400, download_kbps=1_500, upload_kbps=750, packet_loss_percent=2),
+    )
+}
+
+CPU_PROFILES: Dict[str, CpuProfile] = {
+    profile.name: profile
+    for profile in (
+        CpuProfile(PROFILE_OFF),
+        CpuProfile("mid-range", slowdown=2),
+        CpuProfile("low-end", slowdown=4),
+        CpuProfile("overloaded", slowdown=6),
+    )
+}
+
+
+@dataclass(frozen=True)
+class EmulatedConditions:
+    """
+    The network and CPU profiles of a run.
+
+    Examples:
+        conditions = EmulatedConditions.from_names("intercontinental", "low-end")
+        await conditions.apply(page)
+        conditions.tag  # -> "network=intercontinental,cpu=low-end"
+    """
+
+    network: NetworkProfile = NETWORK_PROFILES[PROFILE_OFF]
+    cpu: CpuProfile = CPU_PROFILES[PROFILE_OFF]
+
+    @classmethod
+    def from_names(cls, network: str = PROFILE_OFF, cpu: str = PROFILE_OFF) -> "EmulatedConditions":
+        """
+        Looks up the profiles by name.
+
+        :param str network: Network profile name (see NETWORK_PROFILES)
+        :param str cpu: CPU profile name (see CPU_PROFILES)
+        :return: EmulatedConditions: The conditions
+        :raises ValueError: If a profile name is unknown
+        """
+        if network not in NETWORK_PROFILES:
+            raise ValueError(f"Unknown network profile '{network}'. Valid options: {list(NETWORK_PROFILES)}")
+        if cpu not in CPU_PROFILES:
+            raise ValueError(f"Unknown CPU profile '{cpu}'. Valid options: {list(CPU_PROFILES)}")
+        return cls(NETWORK_PROFILES[network], CPU_PROFILES[cpu])
+
+    @property
+    def active(self) -> bool:
+        """True if any profile changes anything."""
+        return self.network.active or self.cpu.active
+
+    @property
+    def tag(self) -> str:
+        """Tag of the conditions for timings, e.g. "network=intercontinental,cpu=low-end"."""
+        return f"network={self.network.name},cpu={self.cpu.name}"
+
+    async def apply(self, page: Page) -> bool:
+        """
+        Applies the conditions to a page. They stay in effect for the page's later navigations and reloads.
+
+        :param Page page: Page to throttle
+        :return: bool: True if the conditions are in effect (always True without active profiles)
+        """
+        if not self.active:
+            return True
+        try:
+            cdp = await page.context.new_cdp_session(page)
+            if self.network.active:
+                await cdp.send("Network.enable")
+                await cdp.send("Network.emulateNetworkConditions", self.network.cdp_parameters())
+            if self.cpu.active:
+                await cdp.send("Emulation.setCPUThrottlingRate", {"rate": self.cpu.slowdown})
+            _SESSIONS[page] = cdp
+        except Error as e:
+            logger.warning(f"Could not emulate {self.tag} (CDP is Chromium only), running unthrottled: {e}")
+            return False
+        logger.info(f"Emulating {self.tag} on {page.url or 'new page'}")
+        return True
@@ -0,0 +1,137 @@
+"""
+Cluster-side prerequisite scheduler.
+
+A feature's step module declares the resources its scenarios need on the cluster
+(``CLUSTER_PREREQUISITES``). As soon as the module's test project exists, the scheduler applies
+them through the CLI in the background. The browser logs in and navigates at the same time.
+The step that needs a resource awaits its scheduled apply instead of applying it again, so a
+Background costs max(UI, CLI) instead of UI + CLI.
+
+Follows SOLID Principles:
+- Single Responsibility: Handles only scheduling and handing off prerequisite applies
+- Dependency Inversion: Works with the OpenShiftCLI wrapper and YamlLoader test data
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Set
+
+from framework.cli.openshift_cli import OpenShiftCLI
+from framework.helpers.yaml_loader import YamlLoader
+
+logger = logging.getLogger(__name__)
+
+# Test data loader per prerequisite kind
+_LOADERS: Dict[str, Callable[[str], str]] = {
+    "task": YamlLoader.load_task_yaml,
+    "pipeline": YamlLoader.load_pipeline_yaml,
+    "trigger": YamlLoader.load_trigger_yaml,
+}
+
+
+@dataclass(frozen=True)
+class Prerequisite:
+    """A test data YAML file to apply before the scenario needs it."""
+
+    kind: str
+    yaml_file: str
+
+    def __post_init__(self) -> None:
+        if self.kind not in _LOADERS:
+            raise ValueError(f"Unknown prerequisite kind '{self.kind}', expected one of {sorted(_LOADERS)}")
+
+    def load(self) -> str:
+        """
+        Loads the YAML content from test data.
+
+        :return: str: YAML content
+        """
+        return _LOADERS[self.kind](self.yaml_file)
+
+
+class PrerequisiteScheduler:
+    """
+    Applies declared prerequisites in the background and hands each apply off to the step that needs it.
+
+    Examples:
+        scheduler = PrerequisiteScheduler(openshift_cli, "release-ui-test-abcde")
+        scheduler.schedule([Prerequisite("pipeline", "simple_pipeline.yaml")])
+        ...  # log in and navigate
+        assert await scheduler.apply(Prerequisite("pipeline", "simple_pipeline.yaml"))  # awaits the scheduled apply
+    """
+
+    def __init__(self, openshift_cli: OpenShiftCLI, namespace: str, max_concurrency: int = 4) -> None:
+        """
+        Initialize the scheduler.
+
+        :param OpenShiftCLI openshift_cli: CLI wrapper instance
+        :param str namespace: Namespace to apply the prerequisites to (the module's test project)
+        :param int max_concurrency: Maximum number of oc apply calls in flight
+        """
+        self.openshift_cli = openshift_cli
+        self.namespace = namespace
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._scheduled: Dict[Prerequisite, asyncio.Task] = {}
+        self._claimed: Set[Prerequisite] = set()
+
+    def schedule(self, prerequisites: Iterable[Prerequisite]) -> None:
+        """
+        Starts applying the prerequisites on the running (session) loop; returns immediately.
+
+        :param Iterable[Prerequisite] prerequisites: Prerequisites to apply
+        :return: None
+        """
+        loop = asyncio.get_running_loop()
+        for prerequisite in prerequisites:
+            if prerequisite not in self._scheduled:
+                self._scheduled[prerequisite] = loop.create_task(
+                    self._apply(prerequisite), name=f"prerequisite:{prerequisite.yaml_file}"
+                )
+        if self._scheduled:
+            logger.info(f"Scheduled {len(self._scheduled)} prerequisites for project '{self.namespace}'")
+
+    async def apply(self, prerequisite: Prerequisite) -> bool:
+        """
+        Awaits the scheduled apply of a prerequisite the first time a step asks for it. Any later
+        request, or a prerequisite that was not scheduled, is applied now (e.g., to re-apply a resource).
+
+        :param Prerequisite prerequisite: Prerequisite the step needs
+        :return: bool: True if the resource was applied, False otherwise
+        """
+        task = self._scheduled.get(prerequisite)
+        if task is not None and prerequisite not in self._claimed:
+            self._claimed.add(prerequisite)
+            return await task
+        return await self._apply(prerequisite)
+
+    async def close(self) -> None:
+        """
+        Cancels applies that are still running (e.g., when the module's scenarios were skipped).
+
+        :return: None
+        """
+        pending = [task for task in self._scheduled.values() if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        self._scheduled.clear()
+        self._claimed.clear()
+
+    async def _apply(self, prerequisite: Prerequisite) -> bool:
+        """
+        Applies a prerequisite to the namespace.
+
+        :param Prerequisite prerequisite: Prerequisite to apply
+        :return: bool: True if the resource was applied, False otherwise
+        """
+        try:
+            yaml_content = prerequisite.load()
+        except FileNotFoundError as e:
+            logger.error(f"Cannot apply prerequisite: {e}")
+            return False
+        async with self._semaphore:
+            success = await self.openshift_cli.apply_yaml(yaml_content, namespace=self.namespace)
+        if success:
+            logger.info(f"Applied {prerequisite.kind} prerequisite '{prerequisite.yaml_file}' to '{self.namespace}'")
+        return success
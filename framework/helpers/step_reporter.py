@@ -0,0 +1,436 @@
+"""
+Streaming step reporter for ReportPortal.
+
+Streams step results, step timings and attachments (task logs, failure screenshots) to the
+ReportPortal launch of the current run without blocking the test: every call only puts an
+entry on a bounded queue, and a background thread sends the entries in batches through the
+ReportPortal batch log API. If the endpoint is not configured, too slow or failing, entries
+are written to a local spool directory instead, so nothing is lost and tests never wait.
+
+LocalReportPortalStandIn answers the batch log API locally (optionally slow or failing), so the
+batching, the switch to spooling and the dropped-entry count can be checked without ReportPortal.
+
+Follows SOLID Principles:
+- Single Responsibility: Handles only delivery of report entries
+- Dependency Inversion: Works with any endpoint that implements the ReportPortal log API
+"""
+
+import json
+import logging
+import queue
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from dataclasses import dataclass
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Type
+
+logger = logging.getLogger(__name__)
+
+# Stops the sender thread once everything queued before it was handled
+_CLOSE = object()
+
+
+@dataclass(frozen=True)
+class ReportAttachment:
+    """File attached to a report entry."""
+
+    name: str
+    data: bytes
+    mime: str
+
+
+@dataclass(frozen=True)
+class ReportEntry:
+    """A single log entry of the launch."""
+
+    time_ms: int
+    level: str
+    message: str
+    attachment: Optional[ReportAttachment] = None
+
+
+class StepReporter:
+    """
+    Non-blocking reporter: bounded queue in front of a batching background sender.
+
+    Examples:
+        reporter = StepReporter("https://rp.example.com", "release-ui", api_key, launch_uuid, spool_dir).start()
+        reporter.step_result("Create pipeline", "the user clicks Create", "passed", 1.42)
+        reporter.attach("git-clone.log", logs.encode(), "text/plain")
+        reporter.close()
+    """
+
+    def __init__(
+        self,
+        endpoint: Optional[str],
+        project: Optional[str],
+        api_key: Optional[str],
+        launch_uuid: Optional[str],
+        spool_dir: Path,
+        queue_size: int = 1000,
+        batch_size: int = 20,
+        flush_interval_seconds: float = 1.0,
+        request_timeout_seconds: float = 5.0,
+        max_consecutive_failures: int = 3,
+        conditions: str = "",
+    ) -> None:
+        """
+        Initialize the reporter; call start() to run the background sender.
+
+        :param Optional[str] endpoint: ReportPortal URL (e.g., "https://reportportal.example.com"); None spools only
+        :param Optional[str] project: ReportPortal project name
+        :param Optional[str] api_key: ReportPortal API key
+        :param Optional[str] launch_uuid: UUID of the launch the entries belong to; None spools only
+        :param Path spool_dir: Directory for entries that could not be sent
+        :param int queue_size: Maximum number of queued entries; further entries are dropped and counted
+        :param int batch_size: Maximum number of entries per request
+        :param float flush_interval_seconds: Maximum time an entry waits for its batch to fill
+        :param float request_timeout_seconds: Timeout of a single batch request
+        :param int max_consecutive_failures: Failed requests after which the reporter only spools
+        :param str conditions: Tag of the run's emulated network/CPU conditions, added to step timings
+        """
+        self.endpoint = endpoint.rstrip("/") if endpoint else None
+        self.project = project
+        self.api_key = api_key
+        self.launch_uuid = launch_uuid
+        self.spool_dir = spool_dir
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.request_timeout_seconds = request_timeout_seconds
+        self.max_consecutive_failures = max_consecutive_failures
+        self.conditions = conditions
+        self.sent = 0
+        self.spooled = 0
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._consecutive_failures = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def streaming(self) -> bool:
+        """True while entries are sent to ReportPortal (False once degraded to spooling)."""
+        return (
+            bool(self.endpoint and self.project and self.launch_uuid)
+            and self._consecutive_failures < self.max_consecutive_failures
+        )
+
+    def start(self) -> "StepReporter":
+        """
+        Starts the background sender thread.
+
+        :return: StepReporter: self
+        """
+        self._thread = threading.Thread(target=self._run, name="step-reporter", daemon=True)
+        self._thread.start()
+        if not self.streaming:
+            logger.info(f"ReportPortal is not configured; step reports are spooled to {self.spool_dir}")
+        return self
+
+    def step_result(self, scenario: str, step: str, status: str, duration_seconds: float, error: str = "") -> None:
+        """
+        Reports the result and duration of a BDD step. Never blocks.
+
+        :param str scenario: Scenario name
+        :param str step: Step text (e.g., "When the user clicks Create")
+        :param str status: "passed" or "failed"
+        :param float duration_seconds: Step duration
+        :param str error: Error message of a failed step
+        :return: None
+        """
+        timing = f"{duration_seconds * 1000:.0f} ms" + (f", {self.conditions}" if self.conditions else "")
+        message = f"[{status.upper()}] {scenario} :: {step} ({timing})"
+        if error:
+            message = f"{message}\n{error}"
+        self._enqueue(ReportEntry(int(time.time() * 1000), "ERROR" if status == "failed" else "INFO", message))
+
+    def attach(self, name: str, data: bytes, mime: str, message: str = "") -> None:
+        """
+        Reports an attachment (e.g., task logs, failure screenshot). Never blocks.
+
+        :param str name: File name shown in ReportPortal
+        :param bytes data: File content
+        :param str mime: MIME type (e.g., "text/plain", "image/png")
+        :param str message: Log message the attachment belongs to (defaults to the file name)
+        :return: None
+        """
+        attachment = ReportAttachment(name, data, mime)
+        self._enqueue(ReportEntry(int(time.time() * 1000), "INFO", message or name, attachment))
+
+    def close(self, timeout_seconds: float = 10) -> None:
+        """
+        Flushes queued entries and stops the sender; entries still queued after the timeout are spooled.
+
+        :param float timeout_seconds: Maximum time to wait for the sender
+        :return: None
+        """
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(_CLOSE, timeout=timeout_seconds)
+        except queue.Full:
+            logger.warning("Step reporter queue is still full at close")
+        self._thread.join(timeout=timeout_seconds)
+        self._thread = None
+
+        leftover = []
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if item is not _CLOSE:
+                leftover.append(item)
+        if leftover:
+            self._spool(leftover)
+        logger.info(f"Step reporter: {self.sent} sent, {self.spooled} spooled, {self.dropped} dropped")
+
+    def _enqueue(self, entry: ReportEntry) -> None:
+        """
+        Queues an entry without waiting; drops it if the queue is full.
+
+        :param ReportEntry entry: Entry to queue
+        :return: None
+        """
+        if self._thread is None:
+            return
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self) -> None:
+        """
+        Sender loop: collects entries into batches (by size or flush interval) and delivers them.
+
+        :return: None
+        """
+        closing = False
+        while not closing:
+            batch: List[ReportEntry] = []
+            deadline = time.monotonic() + self.flush_interval_seconds
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is _CLOSE:
+                    closing = True
+                    break
+                batch.append(item)
+            if batch:
+                self._deliver(batch)
+
+    def _deliver(self, batch: List[ReportEntry]) -> None:
+        """
+        Sends a batch, or spools it if ReportPortal is unavailable.
+
+        :param List[ReportEntry] batch: Entries to deliver
+        :return: None
+        """
+        if self.streaming:
+            try:
+                self._send(batch)
+                self._consecutive_failures = 0
+                self.sent += len(batch)
+                return
+            except (urllib.error.URLError, OSError, ValueError) as e:
+                self._consecutive_failures += 1
+                logger.warning(f"Failed to send {len(batch)} report entries to ReportPortal: {e}")
+                if not self.streaming:
+                    logger.warning(f"ReportPortal keeps failing; spooling further step reports to {self.spool_dir}")
+        self._spool(batch)
+
+    def _send(self, batch: List[ReportEntry]) -> None:
+        """
+        Sends a batch through the ReportPortal batch log API (multipart: JSON entries plus files).
+
+        :param List[ReportEntry] batch: Entries to send
+        :return: None: Raises URLError/OSError on failure
+        """
+        boundary = uuid.uuid4().hex
+        entries = []
+        for entry in batch:
+            log = {
+                "launchUuid": self.launch_uuid,
+                "time": entry.time_ms,
+                "level": entry.level,
+                "message": entry.message,
+            }
+            if entry.attachment:
+                log["file"] = {"name": entry.attachment.name}
+            entries.append(log)
+
+        parts = [self._part(boundary, "json_request_part", json.dumps(entries).encode(), "application/json")]
+        for entry in batch:
+            if entry.attachment:
+                parts.append(
+                    self._part(boundary, "file", entry.attachment.data, entry.attachment.mime, entry.attachment.name)
+                )
+        body = b"".join(parts) + f"--{boundary}--\r\n".encode()
+
+        request = urllib.request.Request(
+            f"{self.endpoint}/api/v2/{self.project}/log",
+            data=body,
+            headers={
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": f"multipart/form-data; boundary={boundary}",
+            },
+            method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=self.request_timeout_seconds) as response:
+            response.read()
+
+    @staticmethod
+    def _part(boundary: str, field: str, data: bytes, mime: str, file_name: Optional[str] = None) -> bytes:
+        """
+        Builds one multipart/form-data part.
+
+        :param str boundary: Multipart boundary
+        :param str field: Form field name
+        :param bytes data: Part content
+        :param str mime: Part content type
+        :param Optional[str] file_name: File name for file parts
+        :return: bytes: Encoded part
+        """
+        disposition = f'form-data; name="{field}"'
+        if file_name:
+            disposition = f'{disposition}; filename="{file_name}"'
+        header = f"--{boundary}\r\nContent-Disposition: {disposition}\r\nContent-Type: {mime}\r\n\r\n"
+        return header.encode() + data + b"\r\n"
+
+    def _spool(self, batch: List[ReportEntry]) -> None:
+        """
+        Appends entries to the spool file; attachments are written next to it.
+
+        :param List[ReportEntry] batch: Entries to spool
+        :return: None
+        """
+        try:
+            self.spool_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.spool_dir / "entries.jsonl", "a") as spool_file:
+                for entry in batch:
+                    record = {"time": entry.time_ms, "level": entry.level, "message": entry.message}
+                    if entry.attachment:
+                        file_name = f"{uuid.uuid4().hex[:8]}-{Path(entry.attachment.name).name}"
+                        (self.spool_dir / file_name).write_bytes(entry.attachment.data)
+                        record["file"] = {"name": file_name, "mime": entry.attachment.mime}
+                    spool_file.write(json.dumps(record) + "\n")
+            self.spooled += len(batch)
+        except OSError as e:
+            logger.error(f"Failed to spool {len(batch)} report entries: {e}")
+            self.dropped += len(batch)
+
+
+class LocalReportPortalStandIn:
+    """
+    Local stand-in for the ReportPortal batch log API: records the entries of every batch it
+    receives and answers with a configurable status after a configurable delay.
+
+    Examples:
+        with LocalReportPortalStandIn() as stand_in:
+            reporter = StepReporter(stand_in.url, "release-ui", "key", launch_uuid, spool_dir, batch_size=10).start()
+            reporter.step_result("Create pipeline", "the user clicks Create", "passed", 1.42)
+            reporter.close()
+            # stand_in.entries() -> [{"launchUuid": ..., "message": "[PASSED] Create pipeline :: ...", ...}]
+    """
+
+    def __init__(self, status: int = 201, response_delay_seconds: float = 0.0) -> None:
+        """
+        Initialize the stand-in; call start() (or use it as a context manager) to listen.
+
+        :param int status: HTTP status of every answer (e.g., 503 to emulate a failing ReportPortal)
+        :param float response_delay_seconds: Delay of every answer, to emulate a slow ReportPortal
+        """
+        self.status = status
+        self.response_delay_seconds = response_delay_seconds
+        self.requests = 0
+        self.batches: List[List[Dict[str, Any]]] = []
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    @property
+    def url(self) -> str:
+        """URL the stand-in listens on (the ReportPortal endpoint of the reporter)."""
+        if self._server is None:
+            raise RuntimeError("LocalReportPortalStandIn is not started")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """
+        Returns the log entries of all received batches, in the order they arrived.
+
+        :return: List[Dict[str, Any]]: Log entries (launchUuid, time, level, message, file)
+        """
+        with self._lock:
+            return [entry for batch in self.batches for entry in batch]
+
+    @staticmethod
+    def parse_batch(content_type: str, body: bytes) -> List[Dict[str, Any]]:
+        """
+        Reads the log entries from the JSON part of a multipart batch log request.
+
+        :param str content_type: Content-Type header of the request, including the boundary
+        :param bytes body: Request body
+        :return: List[Dict[str, Any]]: Log entries of the batch
+        """
+        message = BytesParser().parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+        for part in message.walk():
+            if part.get_param("name", header="content-disposition") == "json_request_part":
+                return json.loads(part.get_payload(decode=True))
+        return []
+
+    def start(self) -> "LocalReportPortalStandIn":
+        """
+        Start listening on a free local port in a background thread.
+
+        :return: LocalReportPortalStandIn: self
+        """
+        stand_in = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                with stand_in._lock:
+                    stand_in.requests += 1
+                if stand_in.response_delay_seconds:
+                    time.sleep(stand_in.response_delay_seconds)
+                entries = stand_in.parse_batch(self.headers.get("Content-Type", ""), body)
+                if stand_in.status < 300:
+                    with stand_in._lock:
+                        stand_in.batches.append(entries)
+                response = json.dumps({"responses": [{"id": str(uuid.uuid4())} for _ in entries]}).encode()
+                self.send_response(stand_in.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, format: str, *args: object) -> None:
+                logger.debug(f"LocalReportPortalStandIn: {format % args}")
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        logger.info(f"Local ReportPortal stand-in listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop listening and release the port."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "LocalReportPortalStandIn":
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
@@ -0,0 +1,289 @@
+"""
+Webhook Load Driver for EventListeners.
+
+Fires paced bursts of webhook payloads at an EventListener and records what the
+EventListener answered for each one (HTTP status and event ID). The event IDs are
+what Tekton Triggers labels the triggered PipelineRuns with
+(``triggers.tekton.dev/triggers-eventid``), so a report can be resolved to PipelineRun
+names through the CLI and then checked in the console.
+
+``LocalEventListenerReceiver`` answers like an EventListener on a local port, so the
+driver (and pacing) can be exercised when no cluster is available.
+
+Follows SOLID Principles:
+- Single Responsibility: Handles only sending webhook events and recording responses
+- Dependency Inversion: Works with any URL that answers like an EventListener
+"""
+
+import asyncio
+import json
+import logging
+import ssl
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Type
+
+logger = logging.getLogger(__name__)
+
+# Label Tekton Triggers puts on every resource created for an event
+EVENT_ID_LABEL = "triggers.tekton.dev/triggers-eventid"
+
+PayloadFactory = Callable[[int], Dict[str, Any]]
+
+
+def default_payload(index: int) -> Dict[str, Any]:
+    """
+    Build the payload of the index-th event; matches the "message" param of simple-triggerbinding.
+
+    :param int index: Zero-based index of the event in the burst
+    :return: Dict[str, Any]: JSON payload
+    """
+    return {"message": f"load event {index}"}
+
+
+@dataclass(frozen=True)
+class WebhookEvent:
+    """Outcome of a single webhook request."""
+
+    index: int
+    status: int
+    event_id: Optional[str]
+    sent_at: float
+    latency_seconds: float
+    error: str = ""
+
+    @property
+    def accepted(self) -> bool:
+        """True if the EventListener accepted the event (HTTP 2xx)."""
+        return 200 <= self.status < 300
+
+
+@dataclass
+class LoadReport:
+    """Outcome of a burst of webhook requests."""
+
+    target_url: str
+    started_at: float
+    duration_seconds: float = 0.0
+    events: List[WebhookEvent] = field(default_factory=list)
+
+    @property
+    def accepted(self) -> List[WebhookEvent]:
+        """Events the EventListener accepted."""
+        return [event for event in self.events if event.accepted]
+
+    @property
+    def failed(self) -> List[WebhookEvent]:
+        """Events that were rejected or could not be sent."""
+        return [event for event in self.events if not event.accepted]
+
+    @property
+    def event_ids(self) -> List[str]:
+        """Event IDs of the accepted events, in send order."""
+        return [event.event_id for event in self.accepted if event.event_id]
+
+    def summary(self) -> str:
+        """One-line summary for logs and assertion messages."""
+        latencies = sorted(event.latency_seconds for event in self.events)
+        p95 = latencies[int(0.95 * (len(latencies) - 1))] if latencies else 0.0
+        return (
+            f"{len(self.accepted)}/{len(self.events)} events accepted by {self.target_url} "
+            f"in {self.duration_seconds:.1f}s (p95 latency {p95 * 1000:.0f}ms)"
+        )
+
+
+class WebhookLoadDriver:
+    """
+    Sends paced bursts of JSON webhook events to an EventListener.
+
+    Examples:
+        driver = WebhookLoadDriver("http://el-simple-eventlistener-ns.apps.example.com")
+        report = await driver.fire_burst(200, duration_seconds=60)
+        # report.event_ids -> event IDs to resolve to PipelineRuns
+    """
+
+    def __init__(
+        self,
+        target_url: str,
+        headers: Optional[Dict[str, str]] = None,
+        verify_ssl: bool = False,
+        request_timeout_seconds: float = 10,
+    ) -> None:
+        """
+        Initialize the load driver.
+
+        :param str target_url: EventListener URL
+        :param Optional[Dict[str, str]] headers: Extra request headers (e.g., "X-GitHub-Event")
+        :param bool verify_ssl: Verify TLS certificates of https targets
+        :param float request_timeout_seconds: Timeout of a single request
+        """
+        self.target_url = target_url
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self.request_timeout_seconds = request_timeout_seconds
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        if not verify_ssl:
+            # Test clusters serve self-signed certificates
+            self._ssl_context = ssl.create_default_context()
+            self._ssl_context.check_hostname = False
+            self._ssl_context.verify_mode = ssl.CERT_NONE
+
+    async def fire_burst(
+        self,
+        count: int,
+        duration_seconds: float = 0,
+        payload_factory: PayloadFactory = default_payload,
+        max_concurrency: int = 20,
+    ) -> LoadReport:
+        """
+        Send count events, spread evenly over duration_seconds (0 sends them as fast as possible).
+
+        :param int count: Number of events
+        :param float duration_seconds: Time to spread the events over
+        :param PayloadFactory payload_factory: Builds the JSON payload of the index-th event
+        :param int max_concurrency: Maximum number of requests in flight
+        :return: LoadReport: Outcome of every event, in send order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        interval = duration_seconds / count if count else 0
+        loop = asyncio.get_running_loop()
+        report = LoadReport(target_url=self.target_url, started_at=time.time())
+        start = loop.time()
+
+        async def _send_paced(index: int) -> WebhookEvent:
+            await asyncio.sleep(max(0.0, start + index * interval - loop.time()))
+            async with semaphore:
+                return await asyncio.to_thread(self._send, index, payload_factory(index))
+
+        report.events = list(await asyncio.gather(*(_send_paced(index) for index in range(count))))
+        report.duration_seconds = loop.time() - start
+        logger.info(report.summary())
+        return report
+
+    def _send(self, index: int, payload: Dict[str, Any]) -> WebhookEvent:
+        """
+        Send a single event (blocking; runs in a worker thread).
+
+        :param int index: Index of the event in the burst
+        :param Dict[str, Any] payload: JSON payload
+        :return: WebhookEvent: Outcome of the request
+        """
+        request = urllib.request.Request(
+            self.target_url, data=json.dumps(payload).encode(), headers=self.headers, method="POST"
+        )
+        sent_at = time.time()
+        started = time.perf_counter()
+        try:
+            with urllib.request.urlopen(
+                request, timeout=self.request_timeout_seconds, context=self._ssl_context
+            ) as response:
+                status, body = response.status, response.read()
+            error = ""
+        except urllib.error.HTTPError as e:
+            status, body, error = e.code, b"", str(e)
+        except (urllib.error.URLError, OSError) as e:
+            status, body, error = 0, b"", str(e)
+        latency = time.perf_counter() - started
+
+        event_id = None
+        if body:
+            try:
+                event_id = json.loads(body).get("eventID")
+            except (ValueError, AttributeError):
+                logger.debug(f"Event {index}: response is not EventListener JSON")
+        if error:
+            logger.warning(f"Event {index} to {self.target_url} failed: {error}")
+        return WebhookEvent(index, status, event_id, sent_at, latency, error)
+
+
+class LocalEventListenerReceiver:
+    """
+    Local stand-in for an EventListener: answers 202 with an EventListener-style body
+    (including a fresh eventID) and records every payload it receives.
+
+    Examples:
+        with LocalEventListenerReceiver() as receiver:
+            report = await WebhookLoadDriver(receiver.url).fire_burst(20)
+            # len(receiver.received) == 20
+    """
+
+    def __init__(self, name: str = "local-eventlistener", namespace: str = "local") -> None:
+        """
+        Initialize the receiver; call start() (or use it as a context manager) to listen.
+
+        :param str name: EventListener name reported in responses
+        :param str namespace: Namespace reported in responses
+        """
+        self.name = name
+        self.namespace = namespace
+        self.received: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL the receiver listens on."""
+        if self._server is None:
+            raise RuntimeError("LocalEventListenerReceiver is not started")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "LocalEventListenerReceiver":
+        """
+        Start listening on a free local port in a background thread.
+
+        :return: LocalEventListenerReceiver: self
+        """
+        receiver = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                event_id = str(uuid.uuid4())
+                try:
+                    payload = json.loads(body or b"{}")
+                except ValueError:
+                    payload = {"raw": body.decode(errors="replace")}
+                with receiver._lock:
+                    receiver.received.append({"eventID": event_id, "payload": payload})
+                response = json.dumps(
+                    {"eventListener": receiver.name, "namespace": receiver.namespace, "eventID": event_id}
+                ).encode()
+                self.send_response(202)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+
+            def log_message(self, format: str, *args: object) -> None:
+                logger.debug(f"LocalEventListenerReceiver: {format % args}")
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Local EventListener receiver listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop listening and release the port."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "LocalEventListenerReceiver":
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.stop()
@@ -15,7 +15,8 @@ class YamlLoader:
     Eliminates duplicate file-reading logic across step definitions.
     """
 
-    TEST_DATA_BASE = Path(__file__).parent.parent / "resources" / "test_data"
+    RESOURCES_BASE = Path(__file__).parent.parent / "resources"
+    TEST_DATA_BASE = RESOURCES_BASE / "test_data"
 
     @classmethod
     def load_task_yaml(cls, yaml_filename: str) -> str:
@@ -82,9 +83,44 @@ class YamlLoader:
             return f.read()
 
     @classmethod
-    def get_task_metadata(cls, yaml_content: str) -> Dict[str, str]:
+    def load_trigger_yaml(cls, yaml_filename: str) -> str:
         """
-        Extract metadata from task YAML content.
+        Load a trigger resource YAML file from test_data/triggers directory.
+
+        :param str yaml_filename: Name of the YAML file (e.g., "simple_eventlistener.yaml")
+        :return: str: YAML content as string
+        :raises FileNotFoundError: If the YAML file does not exist
+        """
+        yaml_path = cls.TEST_DATA_BASE / "triggers" / yaml_filename
+        if not yaml_path.exists():
+            raise FileNotFoundError(f"Trigger YAML file not found: {yaml_path}")
+
+        with open(yaml_path, "r") as f:
+            return f.read()
+
+    @classmethod
+    def load_triggers_rbac_yaml(cls) -> str:
+        """
+        Load the ServiceAccount and RoleBinding that EventListeners run with, as one multi-document YAML.
+
+        :return: str: YAML content as string
+        :raises FileNotFoundError: If a YAML file does not exist
+        """
+        documents = []
+        for yaml_path in (
+            cls.RESOURCES_BASE / "serviceAccounts" / "triggers.yaml",
+            cls.RESOURCES_BASE / "rolebindings" / "triggers.yaml",
+        ):
+            if not yaml_path.exists():
+                raise FileNotFoundError(f"Triggers RBAC YAML file not found: {yaml_path}")
+            with open(yaml_path, "r") as f:
+                documents.append(f.read().strip())
+        return "\n---\n".join(documents) + "\n"
+
+    @classmethod
+    def get_resource_metadata(cls, yaml_content: str) -> Dict[str, str]:
+        """
+        Extract metadata from the YAML content of any resource (Task, Pipeline, EventListener, ...).
 
         :param str yaml_content: YAML content string
         :return: Dict[str, str]: Metadata dictionary with 'name', 'kind', 'apiVersion'
@@ -102,6 +138,17 @@ class YamlLoader:
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML content: {e}")
 
+    @classmethod
+    def get_task_metadata(cls, yaml_content: str) -> Dict[str, str]:
+        """
+        Extract metadata from task YAML content.
+
+        :param str yaml_content: YAML content string
+        :return: Dict[str, str]: Metadata dictionary with 'name', 'kind', 'apiVersion'
+        :raises ValueError: If YAML content is invalid or missing required fields
+        """
+        return cls.get_resource_metadata(yaml_content)
+
     @classmethod
     def get_pipeline_metadata(cls, yaml_content: str) -> Dict[str, str]:
         """
@@ -111,14 +158,4 @@ class YamlLoader:
         :return: Dict[str, str]: Metadata dictionary with 'name', 'kind', 'apiVersion'
         :raises ValueError: If YAML content is invalid or missing required fields
         """
-        import yaml
-
-        try:
-            data = yaml.safe_load(yaml_content)
-            return {
-                "name": data.get("metadata", {}).get("name", ""),
-                "kind": data.get("kind", ""),
-                "apiVersion": data.get("apiVersion", ""),
-            }
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML content: {e}")
+        return cls.get_resource_metadata(yaml_content)
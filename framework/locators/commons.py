@@ -39,6 +39,7 @@ class ProjectSelectorLocators:
 
     PROJECT_SELECTOR_BUTTON = 'button:has-text("Project:")'
     PROJECT_MENU_ITEM = 'role=menuitem[name="{project_name}"]'
+    PROJECT_SEARCH_INPUT = 'input[placeholder="Select project..."]'
     ALL_PROJECTS_MENU_ITEM = 'role=menuitem[name="All Projects"]'
 
 
@@ -106,9 +106,8 @@ class PipelineRunParametersPageLocators:
     NAME_HEADER = 'text="Name*"'
     VALUE_HEADER = 'text="Value"'
 
-    # Parameters display (read-only textboxes)
-    PARAMETER_NAME_TEXTBOX = "textbox[disabled]"
-    PARAMETER_VALUE_TEXTBOX = "textbox[disabled]"
+    # Form field name prefix of the parameter inputs (parameters.<index>.name / .value)
+    PARAMETER_FIELD_PREFIX = "parameters"
 
 
 class PipelineRunLogsPageLocators:
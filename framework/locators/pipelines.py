@@ -118,6 +118,8 @@ class BuilderViewLocators:
 
     # Task parameters - dynamic locators based on task/param index
     TASK_PARAM_TEMPLATE = "textarea#form-input-formData-tasks-{task_index}-params-{param_index}-value-field"
+    TASK_PARAM_FIELDS = 'textarea[name^="formData.tasks."]'
+    TASK_PARAM_FIELD_NAME_TEMPLATE = "formData.tasks.{task_index}.params.{param_index}.value"
 
     # Task workspaces - dynamic locators based on workspace type
     TASK_WORKSPACE_TEMPLATE = '[data-test="workspaces {workspace_type}"]'
@@ -129,6 +131,12 @@ class BuilderViewLocators:
     PIPELINE_PARAM_DESC_TEMPLATE = "input#form-input-formData-params-{param_index}-description-field"
     PIPELINE_PARAM_DEFAULT_TEMPLATE = "textarea#form-input-formData-params-{param_index}-default-field"
     PIPELINE_WORKSPACE_NAME_TEMPLATE = "input#form-input-formData-workspaces-{workspace_index}-name-field"
+    PIPELINE_PARAM_FIELD_PREFIX = "formData.params"
+    PIPELINE_WORKSPACE_FIELDS = 'input[name^="formData.workspaces."]'
+    PIPELINE_WORKSPACE_FIELD_NAME_TEMPLATE = "formData.workspaces.{workspace_index}.name"
+
+    # Task nodes rendered in the canvas
+    TASK_NODES = '[data-test^="builder-node "]'
 
     # Quick search dialog
     QUICK_SEARCH_INPUT = 'input[data-test="input"]'
@@ -232,6 +240,10 @@ class PipelineYamlPageLocators:
     CANCEL_BUTTON = 'button:has-text("Cancel")'
     DOWNLOAD_BUTTON = 'button:has-text("Download")'
 
+    # Save result alerts
+    SAVE_SUCCESS_ALERT = '.pf-v5-c-alert.pf-m-success:has-text("has been updated to version")'
+    SAVE_ERROR_ALERT = ".pf-v5-c-alert.pf-m-danger"
+
 
 class PipelineParametersPageLocators:
     """Locators for the Pipeline Parameters tab"""
@@ -256,6 +268,10 @@ class PipelineParametersPageLocators:
     REMOVE_PARAMETER_BUTTON = 'button:has-text("Remove")'
     ADD_PARAMETER_BUTTON = 'button:has-text("Add Pipeline parameter")'
 
+    # Form field name prefix and value field of the parameter inputs (params.<index>.name / .default)
+    PARAMETER_FIELD_PREFIX = "params"
+    PARAMETER_VALUE_FIELD = "default"
+
     # Action buttons
     SAVE_BUTTON = 'button:has-text("Save")'
     RELOAD_BUTTON = 'button:has-text("Reload")'
@@ -28,6 +28,7 @@ class TriggersPageLocators:
     )
     TRIGGERS_DATA_LOAD_CHECK = "table.ReactVirtualized__VirtualGrid"
     TRIGGERS_NO_DATA_LOAD_CHECK = "#no-resource-msg"
+    SEARCH_INPUT = 'input[placeholder="Search by name..."]'
 
 
 class CreateEventListenerPageLocators:
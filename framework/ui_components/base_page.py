@@ -5,6 +5,9 @@ from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from framework.config.config import Config
 
+# True if any matched element is rendered with a layout box (Playwright's notion of "visible")
+_ANY_DISPLAYED_SCRIPT = "elements => elements.some((el) => el.getClientRects().length > 0)"
+
 
 class BasePage:
     def __init__(self, page: Page, config: Config) -> None:
@@ -57,7 +60,7 @@ class BasePage:
         logger = logging.getLogger(__name__)
 
         start_time = time.time()
-        logger.info(f"[FAST CLICK] Starting fast click for locator: {locator} with timeout: {timeout}ms")
+        logger.debug("[FAST CLICK] Starting fast click for locator: %s with timeout: %dms", locator, timeout)
 
         try:
             loc = self.page.locator(locator)
@@ -66,7 +69,7 @@ class BasePage:
             visibility_start = time.time()
             await loc.wait_for(state="visible", timeout=timeout)
             visibility_elapsed = (time.time() - visibility_start) * 1000
-            logger.info(f"[FAST CLICK] Element visible after {visibility_elapsed:.0f}ms")
+            logger.debug("[FAST CLICK] Element visible after %.0fms", visibility_elapsed)
 
             # Click with no_wait_after for speed (navigation elements don't need wait)
             click_start = time.time()
@@ -74,21 +77,24 @@ class BasePage:
             click_elapsed = (time.time() - click_start) * 1000
 
             total_elapsed = (time.time() - start_time) * 1000
-            logger.info(
-                f"[FAST CLICK] SUCCESS - Click completed in {click_elapsed:.0f}ms, total: {total_elapsed:.0f}ms"
+            logger.debug(
+                "[FAST CLICK] SUCCESS - Click completed in %.0fms, total: %.0fms", click_elapsed, total_elapsed
             )
             return True
         except Exception as e:
             elapsed = (time.time() - start_time) * 1000
             logger.warning(
-                f"[FAST CLICK] FAILED after {elapsed:.0f}ms - {type(e).__name__}: {str(e)}. "
-                f"Falling back to regular click with {self.default_timeout}ms timeout"
+                "[FAST CLICK] FAILED after %.0fms - %s: %s. Falling back to regular click with %dms timeout",
+                elapsed,
+                type(e).__name__,
+                e,
+                self.default_timeout,
             )
             # Fallback to regular click if fast click fails
             fallback_start = time.time()
             result = await self.click_element(locator, timeout=self.default_timeout)
             fallback_elapsed = (time.time() - fallback_start) * 1000
-            logger.warning(f"[FAST CLICK] Fallback click took {fallback_elapsed:.0f}ms")
+            logger.warning("[FAST CLICK] Fallback click took %.0fms", fallback_elapsed)
             return result
 
     async def fill_input(self, locator: str, value: str, timeout: Optional[int] = None) -> bool:
@@ -245,29 +251,69 @@ class BasePage:
         Common verification method for page objects to verify that data has finished loading.
         Waits until data is loaded by checking if the specified locator is visible.
         This method implements the Template Method pattern to avoid code duplication.
-        First checks if a "no data" element is visible (if provided), which is a valid state.
-        If no data element is visible, returns True immediately. Otherwise, continues with
-        normal data load verification.
+        A visible "no data" element (if provided) is also a valid loaded state. Both elements are
+        waited for together, so whichever appears first ends the wait.
         :param str locator: Locator string for the data element to verify.
         :param str tab_name: Tab or page name for error messages (e.g., "Pipelines tab",
             "PipelineRuns tab", "Pipelines Overview page").
         :param str no_data_locator: Optional locator string for the "no data" element.
-            If provided and visible, method returns True immediately (no data is a valid state).
-            Uses a 10-second timeout for this check.
+            If provided and visible, method returns True (no data is a valid state).
         :return: bool: True if data element becomes visible within the timeout, or if no data element is visible.
         :raises AssertionError: With specific message if data does not load within the timeout.
         :raises TimeoutError: If data element doesn't become visible within the timeout.
         """
-        if no_data_locator is not None:
-            try:
-                await self.page.locator(no_data_locator).wait_for(state="visible", timeout=10000)
-                return True
-            except PlaywrightTimeoutError:
-                pass
-
-        if not await self.is_visible(locator):
+        if not await self._wait_for_data_settled(locator, no_data_locator):
             raise AssertionError(
                 f"Data load verification failed for {tab_name}: Data element ({locator}) "
                 f"did not become visible within the timeout."
             )
         return True
+
+    async def _wait_for_data_settled(
+        self, locator: str, no_data_locator: Optional[str] = None, timeout: Optional[int] = None
+    ) -> bool:
+        """
+        Waits for a data container to settle: either the data element or the "no data" element
+        becomes visible, whichever comes first. Both are valid settled states.
+        :param str locator: Locator string for the data element (e.g., the data grid).
+        :param Optional[str] no_data_locator: Optional locator string for the "no data" element.
+        :param Optional[int] timeout: Optional timeout in milliseconds. If not provided, uses the
+            default timeout set on the page.
+        :return: bool: True once the container has settled, False if neither element became visible.
+        """
+        settled_locator = locator if no_data_locator is None else f"{locator}, {no_data_locator}"
+        return await self.is_visible(f"{settled_locator} >> nth=0", timeout=timeout)
+
+    async def is_absent(
+        self,
+        locator: str,
+        container_locator: str,
+        no_data_locator: Optional[str] = None,
+        removal_timeout: int = 0,
+    ) -> bool:
+        """
+        Proves that an element is NOT displayed inside a data container.
+        Waits for the container to settle first (data loaded or "no data" shown), so a slow render
+        cannot produce a false pass, then checks for the element without waiting for a timeout.
+        Use this instead of inverting is_visible(), which burns its whole timeout on every success.
+        :param str locator: The locator string of the element that should be absent.
+        :param str container_locator: Locator string for the data element (e.g., the data grid).
+        :param Optional[str] no_data_locator: Optional locator string for the "no data" element.
+        :param int removal_timeout: Time in milliseconds to wait for a still-displayed element to
+            disappear (e.g., a row that is being deleted). 0 checks once.
+        :return: bool: True if the element is not displayed, False otherwise.
+        :raises AssertionError: If the container does not settle within the default timeout.
+        """
+        if not await self._wait_for_data_settled(container_locator, no_data_locator):
+            raise AssertionError(
+                f"Absence check failed: Data element ({container_locator}) did not become visible within the timeout."
+            )
+        if not await self.page.locator(locator).evaluate_all(_ANY_DISPLAYED_SCRIPT):
+            return True
+        if removal_timeout <= 0:
+            return False
+        try:
+            await self.page.locator(locator).first.wait_for(state="detached", timeout=removal_timeout)
+            return True
+        except PlaywrightTimeoutError:
+            return False
@@ -1,5 +1,7 @@
 """Common reusable UI components for the test framework."""
 
 from .monaco_editor import MonacoEditor
+from .parameter_table import ParameterRecord, ParameterTable
+from .resource_table import ResourceRow, ResourceTable, TableSnapshot
 
-__all__ = ["MonacoEditor"]
+__all__ = ["MonacoEditor", "ParameterRecord", "ParameterTable", "ResourceRow", "ResourceTable", "TableSnapshot"]
@@ -2,15 +2,79 @@
 
 Provides reusable abstraction for modal interactions across all resource types.
 Follows Single Responsibility Principle - handles only modal interactions.
+
+Deletions return a DeletionHandle: instead of sleeping after the confirm click, callers wait
+for the console's DELETE API response and for the modal to detach, and can optionally confirm
+through the CLI that the resource is gone.
 """
 
-from playwright.async_api import Page
+import logging
+from typing import Optional
+
+from playwright.async_api import Page, Response
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
+from framework.cli.openshift_cli import OpenShiftCLI
 from framework.config.config import Config
 from framework.locators.commons import ConfirmationModalLocators
 from framework.ui_components.base_page import BasePage
 
 
+class DeletionHandle:
+    """Tracks a deletion started from the confirmation modal until it has completed."""
+
+    def __init__(self, page: Page, config: Config, resource_name: str, response: Response) -> None:
+        """
+        Initialize Deletion Handle.
+
+        :param page: Playwright page instance
+        :param config: Framework configuration
+        :param resource_name: Name (or generateName prefix) of the resource being deleted
+        :param response: The console's DELETE API response
+        """
+        self.page = page
+        self.config = config
+        self.resource_name = resource_name
+        self.response = response
+        self.status: int = response.status
+        self.logger = logging.getLogger(__name__)
+
+    async def wait(
+        self,
+        openshift_cli: Optional[OpenShiftCLI] = None,
+        kind: Optional[str] = None,
+        namespace: Optional[str] = None,
+    ) -> bool:
+        """
+        Waits for the deletion to complete.
+
+        Checks the DELETE API response and waits for the modal to detach. If openshift_cli and kind
+        are given, additionally waits until the resource no longer exists on the cluster.
+
+        :param Optional[OpenShiftCLI] openshift_cli: Optional CLI wrapper used to confirm absence
+        :param Optional[str] kind: Resource kind for the CLI check (e.g., "pipelinerun")
+        :param Optional[str] namespace: Namespace for the CLI check (uses current if not specified)
+        :return: bool: True if the deletion completed
+        :raises AssertionError: If the API rejects the deletion or the modal does not close
+        """
+        if not self.response.ok:
+            raise AssertionError(f"DELETE API call for '{self.resource_name}' failed with status {self.status}")
+
+        try:
+            await self.page.locator(ConfirmationModalLocators.MODAL_DIALOG).wait_for(
+                state="detached", timeout=self.config.timeout_ms
+            )
+        except PlaywrightTimeoutError:
+            raise AssertionError(f"Confirmation modal did not close after deleting '{self.resource_name}'") from None
+
+        if openshift_cli is not None and kind is not None:
+            return await openshift_cli.wait_for_resource_deleted(
+                kind, self.resource_name, namespace, timeout_seconds=self.config.timeout_ms / 1000
+            )
+        self.logger.info(f"Deletion of '{self.resource_name}' accepted by the API (status {self.status})")
+        return True
+
+
 class ConfirmationModal(BasePage):
     """Shared component for confirmation modals that appear across resource deletion and other actions."""
 
@@ -42,26 +106,45 @@ class ConfirmationModal(BasePage):
         """
         return await self.click_element(self.locators.CANCEL_BUTTON)
 
-    async def confirm_deletion(self, resource_name: str) -> bool:
+    async def start_deletion(self, resource_name: str) -> DeletionHandle:
         """
-        Wait for modal to appear, verify resource name, and confirm deletion.
+        Wait for modal to appear and confirm deletion, without waiting for it to complete.
 
-        :param str resource_name: Name of the resource being deleted (for verification)
-        :return: bool: True if confirmation succeeded
-        :raises AssertionError: If modal does not appear or confirmation fails
+        Returns as soon as the console's DELETE API response arrives; the response listener is
+        registered before the confirm click, so it cannot be missed.
+
+        :param str resource_name: Name of the resource being deleted (or generateName prefix)
+        :return: DeletionHandle: Handle to await the completion of the deletion
+        :raises AssertionError: If modal does not appear, confirmation fails or no DELETE response arrives
         """
         # Wait for modal to appear
         is_visible = await self.is_modal_visible()
         assert is_visible, f"Confirmation modal did not appear for deleting '{resource_name}'"
 
-        # Click confirm button
-        confirmed = await self.click_confirm()
-        assert confirmed, f"Failed to click confirm button for deleting '{resource_name}'"
+        try:
+            async with self.page.expect_response(
+                lambda response: response.request.method == "DELETE" and f"/{resource_name}" in response.url,
+                timeout=self.config.timeout_ms,
+            ) as response_info:
+                # Click confirm button
+                confirmed = await self.click_confirm()
+                assert confirmed, f"Failed to click confirm button for deleting '{resource_name}'"
+        except PlaywrightTimeoutError:
+            raise AssertionError(f"No DELETE API response received for '{resource_name}'") from None
 
-        # Wait for modal to disappear
-        await self.page.wait_for_timeout(1000)  # Brief wait for modal animation
+        return DeletionHandle(self.page, self.config, resource_name, await response_info.value)
 
-        return True
+    async def confirm_deletion(self, resource_name: str) -> bool:
+        """
+        Wait for modal to appear, verify resource name, and confirm deletion.
+        Returns once the DELETE API call has succeeded and the modal has closed.
+
+        :param str resource_name: Name of the resource being deleted (for verification)
+        :return: bool: True if confirmation succeeded
+        :raises AssertionError: If modal does not appear or confirmation fails
+        """
+        handle = await self.start_deletion(resource_name)
+        return await handle.wait()
 
     async def get_modal_text(self) -> str:
         """
@@ -3,6 +3,7 @@ from playwright.async_api import Page
 from framework.config.config import Config
 from framework.locators.commons import LeftNavigationBarLocators
 from framework.ui_components.base_page import BasePage
+from framework.ui_components.console_state import ConsoleState
 
 
 class LeftNavigationBar(BasePage):
@@ -22,7 +23,8 @@ class LeftNavigationBar(BasePage):
     async def is_pipelines_menu_expanded(self) -> bool:
         """
         Checks if the Pipelines menu is currently expanded by reading the aria-expanded attribute.
-        This is much faster than waiting for child elements to appear.
+        This is much faster than waiting for child elements to appear. The result is recorded in
+        the page's ConsoleState.
         :return: bool: True if menu is expanded (aria-expanded="true"), False otherwise.
         """
         import logging
@@ -35,14 +37,18 @@ class LeftNavigationBar(BasePage):
             aria_expanded = await self.page.get_attribute(self.locators.PIPELINES_BUTTON, "aria-expanded")
             elapsed = (time.time() - start_time) * 1000
             is_expanded = aria_expanded == "true"
-            logger.info(
-                f"[PIPELINES EXPAND CHECK] aria-expanded='{aria_expanded}', "
-                f"is_expanded={is_expanded}, took {elapsed:.0f}ms"
+            ConsoleState.for_page(self.page).pipelines_menu_expanded = is_expanded
+            logger.debug(
+                "[PIPELINES EXPAND CHECK] aria-expanded='%s', is_expanded=%s, took %.0fms",
+                aria_expanded,
+                is_expanded,
+                elapsed,
             )
             return is_expanded
         except Exception as e:
             elapsed = (time.time() - start_time) * 1000
             logger.error(f"[PIPELINES EXPAND CHECK] FAILED after {elapsed:.0f}ms - {type(e).__name__}: {str(e)}")
+            ConsoleState.for_page(self.page).pipelines_menu_expanded = None
             return False
 
     async def verify_link_available_under_pipelines_button(self, link_name: str) -> bool:
@@ -78,9 +84,15 @@ class LeftNavigationBar(BasePage):
 
         Performance: ~5s timeout vs 90s, no wait after click.
 
+        A successful click toggles the menu, so a known expansion state in the page's ConsoleState is flipped.
+
         :return: bool: True if click succeeds, False if any click fails or raises TimeoutError.
         """
-        return await self.click_element_fast(self.locators.PIPELINES_BUTTON)
+        clicked = await self.click_element_fast(self.locators.PIPELINES_BUTTON)
+        state = ConsoleState.for_page(self.page)
+        if clicked and state.pipelines_menu_expanded is not None:
+            state.pipelines_menu_expanded = not state.pipelines_menu_expanded
+        return clicked
 
     async def navigate_to_pipelines(self) -> bool:
         """
@@ -0,0 +1,169 @@
+"""
+Parameter Table Component - Bulk reads and writes of console parameter forms.
+
+The Pipeline and PipelineRun Parameters tabs render one row of inputs per parameter
+(name, value or default, description). Reading or filling them one input at a time costs a
+round trip per input, so pipelines with many parameters are slow to verify and edit.
+This component reads the whole form, or fills every input, in a single ``page.evaluate`` call.
+
+Inputs are grouped by their form field name (e.g. ``params.3.default``), so a row with an
+empty value stays aligned with its name.
+
+Design Principles:
+- Single Responsibility: Handles only parameter form reads and writes
+- Composition over Inheritance: Parameter pages compose this component
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List
+
+from playwright.async_api import Page
+
+from framework.config.config import Config
+
+# Reads every parameter input and groups them into rows by the index in the field name.
+_READ_SCRIPT = """
+(fieldSelector) => {
+    const rows = {};
+    document.querySelectorAll(fieldSelector).forEach((input) => {
+        const match = /\\.(\\d+)\\.(\\w+)$/.exec(input.getAttribute('name') || '');
+        if (!match) {
+            return;
+        }
+        const index = Number(match[1]);
+        rows[index] = rows[index] || {};
+        rows[index][match[2]] = input.value;
+    });
+    return Object.keys(rows)
+        .map(Number)
+        .sort((a, b) => a - b)
+        .map((index) => rows[index]);
+}
+"""
+
+# Focuses every given input, sets it through the native value setter, dispatches input/change
+# events and blurs it again, so the React form state (including the touched state, which React
+# updates from the focusout event of a real blur) is updated as if the user had typed the values.
+_WRITE_SCRIPT = """
+([fieldSelector, values]) => {
+    const byName = {};
+    document.querySelectorAll(fieldSelector).forEach((input) => {
+        byName[input.getAttribute('name')] = input;
+    });
+    let written = 0;
+    Object.entries(values).forEach(([name, value]) => {
+        const input = byName[name];
+        if (!input) {
+            return;
+        }
+        const proto = input instanceof HTMLTextAreaElement ? HTMLTextAreaElement : HTMLInputElement;
+        input.focus();
+        Object.getOwnPropertyDescriptor(proto.prototype, 'value').set.call(input, value);
+        input.dispatchEvent(new Event('input', { bubbles: true }));
+        input.dispatchEvent(new Event('change', { bubbles: true }));
+        input.blur();
+        written += 1;
+    });
+    return written;
+}
+"""
+
+
+async def fill_form_fields(page: Page, field_selector: str, values: Dict[str, str]) -> int:
+    """
+    Fills form inputs, addressed by their name attribute, in a single round trip.
+    :param Page page: Playwright page instance.
+    :param str field_selector: Selector matching the candidate inputs.
+    :param Dict[str, str] values: Value keyed by input name attribute (e.g., "params.0.name").
+    :return: int: Number of inputs written; inputs that are not rendered are skipped.
+    """
+    return await page.evaluate(_WRITE_SCRIPT, [field_selector, values])
+
+
+@dataclass(frozen=True)
+class ParameterRecord:
+    """A single parameter row of a console parameter form."""
+
+    name: str
+    value: str = ""
+    description: str = ""
+
+
+class ParameterTable:
+    """
+    Reusable component for the parameter forms of the Pipeline and PipelineRun Parameters tabs.
+    Composed into parameter page objects rather than inherited.
+    """
+
+    def __init__(self, page: Page, config: Config, field_prefix: str, value_field: str = "value") -> None:
+        """
+        Initialize Parameter Table component.
+
+        :param page: Playwright page instance
+        :param config: Framework configuration
+        :param field_prefix: Form field name prefix of the parameter inputs (e.g., "params", "parameters")
+        :param value_field: Field name holding the parameter value (e.g., "value", "default")
+        """
+        self.page = page
+        self.config = config
+        self.field_prefix = field_prefix
+        self.value_field = value_field
+        self.field_selector = f'input[name^="{field_prefix}."], textarea[name^="{field_prefix}."]'
+        self.name_input_selector = f'input[name^="{field_prefix}."][name$=".name"]'
+        self.logger = logging.getLogger(__name__)
+
+    async def read(self) -> List[ParameterRecord]:
+        """
+        Reads all parameter rows in a single round trip.
+        :return: List[ParameterRecord]: Parameter records in display order (empty values included).
+        """
+        raw_rows = await self.page.evaluate(_READ_SCRIPT, self.field_selector)
+        records = [
+            ParameterRecord(
+                name=row.get("name", ""),
+                value=row.get(self.value_field, ""),
+                description=row.get("description", ""),
+            )
+            for row in raw_rows
+        ]
+        self.logger.debug(f"Read {len(records)} parameter rows")
+        return records
+
+    async def row_count(self) -> int:
+        """
+        Returns the number of parameter rows currently rendered.
+        :return: int: Number of rows.
+        """
+        return await self.page.locator(self.name_input_selector).count()
+
+    async def wait_for_row_count(self, count: int) -> bool:
+        """
+        Waits until at least the given number of parameter rows is rendered.
+        :param int count: Minimum number of rows.
+        :return: bool: True once the rows are rendered, raises TimeoutError otherwise.
+        """
+        await self.page.wait_for_function(
+            "([selector, count]) => document.querySelectorAll(selector).length >= count",
+            arg=[self.name_input_selector, count],
+            timeout=self.config.timeout_ms,
+        )
+        return True
+
+    async def write(self, records: List[ParameterRecord], start_index: int = 0) -> int:
+        """
+        Fills name, value and description of consecutive rows in a single round trip.
+        The rows must already be rendered.
+        :param List[ParameterRecord] records: Parameters to write.
+        :param int start_index: Index of the first row to write to.
+        :return: int: Number of inputs written.
+        """
+        values: Dict[str, str] = {}
+        for offset, record in enumerate(records):
+            index = start_index + offset
+            values[f"{self.field_prefix}.{index}.name"] = record.name
+            values[f"{self.field_prefix}.{index}.{self.value_field}"] = record.value
+            values[f"{self.field_prefix}.{index}.description"] = record.description
+        written = await fill_form_fields(self.page, self.field_selector, values)
+        self.logger.debug(f"Wrote {written} parameter inputs for {len(records)} rows")
+        return written
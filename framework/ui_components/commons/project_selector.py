@@ -1,10 +1,21 @@
 import logging
+import re
+from typing import Optional
 
 from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from framework.config.config import Config
 from framework.locators.commons import ProjectSelectorLocators
 from framework.ui_components.base_page import BasePage
+from framework.ui_components.console_router import with_namespace
+from framework.ui_components.console_state import ConsoleState
+from framework.ui_components.console_url_patterns import NAMESPACE_IN_URL
+
+# Upper bound for the selector button to show a newly selected project
+PROJECT_SWITCH_TIMEOUT_MS = 10000
+# How long the opened dropdown gets to render its search box before it is treated as absent
+PROJECT_SEARCH_INPUT_TIMEOUT_MS = 1500
 
 
 class ProjectSelector(BasePage):
@@ -29,10 +40,86 @@ class ProjectSelector(BasePage):
         """
         return await self.is_visible(self.locators.PROJECT_SELECTOR_BUTTON)
 
+    async def switch_project(self, project_name: str) -> bool:
+        """
+        Switches the console to a project, preferring a direct navigation over the dropdown.
+
+        Returns immediately if the current route is already namespaced to the project. Otherwise
+        rewrites the namespace segment of the current route (``/ns/<name>`` or ``/all-namespaces``)
+        and navigates there, then verifies the switch through the project selector button text.
+        Falls back to selecting the project from the dropdown when the current route is not
+        namespaced or the URL switch cannot be verified.
+
+        :param str project_name: Name of the project to switch to
+        :return: bool: True if the project is active, False otherwise
+        """
+        if self.is_cached_project(project_name):
+            self.logger.debug("[SWITCH PROJECT] Already on project '%s', skipping", project_name)
+            return True
+        if await self.switch_project_via_url(project_name):
+            return True
+        self.logger.info("[SWITCH PROJECT] Falling back to the dropdown for project '%s'", project_name)
+        return await self.select_project(project_name)
+
+    def is_cached_project(self, project_name: str) -> bool:
+        """
+        Checks whether the live page route is namespaced to the project (``/ns/<project_name>``).
+        The console's active project follows that segment; all-namespaces and non-namespaced
+        routes are never a match, since the console may show another project (or All Projects) there.
+
+        :param str project_name: Name of the project to check
+        :return: bool: True if the project is known to be active without reading the UI
+        """
+        match = NAMESPACE_IN_URL.search(self.page.url)
+        return match is not None and match.group(1) == project_name
+
+    async def switch_project_via_url(self, project_name: str) -> bool:
+        """
+        Switches to a project by navigating to the current route in the target namespace.
+
+        :param str project_name: Name of the project to switch to
+        :return: bool: True if the selector button shows the project after navigation, False if the
+            current route is not namespaced or the button did not update within the timeout
+        """
+        target_url = with_namespace(self.page.url, project_name)
+        if target_url is None:
+            self.logger.debug("[SWITCH PROJECT] Current route is not namespaced: %s", self.page.url)
+            return False
+
+        await self.page.goto(target_url, wait_until="domcontentloaded")
+        return await self.wait_for_current_project(project_name)
+
+    async def wait_for_current_project(self, project_name: str, timeout: Optional[int] = None) -> bool:
+        """
+        Waits for the project selector button to show the given project (exact match).
+        Records the project as the page's active project (ConsoleState) on success.
+
+        :param str project_name: Expected project name
+        :param Optional[int] timeout: Optional timeout in milliseconds (uses config default if not provided)
+        :return: bool: True if the button shows the project within the timeout, False otherwise
+        """
+        button_text = re.compile(rf"^\s*Project:\s*{re.escape(project_name)}\s*$")
+        try:
+            await (
+                self.page.locator(self.locators.PROJECT_SELECTOR_BUTTON)
+                .filter(has_text=button_text)
+                .wait_for(state="visible", timeout=timeout or self.config.timeout_ms)
+            )
+        except PlaywrightTimeoutError:
+            self.logger.warning(f"[SWITCH PROJECT] Selector button did not show project '{project_name}'")
+            return False
+        ConsoleState.for_page(self.page).project = project_name
+        self.logger.debug("[SWITCH PROJECT] Switched to project '%s'", project_name)
+        return True
+
     async def select_project(self, project_name: str, max_retries: int = 3) -> bool:
         """
         Selects a specific project from the project selector dropdown with retry logic.
 
+        Types the project name into the dropdown's search box first, so only matching projects are
+        rendered and the wait for the menu item does not grow with the number of namespaces.
+        Skips the UI entirely when the current route is already namespaced to the project.
+
         Handles flakiness by:
         - Retrying up to 3 times with increasing waits
         - Explicitly waiting for dropdown menu to appear
@@ -43,83 +130,68 @@ class ProjectSelector(BasePage):
         :param int max_retries: Maximum number of retry attempts (default: 3)
         :return: bool: True if project selected successfully, False otherwise
         """
+        if self.is_cached_project(project_name):
+            self.logger.debug("[SELECT PROJECT] Already on project '%s', skipping", project_name)
+            return True
+
         for attempt in range(1, max_retries + 1):
+            self.logger.debug(
+                "[SELECT PROJECT] Attempt %d/%d: Selecting project '%s'", attempt, max_retries, project_name
+            )
             try:
-                self.logger.info(
-                    f"[SELECT PROJECT] Attempt {attempt}/{max_retries}: Selecting project '{project_name}'"
-                )
-
-                # Click project selector to open dropdown
-                click_success = await self.click_project_selector()
-                if not click_success:
-                    self.logger.warning(f"[SELECT PROJECT] Attempt {attempt}: Failed to click project selector button")
-                    await self.page.wait_for_timeout(1000 * attempt)  # Exponential backoff
-                    continue
-
-                # Wait for dropdown menu to appear (use role=menu as indicator)
-                try:
-                    await self.page.wait_for_selector("role=menu", state="visible", timeout=5000)
-                    self.logger.info(f"[SELECT PROJECT] Attempt {attempt}: Dropdown menu appeared")
-                except Exception as menu_error:
-                    self.logger.warning(
-                        f"[SELECT PROJECT] Attempt {attempt}: Dropdown menu did not appear: {menu_error}"
-                    )
-                    await self.page.wait_for_timeout(1000 * attempt)
-                    continue
-
-                # Wait for the specific project menu item to be visible
-                project_locator = self.locators.PROJECT_MENU_ITEM.format(project_name=project_name)
-                try:
-                    await self.page.wait_for_selector(project_locator, state="visible", timeout=5000)
-                    self.logger.info(
-                        f"[SELECT PROJECT] Attempt {attempt}: Project menu item '{project_name}' is visible"
-                    )
-                except Exception as item_error:
-                    self.logger.warning(
-                        f"[SELECT PROJECT] Attempt {attempt}: Project menu item '{project_name}' "
-                        f"not found: {item_error}"
-                    )
-                    # Close dropdown by clicking elsewhere and retry
-                    await self.page.keyboard.press("Escape")
-                    await self.page.wait_for_timeout(1000 * attempt)
-                    continue
-
-                # Click the project menu item
-                click_item_success = await self.click_element(project_locator)
-                if not click_item_success:
-                    self.logger.warning(
-                        f"[SELECT PROJECT] Attempt {attempt}: Failed to click project menu item '{project_name}'"
-                    )
-                    await self.page.wait_for_timeout(1000 * attempt)
-                    continue
-
-                # Wait for page to reload with new project context
-                await self.page.wait_for_timeout(2000)
-
-                # Verify project was actually switched by checking the button text
-                current_project = await self.get_current_project()
-                if current_project == project_name:
-                    self.logger.info(
-                        f"[SELECT PROJECT] Attempt {attempt}: Successfully switched to project '{project_name}'"
-                    )
+                if await self._select_from_dropdown(project_name, attempt):
                     return True
-                else:
-                    self.logger.warning(
-                        f"[SELECT PROJECT] Attempt {attempt}: Expected project '{project_name}' but "
-                        f"current project is '{current_project}'"
-                    )
-                    await self.page.wait_for_timeout(1000 * attempt)
-                    continue
-
             except Exception as e:
                 self.logger.error(f"[SELECT PROJECT] Attempt {attempt}: Unexpected error: {e}")
-                await self.page.wait_for_timeout(1000 * attempt)
-                continue
+            await self.page.wait_for_timeout(1000 * attempt)  # Increasing backoff
 
         # All retries exhausted
         self.logger.error(f"[SELECT PROJECT] Failed to select project '{project_name}' after {max_retries} attempts")
         return False
 
+    async def _select_from_dropdown(self, project_name: str, attempt: int) -> bool:
+        """
+        Opens the dropdown, filters it by the project name and clicks the matching menu item.
+
+        :param str project_name: Name of the project to select
+        :param int attempt: Attempt number (for logging)
+        :return: bool: True if the selector button shows the project afterwards, False otherwise
+        """
+        # Click project selector to open dropdown
+        await self.click_project_selector()
+
+        # Wait for dropdown menu to appear (use role=menu as indicator)
+        try:
+            await self.page.wait_for_selector("role=menu", state="visible", timeout=5000)
+        except PlaywrightTimeoutError as menu_error:
+            self.logger.warning(f"[SELECT PROJECT] Attempt {attempt}: Dropdown menu did not appear: {menu_error}")
+            return False
+
+        # Narrow the menu to matching projects (the search box is absent on small clusters in some versions)
+        search_input = self.page.locator(self.locators.PROJECT_SEARCH_INPUT)
+        try:
+            await search_input.wait_for(state="visible", timeout=PROJECT_SEARCH_INPUT_TIMEOUT_MS)
+            await search_input.fill(project_name)
+        except PlaywrightTimeoutError:
+            self.logger.debug(f"[SELECT PROJECT] Attempt {attempt}: No search box, scanning the full project list")
+
+        # Wait for the specific project menu item to be visible
+        project_locator = self.locators.PROJECT_MENU_ITEM.format(project_name=project_name)
+        try:
+            await self.page.wait_for_selector(project_locator, state="visible", timeout=5000)
+        except PlaywrightTimeoutError as item_error:
+            self.logger.warning(
+                f"[SELECT PROJECT] Attempt {attempt}: Project menu item '{project_name}' not found: {item_error}"
+            )
+            # Close dropdown before retrying
+            await self.page.keyboard.press("Escape")
+            return False
+
+        await self.click_element(project_locator)
+
+        # Verify project was actually switched by checking the button text
+        return await self.wait_for_current_project(project_name, timeout=PROJECT_SWITCH_TIMEOUT_MS)
+
     async def get_current_project(self) -> str:
         """
         Gets the current selected project name from the project selector button text.
@@ -0,0 +1,470 @@
+"""
+Resource Table Component - Bulk row extraction for console list pages.
+
+The console renders resource lists (Pipelines, PipelineRuns, Tasks, TaskRuns, ...) in a
+virtualized data grid. Reading one row at a time costs a selector wait plus several
+``query_selector`` round trips per cell. This component reads every rendered row in a single
+``page.evaluate`` call and returns typed records that can be filtered in memory.
+
+Design Principles:
+- Single Responsibility: Handles only table row extraction
+- Composition over Inheritance: List pages compose this component
+- One round trip per snapshot: all DOM reads happen inside the browser
+
+Large namespaces: the grid only renders rows inside the viewport, so a row that is not rendered
+is not necessarily absent. ``find`` narrows the list with the console's name filter (typed into
+the search box or passed as the ``name`` URL query parameter) and falls back to scrolling the
+grid window by window, de-duplicating rows across windows.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, List, Mapping, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from framework.config.config import Config
+
+# Reads header labels and every rendered resource row in one pass.
+# Cells are keyed by their column header text so callers do not depend on column order,
+# which differs between tabs (e.g. PipelineRuns vs TaskRuns) and console versions.
+_SNAPSHOT_SCRIPT = """
+([gridSelector, rowSelector]) => {
+    const grid = document.querySelector(gridSelector);
+    const root = grid && grid.querySelector(rowSelector) ? grid : document;
+    const headerCells = Array.from(
+        document.querySelectorAll('thead th, [role="columnheader"]')
+    );
+    const headers = [];
+    headerCells.forEach((th) => {
+        const label = (th.innerText || th.textContent || '').trim();
+        if (!headers.includes(label)) {
+            headers.push(label);
+        }
+    });
+
+    const rows = Array.from(root.querySelectorAll(rowSelector));
+    return rows.map((row) => {
+        const cells = Array.from(row.querySelectorAll('td'));
+        const values = {};
+        cells.forEach((cell, index) => {
+            const label = cell.getAttribute('data-label') || headers[index] || `column-${index}`;
+            values[label] = (cell.innerText || cell.textContent || '').trim();
+        });
+
+        const nameCell = cells[0] || row;
+        const nameLink = nameCell.querySelector('[data-test-id]') || nameCell.querySelector('a');
+        const statusEl =
+            row.querySelector("[data-test='status-text']") || row.querySelector('.pf-c-label__content');
+
+        return {
+            name: nameLink
+                ? (nameLink.getAttribute('data-test-id') || nameLink.textContent || '').trim()
+                : (cells[0] ? (cells[0].textContent || '').trim() : ''),
+            status: statusEl ? (statusEl.textContent || '').trim() : (values['Status'] || ''),
+            cells: values,
+        };
+    });
+}
+"""
+
+
+# Scrolls the grid's scroll container by one window and waits two animation frames so that
+# ReactVirtualized renders the rows of the new window before the next snapshot is taken.
+# The console uses a WindowScroller, so the scroll container is usually an ancestor of the grid.
+_SCROLL_WINDOW_SCRIPT = """
+async ([gridSelector, toTop]) => {
+    const grid = document.querySelector(gridSelector);
+    let el = grid ? grid.parentElement : null;
+    while (el && el !== document.body) {
+        const style = getComputedStyle(el);
+        if (/(auto|scroll)/.test(style.overflowY) && el.scrollHeight > el.clientHeight) {
+            break;
+        }
+        el = el.parentElement;
+    }
+    const scroller = el && el !== document.body
+        ? el
+        : (document.getElementById('content-scrollable') || document.scrollingElement);
+    const before = scroller.scrollTop;
+    scroller.scrollTop = toTop ? 0 : before + Math.max(Math.floor(scroller.clientHeight * 0.9), 1);
+    await new Promise((resolve) => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+    return scroller.scrollTop !== before;
+}
+"""
+
+# The console's list filter mirrors the search box into the URL query string
+_FILTER_APPLIED_SCRIPT = """
+([param, text]) => (new URLSearchParams(window.location.search).get(param) || '') === text
+"""
+
+# Name filter query parameter used by the console list pages (e.g. ?name=simple-pipelinerun-)
+NAME_FILTER_PARAM = "name"
+
+# Upper bound for waiting on the console to apply a typed filter
+FILTER_SETTLE_TIMEOUT_MS = 3000
+
+# Safety limit for scroll scanning (each window is roughly one viewport of rows)
+MAX_SCROLL_WINDOWS = 200
+
+
+@dataclass(frozen=True)
+class ResourceRow:
+    """
+    Typed record for one rendered row of a console resource list.
+
+    Columns that a tab does not render (e.g. ``duration`` on the Tasks tab) are empty strings.
+    ``cells`` keeps the raw text of every column keyed by header label, as a read-only mapping
+    that is left out of the row's hash.
+    """
+
+    name: str
+    status: str = ""
+    task_status: str = ""
+    started: str = ""
+    duration: str = ""
+    namespace: str = ""
+    cells: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}), hash=False)
+
+    def matches(self, name_or_prefix: str) -> bool:
+        """
+        Checks whether this row belongs to the given resource name.
+        Names ending with "-" are treated as a ``generateName`` prefix (e.g. "simple-pipelinerun-"),
+        all other names require an exact match.
+        :param str name_or_prefix: Exact resource name or generateName prefix.
+        :return: bool: True if the row name matches.
+        """
+        if name_or_prefix.endswith("-"):
+            return self.name.startswith(name_or_prefix)
+        return self.name == name_or_prefix
+
+
+@dataclass(frozen=True)
+class TableSnapshot:
+    """
+    Immutable snapshot of all rows rendered in a resource list at the time it was taken.
+    All lookups are in-memory; take a new snapshot to observe changes in the console.
+    """
+
+    rows: List[ResourceRow] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def names(self) -> List[str]:
+        """
+        Returns the names of all rows in display order.
+        :return: List[str]: Row names.
+        """
+        return [row.name for row in self.rows]
+
+    def find(self, name_or_prefix: str) -> Optional[ResourceRow]:
+        """
+        Returns the first row matching an exact name or generateName prefix.
+        :param str name_or_prefix: Exact resource name or generateName prefix (ending with "-").
+        :return: Optional[ResourceRow]: Matching row, or None if not present.
+        """
+        return next((row for row in self.rows if row.matches(name_or_prefix)), None)
+
+    def find_all(self, name_or_prefix: str) -> List[ResourceRow]:
+        """
+        Returns every row matching an exact name or generateName prefix.
+        :param str name_or_prefix: Exact resource name or generateName prefix (ending with "-").
+        :return: List[ResourceRow]: Matching rows in display order.
+        """
+        return [row for row in self.rows if row.matches(name_or_prefix)]
+
+    def contains(self, name_or_prefix: str) -> bool:
+        """
+        Checks whether at least one row matches the given name or prefix.
+        :param str name_or_prefix: Exact resource name or generateName prefix (ending with "-").
+        :return: bool: True if a matching row exists.
+        """
+        return self.find(name_or_prefix) is not None
+
+    def statuses(self) -> Dict[str, str]:
+        """
+        Returns a name -> status mapping for all rows.
+        :return: Dict[str, str]: Status text keyed by row name.
+        """
+        return {row.name: row.status for row in self.rows}
+
+
+class ResourceTable:
+    """
+    Handles bulk reads of the console's virtualized resource tables.
+
+    Usage:
+        table = ResourceTable(page, config, grid_selector="table.ReactVirtualized__VirtualGrid")
+        snapshot = await table.snapshot()
+        row = snapshot.find("simple-pipelinerun-")
+        status = row.status if row else ""
+    """
+
+    ROW_SELECTOR = 'tr[data-test-rows="resource-row"]'
+
+    # Column header labels mapped onto ResourceRow fields
+    COLUMN_FIELDS = {
+        "Status": "status",
+        "Task status": "task_status",
+        "Started": "started",
+        "Duration": "duration",
+        "Namespace": "namespace",
+    }
+
+    # Strategies supported by find()
+    STRATEGY_FILTER = "filter"
+    STRATEGY_URL = "url"
+    STRATEGY_SCROLL = "scroll"
+
+    def __init__(
+        self,
+        page: Page,
+        config: Config,
+        grid_selector: str,
+        search_selector: Optional[str] = None,
+        no_data_selector: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize Resource Table component.
+
+        :param page: Playwright page instance
+        :param config: Framework configuration
+        :param grid_selector: Selector of the data grid that holds the resource rows
+        :param search_selector: Optional selector of the 'Search by name...' input used for filtering
+        :param no_data_selector: Optional selector of the empty-list message
+        """
+        self.page = page
+        self.config = config
+        self.grid_selector = grid_selector
+        self.search_selector = search_selector
+        self.no_data_selector = no_data_selector
+        self.logger = logging.getLogger(__name__)
+
+    async def snapshot(self) -> TableSnapshot:
+        """
+        Reads every rendered row of the resource table in a single browser round trip.
+        Does not wait for the grid; callers should run the page's ``verify_data_load`` first.
+        :return: TableSnapshot: Typed records for all rendered rows (empty if no rows are rendered).
+        """
+        raw_rows = await self.page.evaluate(_SNAPSHOT_SCRIPT, [self.grid_selector, self.ROW_SELECTOR])
+        rows = [self._to_row(raw) for raw in raw_rows or []]
+        self.logger.debug(f"Table snapshot captured {len(rows)} rows")
+        return TableSnapshot(rows=rows)
+
+    def _to_row(self, raw: Dict[str, object]) -> ResourceRow:
+        """
+        Converts the raw dictionary returned by the snapshot script into a ResourceRow.
+        :param Dict[str, object] raw: Raw row data with 'name', 'status' and 'cells'.
+        :return: ResourceRow: Typed row record.
+        """
+        cells = dict(raw.get("cells") or {})
+        values = {attr: cells.get(label, "") for label, attr in self.COLUMN_FIELDS.items()}
+        if raw.get("status"):
+            values["status"] = str(raw["status"])
+        return ResourceRow(name=str(raw.get("name") or ""), cells=MappingProxyType(cells), **values)
+
+    # ==================== Scanning Methods ====================
+
+    async def wait_for_data(self, timeout: Optional[int] = None) -> bool:
+        """
+        Waits until the grid or the empty-list message is visible, whichever comes first.
+        :param Optional[int] timeout: Optional timeout in milliseconds (uses config default if not provided)
+        :return: bool: True once the list has settled.
+        :raises TimeoutError: If neither element becomes visible within the timeout.
+        """
+        selector = self.grid_selector
+        if self.no_data_selector:
+            selector = f"{self.grid_selector}, {self.no_data_selector}"
+        await self.page.locator(selector).first.wait_for(state="visible", timeout=timeout or self.config.timeout_ms)
+        return True
+
+    async def find(
+        self, name_or_prefix: str, strategy: str = STRATEGY_FILTER, wait_ms: int = 0
+    ) -> Optional[ResourceRow]:
+        """
+        Locates a row in a (possibly virtualized) list without relying on it being rendered.
+
+        Strategies:
+        - "filter": types the name into the search box; a filtered list with no match proves absence
+        - "url": reloads the list with the ``name`` query parameter set
+        The list is unfiltered again (search box cleared, or the previous URL restored) before returning.
+        - "scroll": scrolls the grid window by window, de-duplicating rows across windows
+        "filter" falls back to "scroll" when the page has no search box.
+
+        :param str name_or_prefix: Exact resource name or generateName prefix (ending with "-").
+        :param str strategy: One of "filter", "url" or "scroll".
+        :param int wait_ms: If > 0 and no row matches, waits up to this long for a matching row to be
+            rendered in the narrowed list (for resources that were just created).
+        :return: Optional[ResourceRow]: The matching row, or None if the resource is not listed.
+        :raises PlaywrightTimeoutError: If the console did not apply the name filter.
+        """
+        if strategy == self.STRATEGY_FILTER and not self.search_selector:
+            strategy = self.STRATEGY_SCROLL
+
+        if strategy == self.STRATEGY_SCROLL:
+            return await self.scan(name_or_prefix)
+
+        unfiltered_url = self.page.url
+        try:
+            if strategy == self.STRATEGY_URL:
+                snapshot = await self.filter_via_url(name_or_prefix)
+            else:
+                snapshot = await self.filter_by_name(name_or_prefix)
+            row = snapshot.find(name_or_prefix) or await self._wait_for_row(name_or_prefix, wait_ms)
+        except Exception:
+            # Never leave the list filtered for the next step, without masking the original error
+            await self._clear_name_filter(strategy, unfiltered_url, quiet=True)
+            raise
+        await self._clear_name_filter(strategy, unfiltered_url)
+        return row
+
+    async def _clear_name_filter(self, strategy: str, unfiltered_url: str, quiet: bool = False) -> None:
+        """
+        Removes the name filter that find applied, so the next step sees the whole list.
+        :param str strategy: Strategy that applied the filter ("filter" or "url").
+        :param str unfiltered_url: List URL before the filter was applied (restored for "url").
+        :param bool quiet: Log a failure instead of raising it (while another error is being raised).
+        :return: None
+        :raises PlaywrightTimeoutError: If the filter could not be cleared and quiet is False.
+        """
+        try:
+            if strategy == self.STRATEGY_URL:
+                await self.page.goto(unfiltered_url)
+                await self.wait_for_data()
+            else:
+                await self.filter_by_name("")
+        except PlaywrightTimeoutError as e:
+            if not quiet:
+                raise
+            self.logger.warning(f"Failed to clear the name filter: {e}")
+
+    async def filter_by_name(self, text: str) -> TableSnapshot:
+        """
+        Types text into the search box and returns a snapshot once the console has applied the filter.
+        An empty string clears the filter.
+        :param str text: Filter text.
+        :return: TableSnapshot: Rows rendered for the filtered list.
+        :raises PlaywrightTimeoutError: If the console did not apply the filter in time.
+        """
+        await self.page.locator(self.search_selector).fill(text)
+        await self._wait_for_filter_applied(text)
+        return await self.snapshot()
+
+    async def filter_via_url(self, text: str) -> TableSnapshot:
+        """
+        Navigates to the current list URL with the ``name`` query parameter set, so the list is
+        narrowed before it is rendered.
+        :param str text: Filter text.
+        :return: TableSnapshot: Rows rendered for the filtered list.
+        """
+        await self.page.goto(with_query_param(self.page.url, NAME_FILTER_PARAM, text))
+        await self.wait_for_data()
+        return await self.snapshot()
+
+    async def scan(self, name_or_prefix: str, max_windows: int = MAX_SCROLL_WINDOWS) -> Optional[ResourceRow]:
+        """
+        Scrolls through the list window by window until a matching row is rendered.
+        :param str name_or_prefix: Exact resource name or generateName prefix (ending with "-").
+        :param int max_windows: Maximum number of scroll windows to inspect.
+        :return: Optional[ResourceRow]: The matching row, or None once the end of the list is reached.
+        """
+        async for snapshot in self._windows(max_windows):
+            row = snapshot.find(name_or_prefix)
+            if row is not None:
+                return row
+        return None
+
+    async def collect_all(self, max_windows: int = MAX_SCROLL_WINDOWS) -> TableSnapshot:
+        """
+        Scrolls through the whole list and returns every row, de-duplicated by name across windows.
+        :param int max_windows: Maximum number of scroll windows to inspect.
+        :return: TableSnapshot: All rows in first-seen order.
+        """
+        seen: Dict[str, ResourceRow] = {}
+        async for snapshot in self._windows(max_windows):
+            for row in snapshot.rows:
+                seen.setdefault(row.name, row)
+        return TableSnapshot(rows=list(seen.values()))
+
+    async def collect_rows(self, name_filter: Optional[str] = None) -> TableSnapshot:
+        """
+        Reads every row of the list, including rows outside the rendered window of the virtualized
+        grid. The name filter, if given, narrows the list first and is cleared again afterwards.
+        Does not wait for the grid; callers should run the page's ``verify_data_load`` first.
+        :param Optional[str] name_filter: Optional text for the name filter (needs a search box).
+        :return: TableSnapshot: All rows of the (filtered) list in display order.
+        """
+        if name_filter:
+            await self.filter_by_name(name_filter)
+        try:
+            return await self.collect_all()
+        finally:
+            if name_filter:
+                await self.filter_by_name("")
+
+    async def _windows(self, max_windows: int) -> AsyncIterator[TableSnapshot]:
+        """
+        Yields one snapshot per scroll window, starting from the top of the list.
+        Stops when the scroll position no longer changes (end of list) or max_windows is reached.
+        :param int max_windows: Maximum number of windows to yield.
+        :return: AsyncIterator[TableSnapshot]: Snapshot of each window.
+        """
+        await self.page.evaluate(_SCROLL_WINDOW_SCRIPT, [self.grid_selector, True])
+        for window in range(max_windows):
+            yield await self.snapshot()
+            moved = await self.page.evaluate(_SCROLL_WINDOW_SCRIPT, [self.grid_selector, False])
+            if not moved:
+                self.logger.debug(f"Reached end of list after {window + 1} windows")
+                return
+
+    async def _wait_for_filter_applied(self, text: str) -> None:
+        """
+        Waits for the console to mirror the filter text into the URL, which happens in the same
+        update that re-renders the list. A snapshot taken before that would read the unfiltered list.
+        :param str text: Filter text that was typed.
+        :return: None
+        :raises PlaywrightTimeoutError: If the URL does not reflect the filter in time.
+        """
+        try:
+            await self.page.wait_for_function(
+                _FILTER_APPLIED_SCRIPT, arg=[NAME_FILTER_PARAM, text], timeout=FILTER_SETTLE_TIMEOUT_MS
+            )
+        except PlaywrightTimeoutError as e:
+            raise PlaywrightTimeoutError(
+                f"Name filter '{text}' was not applied to the list within {FILTER_SETTLE_TIMEOUT_MS}ms: {e}"
+            ) from e
+
+    async def _wait_for_row(self, name_or_prefix: str, wait_ms: int) -> Optional[ResourceRow]:
+        """
+        Waits for a row containing the name to be rendered, then re-reads the table.
+        :param str name_or_prefix: Exact resource name or generateName prefix.
+        :param int wait_ms: Timeout in milliseconds; 0 does not wait.
+        :return: Optional[ResourceRow]: The matching row, or None if it did not appear in time.
+        """
+        if wait_ms <= 0:
+            return None
+        row_locator = f'{self.ROW_SELECTOR}:has-text("{name_or_prefix}")'
+        try:
+            await self.page.locator(row_locator).first.wait_for(state="visible", timeout=wait_ms)
+        except PlaywrightTimeoutError:
+            return None
+        return (await self.snapshot()).find(name_or_prefix)
+
+
+def with_query_param(url: str, param: str, value: str) -> str:
+    """
+    Returns the URL with one query parameter set (or removed when value is empty).
+    :param str url: Source URL.
+    :param str param: Query parameter name.
+    :param str value: Query parameter value.
+    :return: str: URL with the updated query string.
+    """
+    parts = urlsplit(url)
+    query = [(key, val) for key, val in parse_qsl(parts.query, keep_blank_values=True) if key != param]
+    if value:
+        query.append((param, value))
+    return urlunsplit(parts._replace(query=urlencode(query)))
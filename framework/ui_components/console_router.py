@@ -0,0 +1,237 @@
+"""
+Console Router - Direct-URL navigation built on the console URL patterns.
+
+Builds concrete console URLs (namespace, kind, name, tab) and opens them with a single
+``page.goto`` instead of clicking through the left navigation bar and tabs. Every built URL is
+checked against the compiled pattern in ``console_url_patterns`` that the target page object
+verifies itself with, so routes and page verification cannot drift apart.
+
+Click-through navigation stays available as an explicit mode (``MODE_CLICK``) for tests that
+exercise the navigation bar itself.
+"""
+
+import logging
+import re
+from typing import Dict, Optional, Pattern, Tuple
+from urllib.parse import urljoin
+
+from playwright.async_api import Page
+
+from framework.config.config import Config
+from framework.ui_components.base_page import BasePage
+from framework.ui_components.commons.left_navigation_bar import LeftNavigationBar
+from framework.ui_components.console_url_patterns import (
+    EVENTLISTENER_DETAILS_URL,
+    EVENTLISTENER_YAML_URL,
+    NAMESPACE_IN_URL,
+    PIPELINE_BUILDER_URL,
+    PIPELINE_DETAILS_URL,
+    PIPELINE_PARAMETERS_URL,
+    PIPELINE_PIPELINERUNS_TAB_URL,
+    PIPELINE_YAML_URL,
+    PIPELINERUN_DETAILS_URL,
+    PIPELINERUN_LOGS_URL,
+    PIPELINERUN_PARAMETERS_URL,
+    PIPELINERUN_TASKRUNS_URL,
+    PIPELINERUN_YAML_URL,
+    PIPELINES_NS_URL,
+    PIPELINES_OVERVIEW_URL,
+    TASK_DETAILS_URL,
+    TASK_YAML_URL,
+    TASKS_URL,
+    TRIGGERBINDING_DETAILS_URL,
+    TRIGGERBINDING_YAML_URL,
+    TRIGGERS_URL,
+    TRIGGERTEMPLATE_DETAILS_URL,
+    TRIGGERTEMPLATE_YAML_URL,
+)
+
+# Namespace part of a console route, namespaced or all-namespaces
+NAMESPACE_SEGMENT = re.compile(r"/(?:ns/[^/?#]+|all-namespaces)(?=[/?#]|$)")
+
+# Top-level sections reachable from the left navigation bar: section -> (path, pattern)
+SECTIONS: Dict[str, Tuple[str, Pattern[str]]] = {
+    "overview": ("pipelines-overview", PIPELINES_OVERVIEW_URL),
+    "pipelines": ("pipelines", PIPELINES_NS_URL),
+    "tasks": ("tasks", TASKS_URL),
+    "triggers": ("triggers", TRIGGERS_URL),
+}
+
+# Resource kinds and their console model reference (group~version~Kind)
+RESOURCE_KINDS: Dict[str, str] = {
+    "Pipeline": "tekton.dev~v1~Pipeline",
+    "PipelineRun": "tekton.dev~v1~PipelineRun",
+    "Task": "tekton.dev~v1~Task",
+    "TaskRun": "tekton.dev~v1~TaskRun",
+    "EventListener": "triggers.tekton.dev~v1beta1~EventListener",
+    "TriggerTemplate": "triggers.tekton.dev~v1beta1~TriggerTemplate",
+    "TriggerBinding": "triggers.tekton.dev~v1beta1~TriggerBinding",
+}
+
+# Pattern each resource page verifies itself with: (kind, tab) -> pattern. Tab None is the details page.
+RESOURCE_PATTERNS: Dict[Tuple[str, Optional[str]], Pattern[str]] = {
+    ("Pipeline", None): PIPELINE_DETAILS_URL,
+    ("Pipeline", "yaml"): PIPELINE_YAML_URL,
+    ("Pipeline", "parameters"): PIPELINE_PARAMETERS_URL,
+    ("Pipeline", "Runs"): PIPELINE_PIPELINERUNS_TAB_URL,
+    ("Pipeline", "builder"): PIPELINE_BUILDER_URL,
+    ("PipelineRun", None): PIPELINERUN_DETAILS_URL,
+    ("PipelineRun", "yaml"): PIPELINERUN_YAML_URL,
+    ("PipelineRun", "parameters"): PIPELINERUN_PARAMETERS_URL,
+    ("PipelineRun", "logs"): PIPELINERUN_LOGS_URL,
+    ("PipelineRun", "task-runs"): PIPELINERUN_TASKRUNS_URL,
+    ("Task", None): TASK_DETAILS_URL,
+    ("Task", "yaml"): TASK_YAML_URL,
+    ("EventListener", None): EVENTLISTENER_DETAILS_URL,
+    ("EventListener", "yaml"): EVENTLISTENER_YAML_URL,
+    ("TriggerTemplate", None): TRIGGERTEMPLATE_DETAILS_URL,
+    ("TriggerTemplate", "yaml"): TRIGGERTEMPLATE_YAML_URL,
+    ("TriggerBinding", None): TRIGGERBINDING_DETAILS_URL,
+    ("TriggerBinding", "yaml"): TRIGGERBINDING_YAML_URL,
+}
+
+
+def with_namespace(url: str, namespace: str) -> Optional[str]:
+    """
+    Rewrites the namespace segment of a console URL (``/ns/<name>`` or ``/all-namespaces``).
+    :param str url: Console URL.
+    :param str namespace: Namespace to switch to.
+    :return: Optional[str]: The rewritten URL, or None if the route has no namespace segment.
+    """
+    rewritten, count = NAMESPACE_SEGMENT.subn(f"/ns/{namespace}", url, count=1)
+    return rewritten if count else None
+
+
+class ConsoleRouter(BasePage):
+    """Navigates to console pages by URL, or through the left navigation bar when asked to."""
+
+    MODE_DIRECT = "direct"
+    MODE_CLICK = "click"
+
+    def __init__(self, page: Page, config: Config) -> None:
+        super().__init__(page, config)
+        self.nav = LeftNavigationBar(page, config)
+        self.logger = logging.getLogger(__name__)
+
+    def current_namespace(self) -> Optional[str]:
+        """
+        Returns the namespace of the page currently displayed, if the URL is namespaced.
+        :return: Optional[str]: Namespace name, or None for all-namespaces and non-namespaced pages.
+        """
+        match = NAMESPACE_IN_URL.search(self.page.url)
+        return match.group(1) if match else None
+
+    def section_url(self, section: str, namespace: Optional[str] = None, tab: Optional[str] = None) -> str:
+        """
+        Builds the URL of a top-level section (e.g., Pipelines list) or one of its list tabs.
+        :param str section: Section name ("overview", "pipelines", "tasks", "triggers").
+        :param Optional[str] namespace: Namespace to open; None opens all namespaces.
+        :param Optional[str] tab: Optional list tab path (e.g., "pipeline-runs", "task-runs").
+        :return: str: Absolute console URL.
+        :raises AssertionError: If the section is unknown or the URL does not match the section pattern.
+        """
+        if section not in SECTIONS:
+            raise AssertionError(f"Unknown console section '{section}'. Valid options: {list(SECTIONS.keys())}")
+        path, pattern = SECTIONS[section]
+        path = f"{path}/ns/{namespace}" if namespace else f"{path}/all-namespaces"
+        if tab:
+            path = f"{path}/{tab}"
+        return self._to_url(path, pattern)
+
+    def resource_url(self, kind: str, name: str, namespace: str, tab: Optional[str] = None) -> str:
+        """
+        Builds the URL of a resource details page or one of its tabs.
+        :param str kind: Resource kind (e.g., "Pipeline", "PipelineRun", "EventListener").
+        :param str name: Resource name ("~new" for create pages).
+        :param str namespace: Namespace of the resource.
+        :param Optional[str] tab: Optional tab path (e.g., "yaml", "logs", "parameters").
+        :return: str: Absolute console URL.
+        :raises AssertionError: If the kind is unknown or the URL does not match the page pattern.
+        """
+        if kind not in RESOURCE_KINDS:
+            raise AssertionError(f"Unknown resource kind '{kind}'. Valid options: {list(RESOURCE_KINDS.keys())}")
+        path = f"k8s/ns/{namespace}/{RESOURCE_KINDS[kind]}/{name}"
+        if tab:
+            path = f"{path}/{tab}"
+        return self._to_url(path, RESOURCE_PATTERNS.get((kind, tab)))
+
+    async def open_section(
+        self, section: str, namespace: Optional[str] = None, tab: Optional[str] = None, mode: str = MODE_DIRECT
+    ) -> bool:
+        """
+        Opens a top-level section. Direct mode keeps the namespace of the current page by default,
+        just like the navigation bar links do.
+        :param str section: Section name ("overview", "pipelines", "tasks", "triggers").
+        :param Optional[str] namespace: Namespace to open (defaults to the current page's namespace).
+        :param Optional[str] tab: Optional list tab path (direct mode only).
+        :param str mode: MODE_DIRECT (page.goto) or MODE_CLICK (left navigation bar).
+        :return: bool: True once the URL matches the section pattern.
+        """
+        if mode == self.MODE_CLICK:
+            return await self._click_through(section)
+        url = self.section_url(section, namespace or self.current_namespace(), tab)
+        return await self._goto(url, SECTIONS[section][1])
+
+    async def open_resource(
+        self, kind: str, name: str, namespace: Optional[str] = None, tab: Optional[str] = None
+    ) -> bool:
+        """
+        Opens a resource page (e.g., a PipelineRun's logs tab) with a single navigation.
+        :param str kind: Resource kind (e.g., "PipelineRun").
+        :param str name: Resource name.
+        :param Optional[str] namespace: Namespace (defaults to the current page's namespace).
+        :param Optional[str] tab: Optional tab path (e.g., "logs").
+        :return: bool: True once the URL matches the page pattern.
+        :raises AssertionError: If no namespace is given and the current page is not namespaced.
+        """
+        namespace = namespace or self.current_namespace()
+        if not namespace:
+            raise AssertionError(f"Cannot open {kind} '{name}': no namespace given and current page is not namespaced")
+        url = self.resource_url(kind, name, namespace, tab)
+        return await self._goto(url, RESOURCE_PATTERNS.get((kind, tab)))
+
+    def _to_url(self, path: str, pattern: Optional[Pattern[str]]) -> str:
+        """
+        Joins a console path onto the base URL and checks it against the page pattern.
+        :param str path: Console path without leading slash.
+        :param Optional[Pattern[str]] pattern: Pattern the target page verifies itself with.
+        :return: str: Absolute console URL.
+        :raises AssertionError: If the URL does not match the pattern.
+        """
+        url = urljoin(self.config.base_url.rstrip("/") + "/", path)
+        if pattern is not None and not pattern.search(url):
+            raise AssertionError(f"Built URL {url} does not match page pattern {pattern.pattern!r}")
+        return url
+
+    async def _goto(self, url: str, pattern: Optional[Pattern[str]]) -> bool:
+        """
+        Navigates to the URL and waits until the console reports it (redirects included).
+        :param str url: Absolute console URL.
+        :param Optional[Pattern[str]] pattern: Pattern to wait for; None skips the check.
+        :return: bool: True if navigation succeeds.
+        """
+        self.logger.info("Navigating directly to %s", url)
+        await self.page.goto(url, wait_until="domcontentloaded")
+        if pattern is not None:
+            await self.wait_for_url_matching(pattern)
+        return True
+
+    async def _click_through(self, section: str) -> bool:
+        """
+        Opens a section through the left navigation bar, expanding the Pipelines menu if needed.
+        :param str section: Section name ("overview", "pipelines", "tasks", "triggers").
+        :return: bool: True once the URL matches the section pattern.
+        """
+        navigate = {
+            "overview": self.nav.navigate_to_overview,
+            "pipelines": self.nav.navigate_to_pipelines,
+            "tasks": self.nav.navigate_to_tasks,
+            "triggers": self.nav.navigate_to_triggers,
+        }
+        if section not in navigate:
+            raise AssertionError(f"Unknown console section '{section}'. Valid options: {list(navigate.keys())}")
+        if not await self.nav.is_pipelines_menu_expanded():
+            await self.nav.click_pipelines_button()
+        await navigate[section]()
+        await self.wait_for_url_matching(SECTIONS[section][1])
+        return True
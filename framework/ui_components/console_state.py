@@ -0,0 +1,97 @@
+"""
+Console State - in-memory model of what the shared browser page currently shows.
+
+Scenarios of a feature share one browser page, so the state a Background step establishes
+(logged in, Pipelines menu expanded, a section open in the test project) often still holds when
+the next scenario starts. ``ConsoleState`` tracks that state from page events (main-frame
+navigations and document loads) and from the components that change it, so Background steps
+can skip work whose postcondition already holds and only run a cheap verification.
+
+Every fact is either known or None (unknown); a full document load or a navigation that
+contradicts a fact resets it, and components re-learn it on their next check.
+"""
+
+import logging
+from typing import Optional
+from urllib.parse import urlsplit
+from weakref import WeakKeyDictionary
+
+from playwright.async_api import Frame, Page
+
+from framework.ui_components.console_url_patterns import NAMESPACE_IN_URL
+
+logger = logging.getLogger(__name__)
+
+# One state per Playwright page; entries go away with their page
+_states: "WeakKeyDictionary[Page, ConsoleState]" = WeakKeyDictionary()
+
+
+def _route(url: str) -> str:
+    """
+    Returns the path (without trailing slash) and query of a URL, for route comparisons.
+    :param str url: Absolute URL.
+    :return: str: Path and query of the URL.
+    """
+    parts = urlsplit(url)
+    path = parts.path.rstrip("/")
+    return f"{path}?{parts.query}" if parts.query else path
+
+
+class ConsoleState:
+    """Tracks route, namespace, Pipelines menu expansion, active project and login of a page."""
+
+    def __init__(self, page: Page) -> None:
+        """
+        Start tracking a page. Use ConsoleState.for_page() to get the page's shared instance.
+        :param Page page: Playwright page to track.
+        """
+        self.page = page
+        self.url = page.url
+        self.logged_in = False
+        self.pipelines_menu_expanded: Optional[bool] = None
+        self.project: Optional[str] = None
+        self.navigations = 0
+        page.on("framenavigated", self._on_frame_navigated)
+        page.on("load", self._on_load)
+
+    @classmethod
+    def for_page(cls, page: Page) -> "ConsoleState":
+        """
+        Returns the state of a page, creating it on first use.
+        :param Page page: Playwright page.
+        :return: ConsoleState: The page's state.
+        """
+        state = _states.get(page)
+        if state is None:
+            state = _states[page] = cls(page)
+        return state
+
+    @property
+    def namespace(self) -> Optional[str]:
+        """Namespace of the current route, or None for all-namespaces and non-namespaced routes."""
+        match = NAMESPACE_IN_URL.search(self.url)
+        return match.group(1) if match else None
+
+    def is_at(self, url: str) -> bool:
+        """
+        Checks whether the page currently shows the route of a URL, query included (e.g., a ``?name=``
+        list filter), fragment ignored.
+        :param str url: Absolute console URL.
+        :return: bool: True if the current route is the URL's route.
+        """
+        return _route(self.url) == _route(url)
+
+    def _on_frame_navigated(self, frame: Frame) -> None:
+        if frame != self.page.main_frame:
+            return
+        self.url = frame.url
+        self.navigations += 1
+        if "oauth" in self.url.lower():
+            self.logged_in = False
+        # The console's active project follows the route's /ns/<name>; elsewhere it is unknown
+        if self.project is not None and self.namespace != self.project:
+            self.project = None
+
+    def _on_load(self, page: Page) -> None:
+        # A new document renders the navigation bar again; its expansion has to be checked anew
+        self.pipelines_menu_expanded = None
@@ -52,3 +52,6 @@ TRIGGERTEMPLATE_YAML_URL = re.compile(r"k8s/ns/[^/?#]+/triggers\.tekton\.dev~v1b
 TRIGGERBINDING_DETAILS_URL = re.compile(r"k8s/ns/[^/?#]+/triggers\.tekton\.dev~v1beta1~TriggerBinding/[^/?#]+$")
 
 TRIGGERBINDING_YAML_URL = re.compile(r"k8s/ns/[^/?#]+/triggers\.tekton\.dev~v1beta1~TriggerBinding/[^/?#]+/yaml")
+
+# Namespace segment of a namespaced console URL (e.g. /pipelines/ns/<name>/ or /k8s/ns/<name>/)
+NAMESPACE_IN_URL = re.compile(r"/ns/([^/?#]+)")
@@ -3,6 +3,7 @@ Pipeline Builder package containing view objects for different modes.
 """
 
 from framework.ui_components.pipeline_builder.builder_view import BuilderView
+from framework.ui_components.pipeline_builder.pipeline_spec import PipelineSpec, PipelineTaskSpec, diff_pipeline_specs
 from framework.ui_components.pipeline_builder.yaml_view import YamlView
 
-__all__ = ["BuilderView", "YamlView"]
+__all__ = ["BuilderView", "PipelineSpec", "PipelineTaskSpec", "YamlView", "diff_pipeline_specs"]
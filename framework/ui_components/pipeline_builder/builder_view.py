@@ -1,10 +1,12 @@
-from typing import Dict
+import logging
+from typing import Dict, List, Optional
 
 from playwright.async_api import Page
 
 from framework.config.config import Config
 from framework.locators.pipelines import BuilderViewLocators
 from framework.ui_components.base_page import BasePage
+from framework.ui_components.commons.parameter_table import ParameterRecord, ParameterTable, fill_form_fields
 
 
 class BuilderView(BasePage):
@@ -17,6 +19,10 @@ class BuilderView(BasePage):
     def __init__(self, page: Page, config: Config) -> None:
         super().__init__(page, config)
         self.locators = BuilderViewLocators()
+        self.pipeline_parameters = ParameterTable(
+            page, config, self.locators.PIPELINE_PARAM_FIELD_PREFIX, value_field="default"
+        )
+        self.logger = logging.getLogger(__name__)
 
     # ==================== Pipeline Name Methods ====================
 
@@ -74,6 +80,26 @@ class BuilderView(BasePage):
         await self.page.wait_for_selector(task_node_locator, state="visible", timeout=15000)
         return True
 
+    async def wait_for_task_nodes(self, task_names: List[str]) -> bool:
+        """
+        Waits once until every given task node is rendered in the pipeline canvas.
+        :param List[str] task_names: Names of the pipeline tasks.
+        :return: bool: True once all nodes are rendered, raises TimeoutError otherwise.
+        """
+        await self.page.wait_for_function(
+            """([selector, names]) => {
+                const rendered = new Set(
+                    Array.from(document.querySelectorAll(selector)).map((node) =>
+                        node.getAttribute('data-test').slice('builder-node '.length)
+                    )
+                );
+                return names.every((name) => rendered.has(name));
+            }""",
+            arg=[self.locators.TASK_NODES, task_names],
+            timeout=self.config.timeout_ms,
+        )
+        return True
+
     async def click_task_node(self, task_name: str) -> bool:
         """
         Clicks on a task node in the pipeline canvas to open its configuration panel.
@@ -112,6 +138,8 @@ class BuilderView(BasePage):
         """
         Configures multiple parameters for a task in a single call.
         Useful for sparse parameter configuration (e.g., only params 0, 1, and 11).
+        All parameter fields of the open side panel are filled in one round trip; fields that
+        are not rendered yet fall back to configure_task_param, which waits for them.
         :param int task_index: Zero-based index of the task.
         :param Dict[int, str] params: Dictionary mapping param_index to value.
         :return: bool: True if all parameters were configured successfully.
@@ -119,6 +147,18 @@ class BuilderView(BasePage):
             params = {0: "user@example.com", 1: "username", 11: "git clone script"}
             await configure_multiple_task_params(0, params)
         """
+        field_names = {
+            param_index: self.locators.TASK_PARAM_FIELD_NAME_TEMPLATE.format(
+                task_index=task_index, param_index=param_index
+            )
+            for param_index in params
+        }
+        values = {field_names[param_index]: value for param_index, value in params.items()}
+        written = await fill_form_fields(self.page, self.locators.TASK_PARAM_FIELDS, values)
+        if written == len(params):
+            return True
+
+        self.logger.debug(f"Filled {written}/{len(params)} params of task {task_index} in batch, filling the rest")
         for param_index, value in params.items():
             success = await self.configure_task_param(task_index, param_index, value)
             if not success:
@@ -204,3 +244,42 @@ class BuilderView(BasePage):
         return await self.fill_input(workspace_locator, name)
 
     # ==================== Helper/Workflow Methods ====================
+
+    async def configure_pipeline_parameters(
+        self, parameters: List[ParameterRecord], start_index: Optional[int] = None
+    ) -> bool:
+        """
+        Adds and fills pipeline parameters: one click per new row, then a single fill of every input.
+        :param List[ParameterRecord] parameters: Parameters (value is the default value).
+        :param Optional[int] start_index: Row to fill the first parameter into; appends after the rendered rows if None.
+        :return: bool: True if every input was filled.
+        """
+        existing = await self.pipeline_parameters.row_count()
+        start_index = existing if start_index is None else start_index
+        for _ in range(start_index + len(parameters) - existing):
+            await self.click_add_parameter()
+        await self.pipeline_parameters.wait_for_row_count(start_index + len(parameters))
+        written = await self.pipeline_parameters.write(parameters, start_index=start_index)
+        return written == 3 * len(parameters)
+
+    async def configure_pipeline_workspaces(self, names: List[str], start_index: Optional[int] = None) -> bool:
+        """
+        Adds and names pipeline workspaces: one click per new row, then a single fill of every input.
+        :param List[str] names: Workspace names.
+        :param Optional[int] start_index: Row to fill the first name into; appends after the rendered rows if None.
+        :return: bool: True if every workspace name was filled.
+        """
+        existing = await self.page.locator(self.locators.PIPELINE_WORKSPACE_FIELDS).count()
+        start_index = existing if start_index is None else start_index
+        end_index = start_index + len(names)
+        for _ in range(end_index - existing):
+            await self.click_add_workspace()
+        if names:
+            last_locator = self.locators.PIPELINE_WORKSPACE_NAME_TEMPLATE.format(workspace_index=end_index - 1)
+            await self.page.wait_for_selector(last_locator, state="visible", timeout=10000)
+        values = {
+            self.locators.PIPELINE_WORKSPACE_FIELD_NAME_TEMPLATE.format(workspace_index=start_index + offset): name
+            for offset, name in enumerate(names)
+        }
+        written = await fill_form_fields(self.page, self.locators.PIPELINE_WORKSPACE_FIELDS, values)
+        return written == len(names)
@@ -1,4 +1,7 @@
+import asyncio
 import logging
+import time
+from typing import Optional
 
 from playwright.async_api import Page
 
@@ -80,62 +83,87 @@ class PipelineRunsPage(PipelinesBasePage):
         """
         Verify that a PipelineRun with the given name appears in the PipelineRuns list.
         Supports partial name matching for generateName resources (e.g., "simple-pipelinerun-").
+        Narrows the list with the name filter first, so rows outside the rendered window are found too.
         :param str pipelinerun_name: Name or name prefix of the PipelineRun to verify
-        :return: bool: True if PipelineRun row is visible
+        :return: bool: True if PipelineRun row is listed
         """
-        locator = self.locators.PIPELINERUN_ROW_BY_NAME.format(pipelinerun_name=pipelinerun_name)
-        return await self.is_visible(locator, timeout=5000)
+        return await self.find_row(pipelinerun_name, wait_ms=5000) is not None
 
     async def verify_pipelinerun_not_in_list(self, pipelinerun_name: str) -> bool:
         """
         Verify that a PipelineRun with the given name does NOT appear in the PipelineRuns list.
         Supports partial name matching for generateName resources.
+        Absence is proven by the filtered list having no matching row, without waiting for a timeout.
         :param str pipelinerun_name: Name or name prefix of the PipelineRun to verify absence
-        :return: bool: True if PipelineRun row is NOT visible
+        :return: bool: True if PipelineRun row is NOT listed
         """
-        locator = self.locators.PIPELINERUN_ROW_BY_NAME.format(pipelinerun_name=pipelinerun_name)
-        # Return True if element is NOT visible (inverse of is_visible)
-        is_present = await self.is_visible(locator, timeout=3000)
-        return not is_present
+        return await self.find_row(pipelinerun_name) is None
 
     async def get_pipelinerun_status(self, pipelinerun_name: str) -> str:
         """
         Get the status of a PipelineRun from the PipelineRuns list.
 
+        Reads the whole list with a single table snapshot and looks the row up in memory.
+        If the row is not rendered yet, waits once for it to appear and takes a fresh snapshot.
+
         :param str pipelinerun_name: Name of the PipelineRun (may be partial prefix for generateName resources)
         :return: str: Status text (e.g., 'Succeeded', 'Failed', 'Running')
         :raises AssertionError: If PipelineRun row not found in list
         """
         try:
-            # Find the row containing the pipelinerun name
-            row_locator = self.locators.PIPELINERUN_ROW_BY_NAME.format(pipelinerun_name=pipelinerun_name)
-
-            # Wait for the row to be visible
-            await self.page.wait_for_selector(row_locator, timeout=5000)
-
-            # Within that row, find the status badge
-            # Try common status locator patterns used in OpenShift Console
-            status_locator = f"{row_locator} >> [data-test='status-text']"
-
-            # Get the status text
-            status_element = await self.page.query_selector(status_locator)
-            if status_element:
-                status_text = await status_element.text_content()
-                return status_text.strip()
-
-            # Fallback: try PatternFly label content pattern
-            status_locator_alt = f"{row_locator} >> .pf-c-label__content"
-            status_element_alt = await self.page.query_selector(status_locator_alt)
-            if status_element_alt:
-                status_text = await status_element_alt.text_content()
-                return status_text.strip()
-
-            # If no status found, return empty string
-            self.logger.warning(f"Status element not found for PipelineRun '{pipelinerun_name}'")
-            return ""
+            row = (await self.resource_table.snapshot()).find(pipelinerun_name)
+            if row is None:
+                # Row not rendered yet - wait for it once, then re-read the table
+                row_locator = self.locators.PIPELINERUN_ROW_BY_NAME.format(pipelinerun_name=pipelinerun_name)
+                await self.page.wait_for_selector(row_locator, timeout=5000)
+                row = (await self.resource_table.snapshot()).find(pipelinerun_name)
         except Exception as e:
-            self.logger.error(f"Failed to get status for PipelineRun '{pipelinerun_name}': {e}")
+            self.logger.error("Failed to get status for PipelineRun '%s': %s", pipelinerun_name, e)
+            raise AssertionError(f"Could not retrieve status for PipelineRun '{pipelinerun_name}'")
+
+        if row is None:
             raise AssertionError(f"Could not retrieve status for PipelineRun '{pipelinerun_name}'")
+        if not row.status:
+            self.logger.warning("Status element not found for PipelineRun '%s'", pipelinerun_name)
+        return row.status
+
+    async def track_pipelineruns_listed(
+        self,
+        pipelinerun_names: list[str],
+        since: float,
+        timeout_ms: int,
+        name_filter: Optional[str] = None,
+        poll_interval_ms: int = 2000,
+    ) -> dict[str, Optional[float]]:
+        """
+        Polls the PipelineRuns list until every given PipelineRun is listed or the timeout expires,
+        and records how long after ``since`` each one first appeared in the console.
+
+        Every poll reads the whole (filtered) list, including rows outside the rendered window
+        of the virtualized grid, so hundreds of runs are tracked with one scroll pass per poll.
+
+        :param list[str] pipelinerun_names: Exact names of the PipelineRuns to track
+        :param float since: Epoch timestamp the latencies are measured from (e.g., when the events were sent)
+        :param int timeout_ms: Maximum time to poll
+        :param Optional[str] name_filter: Optional name filter text that matches all tracked runs (e.g., a prefix)
+        :param int poll_interval_ms: Time between polls
+        :return: dict[str, Optional[float]]: Seconds from ``since`` to first listed, None if never listed
+        """
+        first_listed: dict[str, Optional[float]] = dict.fromkeys(pipelinerun_names)
+        deadline = time.monotonic() + timeout_ms / 1000
+        while True:
+            await self.verify_data_load(tab_name="PipelineRuns tab")
+            snapshot = await self.resource_table.collect_rows(name_filter=name_filter)
+            now = time.time()
+            listed = set(snapshot.names())
+            for name, seconds in first_listed.items():
+                if seconds is None and name in listed:
+                    first_listed[name] = now - since
+            pending = sum(seconds is None for seconds in first_listed.values())
+            self.logger.info("%s/%s PipelineRuns listed", len(first_listed) - pending, len(first_listed))
+            if not pending or time.monotonic() >= deadline:
+                return first_listed
+            await asyncio.sleep(poll_interval_ms / 1000)
 
     async def click_pipelinerun_row(self, pipelinerun_name: str) -> bool:
         """
@@ -160,7 +188,7 @@ class PipelineRunsPage(PipelinesBasePage):
             kebab_in_row = f"{row_locator} >> {self.base_locators.KEBAB_MENU_BUTTON}"
             return await self.click_element(kebab_in_row)
         except Exception as e:
-            self.logger.error(f"Failed to click kebab menu for PipelineRun '{pipelinerun_name}': {e}")
+            self.logger.error("Failed to click kebab menu for PipelineRun '%s': %s", pipelinerun_name, e)
             return False
 
     async def click_delete_pipelinerun_menu_item(self) -> bool:
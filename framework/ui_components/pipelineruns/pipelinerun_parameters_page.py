@@ -2,6 +2,7 @@ from playwright.async_api import Page
 
 from framework.config.config import Config
 from framework.locators.pipelineruns import PipelineRunBasePageLocators, PipelineRunParametersPageLocators
+from framework.ui_components.commons.parameter_table import ParameterRecord, ParameterTable
 from framework.ui_components.console_url_patterns import PIPELINERUN_PARAMETERS_URL
 from framework.ui_components.pipelineruns.pipelinerun_base_page import PipelineRunBasePage
 
@@ -19,6 +20,7 @@ class PipelineRunParametersPage(PipelineRunBasePage):
         super().__init__(page, config)
         self.base_locators = PipelineRunBasePageLocators()
         self.locators = PipelineRunParametersPageLocators()
+        self.parameter_table = ParameterTable(page, config, self.locators.PARAMETER_FIELD_PREFIX)
 
     async def verify_on_page(self) -> bool:
         """
@@ -122,42 +124,34 @@ class PipelineRunParametersPage(PipelineRunBasePage):
         )
 
     # Parameters page specific methods
+    async def read_parameters(self) -> list[ParameterRecord]:
+        """
+        Reads all parameter rows (name, value, description) in a single round trip.
+        :return: list[ParameterRecord]: Parameter records in display order, empty values included.
+        """
+        return await self.parameter_table.read()
+
     async def get_parameter_names(self) -> list[str]:
         """
         Returns a list of all parameter names displayed on the page.
         :return: list[str]: List of parameter names.
         """
-        name_textboxes = await self.page.locator(self.locators.PARAMETER_NAME_TEXTBOX).all()
-        names = []
-        for textbox in name_textboxes:
-            value = await textbox.input_value()
-            if value:
-                names.append(value)
-        return names
+        return [record.name for record in await self.read_parameters() if record.name]
 
     async def get_parameter_values(self) -> list[str]:
         """
-        Returns a list of all parameter values displayed on the page.
+        Returns a list of all parameter values displayed on the page, in the same order as the names.
+        Empty values are kept so the list stays aligned with get_parameter_names().
         :return: list[str]: List of parameter values.
         """
-        value_textboxes = await self.page.locator(self.locators.PARAMETER_VALUE_TEXTBOX).all()
-        values = []
-        for textbox in value_textboxes:
-            value = await textbox.input_value()
-            if value:
-                values.append(value)
-        return values
+        return [record.value for record in await self.read_parameters() if record.name]
 
     async def get_parameters(self) -> dict[str, str]:
         """
         Returns a dictionary of all parameters (name -> value mapping).
         :return: dict[str, str]: Dictionary mapping parameter names to values.
         """
-        names = await self.get_parameter_names()
-        values = await self.get_parameter_values()
-
-        # Create dictionary by pairing names with values
-        return dict(zip(names, values))
+        return {record.name: record.value for record in await self.read_parameters() if record.name}
 
     async def is_parameter_displayed(self, parameter_name: str) -> bool:
         """
@@ -1,3 +1,5 @@
+import logging
+
 from playwright.async_api import Page
 
 from framework.config.config import Config
@@ -6,6 +8,7 @@ from framework.ui_components.base_page import BasePage
 from framework.ui_components.commons.project_selector import ProjectSelector
 from framework.ui_components.console_url_patterns import PIPELINE_BUILDER_URL
 from framework.ui_components.pipeline_builder.builder_view import BuilderView
+from framework.ui_components.pipeline_builder.pipeline_spec import PipelineSpec, diff_pipeline_specs
 from framework.ui_components.pipeline_builder.yaml_view import YamlView
 
 
@@ -19,8 +22,13 @@ class PipelineBuilderPage(BasePage):
 
     The page composes separate view objects for each mode following the Composition Pattern,
     allowing clean separation of view-specific functionality while maintaining common page actions.
+
+    Whole pipeline graphs are built with build_pipeline() from a PipelineSpec.
     """
 
+    MODE_BUILDER = "builder"
+    MODE_YAML = "yaml"
+
     def __init__(self, page: Page, config: Config) -> None:
         super().__init__(page, config)
         self.locators = PipelineBuilderPageLocators()
@@ -31,6 +39,7 @@ class PipelineBuilderPage(BasePage):
         # Compose view-specific components (Composition Pattern for view hierarchy)
         self.builder_view = BuilderView(page, config)
         self.yaml_view = YamlView(page, config)
+        self.logger = logging.getLogger(__name__)
 
     async def verify_on_page(self) -> bool:
         """
@@ -88,3 +97,63 @@ class PipelineBuilderPage(BasePage):
         :return: bool: True if Create button is enabled.
         """
         return await self.is_element_enabled(self.locators.CREATE_BUTTON)
+
+    async def build_pipeline(self, spec: PipelineSpec, mode: str = MODE_BUILDER) -> bool:
+        """
+        Builds a whole pipeline graph (tasks, runAfter edges, params, workspaces) in one pass.
+
+        The builder closes quick search after every added task and only attaches new tasks
+        through per-node buttons, so a graph costs several UI operations per task there.
+        Instead, the spec is written into the YAML view with a single editor update; in
+        MODE_BUILDER the page then switches back to the builder view and waits once for all
+        task nodes, so the builder form holds the complete graph. Click Create (or Save) afterwards.
+
+        :param PipelineSpec spec: Pipeline graph to build.
+        :param str mode: MODE_BUILDER (ends in the builder view) or MODE_YAML (ends in the YAML view).
+        :return: bool: True if the graph was built.
+        :raises ValueError: If the spec is not a valid graph.
+        """
+        spec.validate()
+        await self.switch_to_yaml_view()
+        await self.yaml_view.monaco_editor.wait_for_editor_ready()
+        if not await self.yaml_view.monaco_editor.set_content(spec.to_yaml()):
+            self.logger.error(f"Failed to write pipeline '{spec.name}' into the YAML view")
+            return False
+        self.logger.info(f"Wrote pipeline '{spec.name}' with {len(spec.tasks)} tasks into the YAML view")
+
+        if mode == self.MODE_YAML:
+            return True
+        await self.switch_to_builder_view()
+        return await self.builder_view.wait_for_task_nodes([task.name for task in spec.tasks])
+
+    async def read_pipeline_spec(self) -> PipelineSpec:
+        """
+        Reads the pipeline graph the form currently holds by round-tripping it through the YAML view.
+        Leaves the page in the YAML view.
+        :return: PipelineSpec: Pipeline graph.
+        :raises ValueError: If the YAML view does not hold a Pipeline.
+        """
+        await self.switch_to_yaml_view()
+        await self.yaml_view.monaco_editor.wait_for_editor_ready()
+        return PipelineSpec.from_yaml(await self.yaml_view.monaco_editor.get_content())
+
+    async def verify_pipeline_spec(self, expected: PipelineSpec, ignore_params: bool = False) -> bool:
+        """
+        Verifies that the form holds the intended pipeline graph, without saving the pipeline.
+        Reads the YAML view once and compares it structurally (order-insensitive) to the spec.
+        Leaves the page in the YAML view.
+        :param PipelineSpec expected: Intended pipeline graph.
+        :param bool ignore_params: Skip params (e.g., Task defaults the builder filled in).
+        :return: bool: True if the graphs are equivalent.
+        :raises AssertionError: Listing every mismatch if the graphs differ.
+        """
+        actual = await self.read_pipeline_spec()
+        mismatches = diff_pipeline_specs(expected, actual, ignore_params=ignore_params)
+        if mismatches:
+            details = "\n  - ".join(mismatches)
+            raise AssertionError(
+                f"Pipeline '{expected.name}' in the builder differs from the intended spec "
+                f"({len(mismatches)} mismatches):\n  - {details}"
+            )
+        self.logger.info(f"Pipeline '{expected.name}' in the builder matches the intended spec")
+        return True
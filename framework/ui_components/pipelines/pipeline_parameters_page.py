@@ -5,6 +5,7 @@ from framework.locators.pipelines import PipelineParametersPageLocators
 from framework.ui_components.base_page import BasePage
 from framework.ui_components.commons.actions_menu import ActionsMenu
 from framework.ui_components.commons.favorites import Favorites
+from framework.ui_components.commons.parameter_table import ParameterRecord, ParameterTable
 from framework.ui_components.commons.project_selector import ProjectSelector
 from framework.ui_components.console_url_patterns import PIPELINE_PARAMETERS_URL
 
@@ -18,6 +19,9 @@ class PipelineParametersPage(BasePage):
         self.project_selector = ProjectSelector(page, config)
         self.favorites = Favorites(page, config)
         self.actions_menu = ActionsMenu(page, config)
+        self.parameter_table = ParameterTable(
+            page, config, self.locators.PARAMETER_FIELD_PREFIX, value_field=self.locators.PARAMETER_VALUE_FIELD
+        )
 
     async def verify_on_page(self) -> bool:
         """
@@ -125,6 +129,33 @@ class PipelineParametersPage(BasePage):
         """
         return await self.click_element(self.locators.ADD_PARAMETER_BUTTON)
 
+    async def read_parameters(self) -> list[ParameterRecord]:
+        """
+        Reads all parameter rows (name, default value, description) in a single round trip.
+        :return: list[ParameterRecord]: Parameter records in display order, empty values included.
+        """
+        return await self.parameter_table.read()
+
+    async def fill_parameters(self, parameters: list[ParameterRecord], start_index: int = 0) -> bool:
+        """
+        Fills many parameters at once instead of three fill_input calls per parameter.
+        Adds the missing parameter rows first, writes every name, default value and description
+        in a single round trip, then reads the form back to confirm the values were applied.
+        :param list[ParameterRecord] parameters: Parameters to fill (value is the default value).
+        :param int start_index: The zero-based index of the first row to fill (existing rows are overwritten).
+        :return: bool: True if every parameter reads back as written.
+        """
+        required_rows = start_index + len(parameters)
+        missing_rows = required_rows - await self.parameter_table.row_count()
+        for _ in range(missing_rows):
+            await self.click_add_parameter()
+        if missing_rows > 0:
+            await self.parameter_table.wait_for_row_count(required_rows)
+
+        await self.parameter_table.write(parameters, start_index=start_index)
+        written = (await self.read_parameters())[start_index:required_rows]
+        return written == list(parameters)
+
     async def click_save(self) -> bool:
         """
         Clicks the 'Save' button to save parameter changes.
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from playwright.async_api import Page
 
 from framework.config.config import Config
@@ -130,6 +132,24 @@ class PipelineYamlPage(BasePage):
         """
         return await self.click_element(self.locators.SAVE_BUTTON)
 
+    async def save_changes(self, timeout: Optional[int] = None) -> bool:
+        """
+        Clicks 'Save' and waits for the console's answer: the "updated to version" alert, or an error
+        alert (e.g., a conflict with a concurrent edit).
+        :param Optional[int] timeout: Optional timeout in milliseconds.
+        :return: bool: True if the console saved the YAML.
+        :raises AssertionError: With the console's error message if the save was rejected or not confirmed.
+        """
+        await self.click_save()
+        if not await self.is_visible(
+            f"{self.locators.SAVE_SUCCESS_ALERT}, {self.locators.SAVE_ERROR_ALERT} >> nth=0", timeout=timeout
+        ):
+            raise AssertionError("Pipeline YAML save was not confirmed by the console")
+        error = self.page.locator(self.locators.SAVE_ERROR_ALERT)
+        if await error.count():
+            raise AssertionError(f"Pipeline YAML save failed: {(await error.first.inner_text()).strip()}")
+        return True
+
     async def click_reload(self) -> bool:
         """
         Clicks the 'Reload' button to discard local edits and reload the YAML from the server.
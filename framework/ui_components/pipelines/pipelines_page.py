@@ -146,7 +146,7 @@ class PipelinesPage(PipelinesBasePage):
         :return: bool: True if pipeline row is NOT visible
         """
         locator = self.locators.PIPELINE_ROW_BY_NAME.format(pipeline_name=pipeline_name)
-        return not await self.is_visible(locator, timeout=5000)
+        return await self.is_row_absent(locator)
 
     async def click_pipeline_kebab_menu(self, pipeline_name: str) -> bool:
         """
@@ -70,62 +70,51 @@ class TaskRunsPage(TasksBasePage):
     async def verify_taskrun_in_list(self, taskrun_name: str) -> bool:
         """
         Verify that a TaskRun with the given name appears in the TaskRuns list.
+        Narrows the list with the name filter first, so rows outside the rendered window are found too.
 
         :param str taskrun_name: Name of the TaskRun to verify (can be partial name with generateName)
-        :return: bool: True if TaskRun row is visible
+        :return: bool: True if TaskRun row is listed
         """
-        locator = self.locators.TASKRUN_ROW_BY_NAME.format(taskrun_name=taskrun_name)
-        return await self.is_visible(locator, timeout=5000)
+        return await self.find_row(taskrun_name, wait_ms=5000) is not None
 
     async def verify_taskrun_not_in_list(self, taskrun_name: str) -> bool:
         """
         Verify that a TaskRun with the given name does NOT appear in the TaskRuns list.
+        Absence is proven by the filtered list having no matching row, without waiting for a timeout.
 
         :param str taskrun_name: Name of the TaskRun to verify absence
-        :return: bool: True if TaskRun row is NOT visible
+        :return: bool: True if TaskRun row is NOT listed
         """
-        locator = self.locators.TASKRUN_ROW_BY_NAME.format(taskrun_name=taskrun_name)
-        return not await self.is_visible(locator, timeout=5000)
+        return await self.find_row(taskrun_name) is None
 
     async def get_taskrun_status(self, taskrun_name: str) -> str:
         """
         Get the status of a TaskRun from the TaskRuns list.
 
+        Reads the whole list with a single table snapshot and looks the row up in memory.
+        If the row is not rendered yet, waits once for it to appear and takes a fresh snapshot.
+
         :param str taskrun_name: Name of the TaskRun (may be partial prefix for generateName resources)
         :return: str: Status text (e.g., 'Succeeded', 'Failed', 'Running')
         :raises AssertionError: If TaskRun row not found in list
         """
         try:
-            # Find the row containing the taskrun name
-            row_locator = self.locators.TASKRUN_ROW_BY_NAME.format(taskrun_name=taskrun_name)
-
-            # Wait for the row to be visible
-            await self.page.wait_for_selector(row_locator, timeout=5000)
-
-            # Within that row, find the status badge
-            # Try common status locator patterns used in OpenShift Console
-            status_locator = f"{row_locator} >> [data-test='status-text']"
-
-            # Get the status text
-            status_element = await self.page.query_selector(status_locator)
-            if status_element:
-                status_text = await status_element.text_content()
-                return status_text.strip()
-
-            # Fallback: try PatternFly label content pattern
-            status_locator_alt = f"{row_locator} >> .pf-c-label__content"
-            status_element_alt = await self.page.query_selector(status_locator_alt)
-            if status_element_alt:
-                status_text = await status_element_alt.text_content()
-                return status_text.strip()
-
-            # If no status found, return empty string
-            self.logger.warning(f"Status element not found for TaskRun '{taskrun_name}'")
-            return ""
+            row = (await self.resource_table.snapshot()).find(taskrun_name)
+            if row is None:
+                # Row not rendered yet - wait for it once, then re-read the table
+                row_locator = self.locators.TASKRUN_ROW_BY_NAME.format(taskrun_name=taskrun_name)
+                await self.page.wait_for_selector(row_locator, timeout=5000)
+                row = (await self.resource_table.snapshot()).find(taskrun_name)
         except Exception as e:
             self.logger.error(f"Failed to get status for TaskRun '{taskrun_name}': {e}")
             raise AssertionError(f"Could not retrieve status for TaskRun '{taskrun_name}'")
 
+        if row is None:
+            raise AssertionError(f"Could not retrieve status for TaskRun '{taskrun_name}'")
+        if not row.status:
+            self.logger.warning(f"Status element not found for TaskRun '{taskrun_name}'")
+        return row.status
+
     async def click_taskrun_kebab_menu(self, taskrun_name: str) -> bool:
         """
         Click the kebab menu for a specific TaskRun row.
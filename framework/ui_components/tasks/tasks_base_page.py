@@ -1,3 +1,5 @@
+from typing import Optional
+
 from playwright.async_api import Page
 
 from framework.config.config import Config
@@ -5,6 +7,7 @@ from framework.locators.tasks import TasksBasePageLocators
 from framework.ui_components.base_page import BasePage
 from framework.ui_components.commons.favorites import Favorites
 from framework.ui_components.commons.project_selector import ProjectSelector
+from framework.ui_components.commons.resource_table import ResourceRow, ResourceTable, TableSnapshot
 from framework.ui_components.console_url_patterns import TASKS_URL
 
 
@@ -19,6 +22,13 @@ class TasksBasePage(BasePage):
         self.base_locators = TasksBasePageLocators()
         self.project_selector = ProjectSelector(page, config)
         self.favorites = Favorites(page, config)
+        self.resource_table = ResourceTable(
+            page,
+            config,
+            self.base_locators.DATA_GRID,
+            search_selector=self.base_locators.SEARCH_INPUT,
+            no_data_selector=self.base_locators.NO_DATA_MESSAGE,
+        )
 
     async def verify_on_page(self) -> bool:
         """
@@ -134,3 +144,44 @@ class TasksBasePage(BasePage):
         :raises AssertionError: If data does not load within the timeout.
         """
         return await self._verify_data_load(self.base_locators.DATA_GRID, tab_name, self.base_locators.NO_DATA_MESSAGE)
+
+    async def get_table_snapshot(self, tab_name: str = "Tasks page", wait_for_data: bool = True) -> TableSnapshot:
+        """
+        Reads every visible row of the current tab into typed records in a single round trip.
+        Use the returned snapshot for in-memory lookups (by exact name or generateName prefix)
+        instead of querying the page once per row or per cell.
+        :param str tab_name: Tab name for error messages if data does not load.
+        :param bool wait_for_data: If True, waits for the data grid (or the no-data message) first.
+        :return: TableSnapshot: Snapshot of all rendered rows (empty if the list has no data).
+        :raises AssertionError: If wait_for_data is True and data does not load within the timeout.
+        """
+        if wait_for_data:
+            await self.verify_data_load(tab_name=tab_name)
+        return await self.resource_table.snapshot()
+
+    async def is_row_absent(self, row_locator: str, removal_timeout: int = 0) -> bool:
+        """
+        Proves that a row is not displayed in the current tab's list.
+        Waits for the data grid (or the no-data message) to settle, then checks immediately.
+        :param str row_locator: Locator of the row that should be absent.
+        :param int removal_timeout: Time in milliseconds to wait for a row that is being removed. 0 checks once.
+        :return: bool: True if the row is not displayed.
+        """
+        return await self.is_absent(
+            row_locator, self.base_locators.DATA_GRID, self.base_locators.NO_DATA_MESSAGE, removal_timeout
+        )
+
+    async def find_row(
+        self, name_or_prefix: str, strategy: str = ResourceTable.STRATEGY_FILTER, wait_ms: int = 0
+    ) -> Optional[ResourceRow]:
+        """
+        Finds a resource row on the current tab, even when the virtualized grid has not rendered it.
+        Narrows the list with the name filter (or the ``name`` URL query parameter) so absence is
+        proven by an empty filtered list instead of a visibility timeout.
+        :param str name_or_prefix: Exact resource name or generateName prefix (ending with "-").
+        :param str strategy: "filter" (search box), "url" (query parameter) or "scroll" (scan every window).
+        :param int wait_ms: If > 0, waits up to this long for a matching row (for just-created resources).
+        :return: Optional[ResourceRow]: The matching row, or None if the resource is not listed.
+        """
+        await self.resource_table.wait_for_data()
+        return await self.resource_table.find(name_or_prefix, strategy=strategy, wait_ms=wait_ms)
@@ -89,10 +89,5 @@ class TasksPage(TasksBasePage):
         :return: bool: True if task row is NOT visible (disappeared)
         """
         locator = self.locators.TASK_ROW_BY_NAME.format(task_name=task_name)
-        # Wait for the element to disappear
-        try:
-            await self.page.wait_for_selector(locator, state="hidden", timeout=self.config.timeout_ms)
-            return True
-        except Exception:
-            # If element is still visible or wait times out, verification failed
-            return False
+        # Give a row that is still being removed the full timeout to disappear
+        return await self.is_row_absent(locator, removal_timeout=self.config.timeout_ms)
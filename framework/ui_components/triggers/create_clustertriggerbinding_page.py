@@ -2,19 +2,15 @@ from playwright.async_api import Page
 
 from framework.config.config import Config
 from framework.locators.triggers import CreateClusterTriggerBindingPageLocators
-from framework.ui_components.base_page import BasePage
-from framework.ui_components.commons.favorites import Favorites
-from framework.ui_components.commons.project_selector import ProjectSelector
+from framework.ui_components.triggers.create_trigger_base_page import CreateTriggerBasePage
 
 
-class CreateClusterTriggerBindingPage(BasePage):
+class CreateClusterTriggerBindingPage(CreateTriggerBasePage):
     """Page object for the Create ClusterTriggerBinding YAML editor page."""
 
     def __init__(self, page: Page, config: Config) -> None:
         super().__init__(page, config)
         self.locators = CreateClusterTriggerBindingPageLocators()
-        self.project_selector = ProjectSelector(page, config)
-        self.favorites = Favorites(page, config)
 
     async def verify_on_page(self) -> bool:
         """
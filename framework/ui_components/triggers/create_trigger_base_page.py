@@ -0,0 +1,39 @@
+from playwright.async_api import Page
+
+from framework.config.config import Config
+from framework.ui_components.base_page import BasePage
+from framework.ui_components.commons.favorites import Favorites
+from framework.ui_components.commons.monaco_editor import MonacoEditor
+from framework.ui_components.commons.project_selector import ProjectSelector
+
+
+class CreateTriggerBasePage(BasePage):
+    """
+    Abstract base class for the Create EventListener, TriggerTemplate, TriggerBinding and
+    ClusterTriggerBinding YAML editor pages.
+    Contains shared UI elements and behaviors common to all four pages.
+    Follows Template Method Pattern for extensibility.
+    """
+
+    def __init__(self, page: Page, config: Config) -> None:
+        super().__init__(page, config)
+        self.project_selector = ProjectSelector(page, config)
+        self.favorites = Favorites(page, config)
+        # Compose MonacoEditor component for editor interactions
+        self.monaco_editor = MonacoEditor(page, config)
+
+    async def click_create(self) -> bool:
+        """
+        Clicks the 'Create' button to submit the YAML and create the resource.
+        :return: bool: True if click succeeds.
+        """
+        # Implemented in concrete classes with their specific locators
+        raise NotImplementedError("Subclass must implement click_create()")
+
+    async def create_from_yaml(self, yaml_content: str) -> bool:
+        """
+        Replaces the editor content with the given YAML and submits it.
+        :param str yaml_content: Resource YAML to create.
+        :return: bool: True if the editor was filled and the Create button was clicked.
+        """
+        return await self.monaco_editor.set_content(yaml_content) and await self.click_create()
@@ -2,19 +2,15 @@ from playwright.async_api import Page
 
 from framework.config.config import Config
 from framework.locators.triggers import CreateTriggerBindingPageLocators
-from framework.ui_components.base_page import BasePage
-from framework.ui_components.commons.favorites import Favorites
-from framework.ui_components.commons.project_selector import ProjectSelector
+from framework.ui_components.triggers.create_trigger_base_page import CreateTriggerBasePage
 
 
-class CreateTriggerBindingPage(BasePage):
+class CreateTriggerBindingPage(CreateTriggerBasePage):
     """Page object for the Create TriggerBinding YAML editor page."""
 
     def __init__(self, page: Page, config: Config) -> None:
         super().__init__(page, config)
         self.locators = CreateTriggerBindingPageLocators()
-        self.project_selector = ProjectSelector(page, config)
-        self.favorites = Favorites(page, config)
 
     async def verify_on_page(self) -> bool:
         """
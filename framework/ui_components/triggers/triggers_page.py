@@ -1,8 +1,11 @@
+from typing import Optional
+
 from playwright.async_api import Page
 
 from framework.config.config import Config
 from framework.locators.triggers import TriggersPageLocators
 from framework.ui_components.base_page import BasePage
+from framework.ui_components.commons.resource_table import ResourceRow, ResourceTable, TableSnapshot
 from framework.ui_components.console_url_patterns import TRIGGERS_URL
 
 
@@ -10,6 +13,13 @@ class TriggersPage(BasePage):
     def __init__(self, page: Page, config: Config) -> None:
         super().__init__(page, config)
         self.locators = TriggersPageLocators()
+        self.resource_table = ResourceTable(
+            page,
+            config,
+            self.locators.TRIGGERS_DATA_LOAD_CHECK,
+            search_selector=self.locators.SEARCH_INPUT,
+            no_data_selector=self.locators.TRIGGERS_NO_DATA_LOAD_CHECK,
+        )
 
     async def verify_on_page(self) -> bool:
         """
@@ -73,3 +83,26 @@ class TriggersPage(BasePage):
         context = tab_name if tab_name else "Triggers page"
         no_data_locator = self.locators.TRIGGERS_NO_DATA_LOAD_CHECK
         return await self._verify_data_load(data_locator, context, no_data_locator)
+
+    async def get_table_snapshot(self, tab_name: str = "Triggers page", wait_for_data: bool = True) -> TableSnapshot:
+        """
+        Reads every rendered row of the current tab (EventListeners, TriggerTemplates, TriggerBindings
+        or ClusterTriggerBindings) into typed records in a single round trip.
+        :param str tab_name: Tab name for error messages if data does not load.
+        :param bool wait_for_data: If True, waits for the data grid (or the no-data message) first.
+        :return: TableSnapshot: Snapshot of all rendered rows (empty if the list has no data).
+        :raises AssertionError: If wait_for_data is True and data does not load within the timeout.
+        """
+        if wait_for_data:
+            await self.verify_data_load(tab_name=tab_name)
+        return await self.resource_table.snapshot()
+
+    async def find_row(self, name_or_prefix: str, wait_ms: int = 0) -> Optional[ResourceRow]:
+        """
+        Finds a resource row on the current tab, even when the virtualized grid has not rendered it.
+        :param str name_or_prefix: Exact resource name or generateName prefix (ending with "-").
+        :param int wait_ms: If > 0, waits up to this long for a matching row (for just-created resources).
+        :return: Optional[ResourceRow]: The matching row, or None if the resource is not listed.
+        """
+        await self.resource_table.wait_for_data()
+        return await self.resource_table.find(name_or_prefix, wait_ms=wait_ms)
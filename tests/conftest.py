@@ -2,13 +2,33 @@
 Test configuration and fixtures.
 
 This module configures pytest for BDD test execution, registers step definition plugins,
-and implements custom collection hooks for test skipping.
+implements custom collection hooks for test skipping, exposes test reports to fixtures,
+reports step results and timings through the step_reporter fixture, and runs the structured
+log pipeline with per-scenario and per-step correlation. Front-end performance regressions
+against a baseline fail the run.
 """
 
+import logging
+import time
+from collections.abc import Callable, Generator
+from pathlib import Path
+from typing import Any, Optional
+
 import pytest
+from pytest_bdd.parser import Feature, Scenario, Step
 
 # Import fixtures from framework
 from framework.fixtures.ui_fixtures import *  # noqa: F403, F401
+from framework.helpers.log_pipeline import (
+    LogPipeline,
+    clear_log_context,
+    parse_component_levels,
+    set_log_context,
+    worker_id,
+)
+from framework.helpers.network_conditions import EmulatedConditions
+
+logger = logging.getLogger(__name__)
 
 # Register step definition plugins
 # test_shared_steps contains steps used across multiple feature files
@@ -19,6 +39,66 @@ pytest_plugins = [
 ]
 
 
+def pytest_configure(config: pytest.Config) -> None:
+    """
+    Start the structured log pipeline (unless --structured-logs=false): framework and test logs are
+    written as JSON lines to <artifacts-dir>/logs/<worker>.jsonl by a background thread.
+
+    :param config: pytest config object
+    """
+    if not config.getoption("--structured-logs", default=True):
+        return
+    artifacts_dir = Path(config.getoption("--artifacts-dir", default="test-artifacts"))
+    config.log_pipeline = LogPipeline(
+        artifacts_dir / "logs" / f"{worker_id()}.jsonl",
+        component_levels=parse_component_levels(config.getoption("--log-component-levels", default="")),
+        conditions=EmulatedConditions.from_names(
+            config.getoption("--network-profile", default="off"), config.getoption("--cpu-profile", default="off")
+        ).tag,
+    ).start()
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """
+    Flush and stop the structured log pipeline.
+
+    :param config: pytest config object
+    """
+    pipeline = getattr(config, "log_pipeline", None)
+    if pipeline is not None:
+        pipeline.stop()
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    """
+    Fail the run if console routes got slower than the --perf-baseline (found by the perf_results
+    fixture when the session ends); the regressions are logged.
+
+    :param session: pytest session object
+    :param exitstatus: Exit status of the run so far
+    """
+    regressions = getattr(session.config, "perf_regressions", None)
+    if not regressions:
+        return
+    for regression in regressions:
+        logger.error(f"Front-end performance regression: {regression}")
+    if exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item: pytest.Item, nextitem: Optional[pytest.Item]) -> Generator[None, Any, None]:
+    """
+    Correlate every log record of a scenario, including its fixture setup and teardown, with the scenario.
+
+    :param item: Test item being run
+    :param nextitem: Next test item, if any
+    """
+    set_log_context(scenario=item.name)
+    yield
+    clear_log_context()
+
+
 def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
     """
     Automatically skip test scenarios tagged with @skip or @known_bug in feature files.
@@ -39,3 +119,74 @@ def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item
         # Also handle @known_bug as alias for @skip
         elif "known_bug" in item.keywords:
             item.add_marker(pytest.mark.skip(reason="Known bug - see feature file comments for tracking information"))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo[None]) -> Generator[None, Any, None]:
+    """
+    Attach each phase's report to the test item (item.rep_setup, item.rep_call, item.rep_teardown),
+    so fixtures can tell in their teardown whether the scenario failed (e.g., failure_artifacts).
+
+    :param item: Test item being reported
+    :param call: Call information of the phase
+    """
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
+def pytest_bdd_before_step(
+    request: pytest.FixtureRequest, feature: Feature, scenario: Scenario, step: Step, step_func: Callable
+) -> None:
+    """
+    Record the start time of a BDD step for step timing reports, and correlate log records with the step.
+    """
+    request.node.step_started_at = time.perf_counter()
+    set_log_context(step=f"{step.keyword} {step.name}")
+
+
+def pytest_bdd_after_step(
+    request: pytest.FixtureRequest,
+    feature: Feature,
+    scenario: Scenario,
+    step: Step,
+    step_func: Callable,
+    step_func_args: dict[str, Any],
+) -> None:
+    """
+    Report a passed BDD step and its duration (non-blocking; no-op when reporting is off).
+    """
+    _report_step(request, scenario, step, "passed")
+
+
+def pytest_bdd_step_error(
+    request: pytest.FixtureRequest,
+    feature: Feature,
+    scenario: Scenario,
+    step: Step,
+    step_func: Callable,
+    step_func_args: dict[str, Any],
+    exception: Exception,
+) -> None:
+    """
+    Report a failed BDD step, its duration and the error (non-blocking; no-op when reporting is off).
+    """
+    _report_step(request, scenario, step, "failed", error=f"{type(exception).__name__}: {exception}")
+
+
+def _report_step(request: pytest.FixtureRequest, scenario: Scenario, step: Step, status: str, error: str = "") -> None:
+    """
+    Hand a step result to the step reporter.
+
+    :param request: Pytest request of the scenario
+    :param scenario: Scenario the step belongs to
+    :param step: The step
+    :param status: "passed" or "failed"
+    :param error: Error message of a failed step
+    """
+    set_log_context(step="")
+    reporter = request.getfixturevalue("step_reporter")
+    if reporter is None:
+        return
+    duration = time.perf_counter() - getattr(request.node, "step_started_at", time.perf_counter())
+    reporter.step_result(scenario.name, f"{step.keyword} {step.name}", status, duration, error)
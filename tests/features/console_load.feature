@@ -0,0 +1,24 @@
+Feature: Multi-user console load
+
+  @sanity
+  Scenario Outline: Load generator drives API virtual users against a local console stand-in
+    Given a local console stand-in is running
+    When virtual users load the console with ramp profile "<profile>" and <browser_percent> percent browser users
+    Then the console load error rate should be below <max_error_percent> percent
+    And the p95 latency of every console action should be below <p95_ms> milliseconds
+
+    Examples:
+      | profile              | browser_percent | max_error_percent | p95_ms |
+      | 5s:10, 5s:10, 2s:0   | 0               | 1                 | 1000   |
+
+  @regression
+  Scenario Outline: Pipelines console plugin with 50 engineers on it at once
+    Given the user is logged into openshift console with auth kube:admin
+    And <pipelines> pipelines with <runs> pipelineruns are created via cli as console load targets
+    When virtual users load the console with ramp profile "<profile>" and <browser_percent> percent browser users
+    Then the console load error rate should be below <max_error_percent> percent
+    And the p95 latency of every console action should be below <p95_ms> milliseconds
+
+    Examples:
+      | pipelines | runs | profile              | browser_percent | max_error_percent | p95_ms |
+      | 10        | 30   | 1m:50, 3m:50, 30s:0  | 20              | 2                 | 15000  |
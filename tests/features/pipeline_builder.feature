@@ -19,6 +19,23 @@ Feature: Pipeline Builder Sanity Tests
       | field        | value       |
       | displayName  | git-command |
       | source       | source      |
-    And the user clicks Create button on Pipeline Builder page
+    Then the pipeline "builder-test-pipeline" in the YAML view should have task "git-command" of Task "git-cli" using workspace "source"
+    When the user clicks Create button on Pipeline Builder page
     Then the user should be on pipeline details page
     And the pipeline details page should display the pipeline name as "builder-test-pipeline"
+
+  @regression
+  Scenario Outline: Build a long pipeline graph in Pipeline Builder
+    When the user clicks Create button on Pipelines page
+    And the user clicks Pipeline menu item
+    Then the user should be on Pipeline Builder page
+    When the user builds pipeline "<pipeline_name>" as a chain of <count> "<task_name>" tasks from namespace "openshift-pipelines" in <mode> view
+    And the user clicks Create button on Pipeline Builder page
+    Then the user should be on pipeline details page
+    And the pipeline details page should display the pipeline name as "<pipeline_name>"
+    And the pipeline stored in the cluster should match the built pipeline
+
+    Examples:
+      | pipeline_name         | count | task_name        | mode    |
+      | builder-chain-builder | 30    | openshift-client | builder |
+      | builder-chain-yaml    | 30    | openshift-client | yaml    |
@@ -7,6 +7,6 @@ Feature: Validate User is able to navigate to Pipelines, PipelineRuns & Reposito
   Scenario: Verify successful navigation to Pipelines page and Sub Tabs
     Given Validate Pipelines button is visible in the left navigation bar
     And the user clicks on Pipelines button
-    Then the user navigates to the Pipelines page
+    Then the user navigates to the Pipelines page via the left navigation bar
     And the user navigates to PipelineRuns tab
     And the user navigates to Repositories tab
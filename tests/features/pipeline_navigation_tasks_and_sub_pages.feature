@@ -7,5 +7,5 @@ Feature: Validate User is able to navigate to Tasks, TaskRuns Pages & underlying
   Scenario: Verify successful navigation to Tasks page and Sub Tabs
     Given Validate Pipelines button is visible in the left navigation bar
     And the user clicks on Pipelines button
-    Then the user navigates to the Tasks page
+    Then the user navigates to the Tasks page via the left navigation bar
     And the user navigates to TaskRuns tab
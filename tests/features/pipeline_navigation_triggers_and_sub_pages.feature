@@ -8,7 +8,7 @@ Feature: Validate User is able to navigate to Triggers, EventListeners & Trigger
   Scenario: Verify successful navigation to Triggers page and Sub Tabs
     Given Validate Pipelines button is visible in the left navigation bar
     And the user clicks on Pipelines button
-    Then the user navigates to the Triggers page
+    Then the user navigates to the Triggers page via the left navigation bar
     And the user navigates to TriggerTemplates tab
     And the user navigates to TriggerBindings tab
     And the user navigates to ClusterTriggerBindings tab
@@ -7,4 +7,4 @@ Feature: Validate User is able to navigate to Pipelines, PipelineRuns & Reposito
   Scenario: Verify successful navigation to Overview page
     Given Validate Pipelines button is visible in the left navigation bar
     And the user clicks on Pipelines button
-    Then the user navigates to the Overview page
+    Then the user navigates to the Overview page via the left navigation bar
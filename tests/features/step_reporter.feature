@@ -0,0 +1,28 @@
+Feature: ReportPortal step reporter
+
+  @sanity
+  Scenario: Step reporter sends step results to a local ReportPortal stand-in in batches
+    Given a local reportportal stand-in is running
+    And a step reporter streams to the stand-in with batch size 10 and queue size 1000
+    When 25 step results are reported
+    And the step reporter is closed
+    Then the stand-in should have received all 25 step results in batches of at most 10
+    And no step results should be spooled or dropped
+
+  @sanity
+  Scenario: Step reporter switches to the spool when ReportPortal keeps failing
+    Given a local reportportal stand-in is running that answers with status 503
+    And a step reporter streams to the stand-in with batch size 5 and queue size 1000
+    When 25 step results are reported
+    And the step reporter is closed
+    Then the stand-in should have received 3 batch requests
+    And all 25 step results should be spooled
+
+  @sanity
+  Scenario: Step reporter drops step results instead of blocking when its queue is full
+    Given a local reportportal stand-in is running that answers after 0.5 seconds
+    And a step reporter streams to the stand-in with batch size 1 and queue size 5
+    When 50 step results are reported
+    And the step reporter is closed
+    Then at least 40 step results should be dropped
+    And each of the 50 step results should be sent, spooled or dropped
@@ -0,0 +1,25 @@
+Feature: Trigger resources at scale
+
+  Background:
+    Given the user is logged into openshift console with auth kube:admin
+    And the trigger prerequisites are created via cli
+    When the user navigates to the Triggers page
+    And user switches to current project
+
+  @sanity
+  Scenario Outline: Create EventListener from YAML and verify it appears in list
+    When the user creates an eventlistener from YAML file "<yaml_file>"
+    Then the eventlistener "<eventlistener_name>" should appear in the EventListeners tab
+
+    Examples:
+      | yaml_file                 | eventlistener_name   |
+      | simple_eventlistener.yaml | simple-eventlistener |
+
+  @regression
+  Scenario Outline: Create many EventListeners via CLI and verify all appear in list
+    When the user creates <count> eventlisteners via cli with name prefix "<name_prefix>"
+    Then all <count> eventlisteners with name prefix "<name_prefix>" should appear in the EventListeners tab
+
+    Examples:
+      | count | name_prefix |
+      | 100   | scale-el-   |
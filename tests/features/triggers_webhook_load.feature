@@ -0,0 +1,25 @@
+Feature: EventListener webhook load
+
+  @sanity
+  Scenario Outline: Webhook load driver delivers a burst to a local EventListener stand-in
+    Given a local eventlistener receiver is running
+    When <count> webhook events are sent to the eventlistener within <seconds> seconds
+    Then all <count> webhook events should be accepted
+
+    Examples:
+      | count | seconds |
+      | 50    | 5       |
+
+  @regression
+  Scenario Outline: Push storm on an EventListener and verify all triggered PipelineRuns appear in the console
+    Given the user is logged into openshift console with auth kube:admin
+    And the trigger prerequisites are created via cli
+    And the eventlistener from YAML file "<yaml_file>" is created and exposed via cli
+    When <count> webhook events are sent to the eventlistener within <seconds> seconds
+    Then all <count> webhook events should be accepted
+    And a pipelinerun should be created for every accepted webhook event within <timeout> seconds
+    And all triggered pipelineruns should appear in the PipelineRuns list within <timeout> seconds
+
+    Examples:
+      | yaml_file                 | count | seconds | timeout |
+      | simple_eventlistener.yaml | 200   | 60      | 300     |
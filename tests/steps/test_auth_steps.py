@@ -19,14 +19,14 @@ def user_logged_into_openshift_kube_admin(
     page: Dict[str, Any],
     config: Config,
     playwright_event_loop: asyncio.AbstractEventLoop,
-    bdd_openshift_console_session: Dict[str, Any],
 ) -> None:
     """
-    Logs in once per feature file (module-scoped browser + session flag).
+    Logs in once per browser context (module-scoped browser + ConsoleState login flag).
 
     For the first scenario, performs full login. For subsequent scenarios in the same feature,
-    checks if session is still valid (not on oauth page) and continues from current page
-    without unnecessary navigation. This optimizes test execution by avoiding page reloads.
+    the page's ConsoleState still reports the session as logged in and the step continues from
+    the current page without unnecessary navigation. ConsoleState clears the flag as soon as the
+    page is redirected to the oauth server, so an expired session is logged in again.
 
     Session sharing benefits:
     - First scenario: Full login → lands on page
@@ -35,27 +35,16 @@ def user_logged_into_openshift_kube_admin(
     """
 
     async def _ensure_logged_in() -> None:
-        # First scenario in feature - perform full login
-        if not bdd_openshift_console_session.get("kube_admin_logged_in"):
-            assert await page["login"].goto()
-            assert await page["login"].verify_successful_navigation_to_login_page()
-            assert await page["login"].choose_login_auth_type("kube:admin")
-            assert await page["login"].login()
-            assert await page["overview"].verify_on_page()
-            bdd_openshift_console_session["kube_admin_logged_in"] = True
+        # Session still valid - continue from current page (no navigation, no reload)
+        if page["state"].logged_in and "oauth" not in page["raw_page"].url.lower():
             return
 
-        # Subsequent scenarios - check if session is still valid without navigation
-        # Only navigate if session expired (oauth redirect detected)
-        current_url = page["raw_page"].url
-        if "oauth" in current_url.lower():
-            # Session expired - perform full login again
-            bdd_openshift_console_session["kube_admin_logged_in"] = False
-            await _ensure_logged_in()
-            return
-
-        # Session still valid - continue from current page (no navigation, no reload)
-        # Each scenario picks up where the previous one left off
+        assert await page["login"].goto()
+        assert await page["login"].verify_successful_navigation_to_login_page()
+        assert await page["login"].choose_login_auth_type("kube:admin")
+        assert await page["login"].login()
+        assert await page["overview"].verify_on_page()
+        page["state"].logged_in = True
 
     run_async(playwright_event_loop, _ensure_logged_in())
 
@@ -70,8 +59,10 @@ def user_switches_to_current_project(
     """
     Switches to the test project created for this feature file if not already on it.
 
-    Checks the current project from the project selector button. If already on the test
-    project, does nothing. If on a different project, switches to the test project.
+    Skips the UI if the current route is namespaced to the test project. Otherwise checks the
+    current project from the project selector button. If already on the test project, does
+    nothing. If on a different project, switches to the test project by navigating to the
+    current route in the test project's namespace.
 
     This step should be called after navigating to a page where the project selector
     is visible (e.g., Tasks, Pipelines, etc.).
@@ -83,13 +74,15 @@ def user_switches_to_current_project(
     """
 
     async def _step() -> None:
-        # Check current project from the project selector button
+        # Already on the test project (route namespace), or read it from the project selector button
+        if page["project_selector"].is_cached_project(test_project):
+            return
         current_project = await page["project_selector"].get_current_project()
 
         # Only switch if we're not already on the test project
         if current_project != test_project:
-            # Switch to the test project in the UI
-            project_switched = await page["project_selector"].select_project(test_project)
+            # Switch to the test project in the UI (rewrites the route namespace, dropdown as fallback)
+            project_switched = await page["project_selector"].switch_project(test_project)
             assert project_switched, f"Failed to switch to test project '{test_project}' in UI"
         # else: already on the test project, continue
 
@@ -0,0 +1,180 @@
+"""
+Console Load Test Steps.
+
+BDD step definitions for running concurrent virtual users against the console (or a local
+stand-in) with the console load generator, and checking error rates and per-action latency
+percentiles. Steps are async-native (see framework/fixtures/async_steps.py).
+"""
+
+import logging
+import re
+from pathlib import Path
+from typing import Any, Dict
+
+import yaml
+from pytest import FixtureRequest
+from pytest_bdd import given, parsers, scenarios, then
+
+from framework.cli.openshift_cli import OpenShiftCLI
+from framework.config.config import Config
+from framework.fixtures.async_steps import async_given, async_when
+from framework.helpers.console_load_generator import (
+    ConsoleLoadGenerator,
+    ConsoleLoadReport,
+    LoadTargets,
+    LocalConsoleStandIn,
+    RampProfile,
+)
+from framework.helpers.log_pipeline import worker_id
+from framework.helpers.network_conditions import EmulatedConditions
+from framework.helpers.resource_factory import ResourceFactory
+from framework.helpers.yaml_loader import YamlLoader
+
+logger = logging.getLogger(__name__)
+
+# Register all scenarios from the console_load feature file
+FEATURE_FILE = Path(__file__).parent.parent / "features" / "console_load.feature"
+scenarios(FEATURE_FILE)
+
+
+@given("a local console stand-in is running", target_fixture="console_load_target")
+def start_local_console_stand_in(request: FixtureRequest) -> Dict[str, Any]:
+    """
+    Start a local stand-in that answers like the console's Kubernetes API proxy, for runs without a cluster.
+
+    :param FixtureRequest request: Pytest request, used to stop the stand-in after the scenario
+    :return: Dict[str, Any]: Load target: base_url and targets (API users only: no session, no browser)
+    """
+    stand_in = LocalConsoleStandIn(response_delay_seconds=0.02).start()
+    request.addfinalizer(stand_in.stop)
+    return {"base_url": stand_in.url, "targets": stand_in.targets}
+
+
+@async_given(
+    parsers.parse("{pipelines:d} pipelines with {runs:d} pipelineruns are created via cli as console load targets"),
+    target_fixture="console_load_target",
+)
+async def create_console_load_targets(
+    pipelines: int,
+    runs: int,
+    page: Dict[str, Any],
+    openshift_cli: OpenShiftCLI,
+    test_project: str,
+    config: Config,
+    browser_context_args: Dict[str, Any],
+) -> Dict[str, Any]:
+    """
+    Create numbered Pipelines and PipelineRuns (spread over the Pipelines) via OpenShift CLI, and
+    take the logged-in console session and the session browser for the virtual users.
+
+    :param int pipelines: Number of Pipelines
+    :param int runs: Number of PipelineRuns
+    :param Dict[str, Any] page: Page object dictionary (its context holds the logged-in session)
+    :param OpenShiftCLI openshift_cli: CLI wrapper instance
+    :param str test_project: The test project name from CLI fixture (module-scoped)
+    :param Config config: Config object containing application configuration
+    :param Dict[str, Any] browser_context_args: Browser context arguments of the browser users
+    :return: Dict[str, Any]: Load target: base_url, targets, the session and what browser users need
+    """
+    pipeline_names, pipeline_documents = ResourceFactory.render_copies(
+        YamlLoader.load_pipeline_yaml("simple_pipeline.yaml"), pipelines, "load-pipeline-"
+    )
+    run_names, run_documents = ResourceFactory.render_copies(
+        YamlLoader.load_pipelinerun_yaml("simple_pipelinerun.yaml"), runs, "load-pipelinerun-"
+    )
+    for index, document in enumerate(run_documents):
+        resource = yaml.safe_load(document)
+        resource["spec"]["pipelineRef"]["name"] = pipeline_names[index % pipelines]
+        run_documents[index] = yaml.safe_dump(resource, sort_keys=False)
+
+    # Pipelines first: a PipelineRun of a missing Pipeline fails right away
+    for kind, documents in (("Pipelines", pipeline_documents), ("PipelineRuns", run_documents)):
+        success = await openshift_cli.apply_yaml_documents(documents, namespace=test_project)
+        assert success, f"Failed to create {len(documents)} {kind} for the console load via CLI"
+    logger.info("Created %s Pipelines and %s PipelineRuns as console load targets", pipelines, runs)
+
+    context = page["raw_page"].context
+    return {
+        "base_url": config.base_url,
+        "targets": LoadTargets(test_project, tuple(pipeline_names), tuple(run_names)),
+        "storage_state": await context.storage_state(),
+        "browser": context.browser,
+        "config": config,
+        "context_args": browser_context_args,
+    }
+
+
+@async_when(
+    parsers.parse(
+        'virtual users load the console with ramp profile "{profile}" and {browser_percent:d} percent browser users'
+    ),
+    target_fixture="console_load_report",
+)
+async def run_console_load(
+    profile: str,
+    browser_percent: int,
+    console_load_target: Dict[str, Any],
+    emulated_conditions: EmulatedConditions,
+    request: FixtureRequest,
+) -> ConsoleLoadReport:
+    """
+    Run virtual users along the ramp profile and write the report to ``<artifacts-dir>/load``.
+    Targets without a browser (the local stand-in) run API users only.
+
+    :param str profile: Ramp profile, e.g. "1m:50, 3m:50, 30s:0"
+    :param int browser_percent: Share of browser users in percent; the others are API users
+    :param Dict[str, Any] console_load_target: Console URL, load targets, session and browser
+    :param EmulatedConditions emulated_conditions: Network and CPU conditions of the browser users
+    :param FixtureRequest request: Pytest request, used for the options and the report name
+    :return: ConsoleLoadReport: Every user action of the run
+    """
+    generator = ConsoleLoadGenerator(
+        console_load_target["base_url"],
+        console_load_target["targets"],
+        console_load_target.get("storage_state"),
+        browser=console_load_target.get("browser"),
+        config=console_load_target.get("config"),
+        context_args=console_load_target.get("context_args"),
+        browser_share=browser_percent / 100,
+        verify_ssl=not request.config.getoption("--ignore-ssl-errors", default=True),
+        conditions=emulated_conditions,
+    )
+    report = await generator.run(RampProfile.parse(profile))
+
+    artifacts_dir = Path(request.config.getoption("--artifacts-dir", default="test-artifacts"))
+    scenario = re.sub(r"[^\w.-]+", "_", request.node.name)
+    path = report.write(artifacts_dir / "load" / f"{worker_id()}-{scenario}.json")
+    logger.info("Console load report written to %s", path)
+    return report
+
+
+@then(parsers.parse("the console load error rate should be below {max_error_percent:d} percent"))
+def verify_console_load_error_rate(max_error_percent: int, console_load_report: ConsoleLoadReport) -> None:
+    """
+    Verify that the share of failed user actions stayed below the limit.
+
+    :param int max_error_percent: Maximum share of failed actions in percent
+    :param ConsoleLoadReport console_load_report: Outcome of the load run
+    :return: None: Raises AssertionError if too many actions failed
+    """
+    assert console_load_report.samples, f"No user actions were recorded: {console_load_report.summary()}"
+    failed = console_load_report.failed
+    assert console_load_report.error_rate * 100 < max_error_percent, (
+        f"{console_load_report.summary()}\nfirst failures: "
+        f"{[(sample.user, sample.action, sample.error) for sample in failed[:5]]}"
+    )
+
+
+@then(parsers.parse("the p95 latency of every console action should be below {p95_ms:d} milliseconds"))
+def verify_console_action_latencies(p95_ms: int, console_load_report: ConsoleLoadReport) -> None:
+    """
+    Verify the 95th latency percentile of every user action.
+
+    :param int p95_ms: Maximum p95 latency in milliseconds
+    :param ConsoleLoadReport console_load_report: Outcome of the load run
+    :return: None: Raises AssertionError if any action is slower
+    """
+    slow = {
+        action: stats["p95_ms"] for action, stats in console_load_report.actions().items() if stats["p95_ms"] > p95_ms
+    }
+    assert not slow, f"p95 latency above {p95_ms}ms for {slow}\n{console_load_report.summary()}"
@@ -12,6 +12,7 @@ from typing import Any, Dict
 from pytest_bdd import given, parsers, then, when
 
 from framework.fixtures.async_bridge import run_async
+from framework.ui_components.console_router import ConsoleRouter
 
 
 @given("Validate Pipelines button is visible in the left navigation bar")
@@ -44,8 +45,9 @@ def user_navigates_to_pipelines_section(page: Dict[str, Any], playwright_event_l
 def user_expands_pipelines_menu(page: Dict[str, Any], playwright_event_loop: asyncio.AbstractEventLoop) -> None:
     """
     Expands the Pipelines menu in left navigation bar if not already expanded.
-    Checks aria-expanded attribute of Pipelines button. If not expanded, clicks Pipelines button to expand.
-    If already expanded, does nothing.
+    Skips the check when the page's ConsoleState already knows the menu is expanded (the state is
+    reset on every document load). Otherwise checks aria-expanded attribute of Pipelines button.
+    If not expanded, clicks Pipelines button to expand. If already expanded, does nothing.
 
     :param Dict[str, Any] page: Dictionary containing Page Object instances (from page fixture).
     :param asyncio.AbstractEventLoop playwright_event_loop: Event loop for async execution.
@@ -57,6 +59,10 @@ def user_expands_pipelines_menu(page: Dict[str, Any], playwright_event_loop: asy
     logger = logging.getLogger(__name__)
 
     async def _step() -> None:
+        if page["state"].pipelines_menu_expanded:
+            logger.info("[EXPAND PIPELINES STEP] Menu known to be expanded, skipping step")
+            return
+
         step_start = time.time()
         logger.info("[EXPAND PIPELINES STEP] Starting expand Pipelines step")
 
@@ -116,18 +122,12 @@ def user_shrinks_pipelines_menu(page: Dict[str, Any], playwright_event_loop: asy
 @then("the user navigates to the Pipelines page")
 def user_navigates_to_pipelines(page: Dict[str, Any], playwright_event_loop: asyncio.AbstractEventLoop) -> None:
     """
-    step for navigating to the Pipelines page and verifying successful navigation.
+    step for navigating to the Pipelines page by URL and verifying successful navigation.
     :param Dict[str, Any] page: Dictionary containing Page Object instances (from page fixture).
-    :return: None: Raises TimeoutError if navigation elements are not clickable within the timeout.
+    :return: None: Raises TimeoutError if the page does not load within the timeout.
     Raises AssertionError if navigation verification fails.
     """
-    assert run_async(playwright_event_loop, page["nav"].navigate_to_pipelines()), (
-        "Failed to navigate to Pipelines page."
-    )
-    assert run_async(playwright_event_loop, page["pipelines"].list.verify_on_page()), (
-        "Pipelines page verification failed."
-    )
-    assert run_async(playwright_event_loop, page["pipelines"].list.verify_data_load(tab_name="Pipelines tab"))
+    run_async(playwright_event_loop, _navigate_and_verify(page, "Pipelines", ConsoleRouter.MODE_DIRECT))
 
 
 @when("the user navigates to PipelineRuns tab")
@@ -149,45 +149,87 @@ def user_navigates_to_pipeline_runs_tab(page: Dict[str, Any], playwright_event_l
 @then("the user navigates to the Overview page")
 def user_navigates_to_overview(page: Dict[str, Any], playwright_event_loop: asyncio.AbstractEventLoop) -> None:
     """
-    step for navigating to the Pipelines Overview page and verifying successful navigation.
+    step for navigating to the Pipelines Overview page by URL and verifying successful navigation.
     :param Dict[str, Any] page: Dictionary containing Page Object instances (from page fixture).
-    :return: None: Raises TimeoutError if navigation elements are not clickable within the timeout.
+    :return: None: Raises TimeoutError if the page does not load within the timeout.
     Raises AssertionError if navigation verification fails.
     """
-    assert run_async(playwright_event_loop, page["nav"].navigate_to_overview()), "Failed to navigate to Overview page."
-    assert run_async(playwright_event_loop, page["pipelines"].overview.verify_on_page()), (
-        "Pipelines Overview page verification failed."
-    )
+    run_async(playwright_event_loop, _navigate_and_verify(page, "Overview", ConsoleRouter.MODE_DIRECT))
 
 
 @when("the user navigates to the Tasks page")
 @then("the user navigates to the Tasks page")
 def user_navigates_to_tasks(page: Dict[str, Any], playwright_event_loop: asyncio.AbstractEventLoop) -> None:
     """
-    step for navigating to the Tasks page and verifying successful navigation.
+    step for navigating to the Tasks page by URL and verifying successful navigation.
     :param Dict[str, Any] page: Dictionary containing Page Object instances (from page fixture).
-    :return: None: Raises TimeoutError if navigation elements are not clickable within the timeout.
+    :return: None: Raises TimeoutError if the page does not load within the timeout.
     Raises AssertionError if navigation verification fails.
     """
-    assert run_async(playwright_event_loop, page["nav"].navigate_to_tasks()), "Failed to navigate to Tasks page."
-    assert run_async(playwright_event_loop, page["tasks"].list.verify_on_page()), "Tasks page verification failed."
-    assert run_async(playwright_event_loop, page["tasks"].list.verify_data_load(tab_name="Tasks tab"))
+    run_async(playwright_event_loop, _navigate_and_verify(page, "Tasks", ConsoleRouter.MODE_DIRECT))
 
 
 @when("the user navigates to the Triggers page")
 @then("the user navigates to the Triggers page")
 def user_navigates_to_triggers(page: Dict[str, Any], playwright_event_loop: asyncio.AbstractEventLoop) -> None:
     """
-    step for navigating to the Triggers page and verifying successful navigation.
+    step for navigating to the Triggers page by URL and verifying successful navigation.
+    :param Dict[str, Any] page: Dictionary containing Page Object instances (from page fixture).
+    :return: None: Raises TimeoutError if the page does not load within the timeout.
+    Raises AssertionError if navigation verification fails.
+    """
+    run_async(playwright_event_loop, _navigate_and_verify(page, "Triggers", ConsoleRouter.MODE_DIRECT))
+
+
+@when(parsers.parse("the user navigates to the {section_name} page via the left navigation bar"))
+@then(parsers.parse("the user navigates to the {section_name} page via the left navigation bar"))
+def user_navigates_via_left_navigation_bar(
+    page: Dict[str, Any], section_name: str, playwright_event_loop: asyncio.AbstractEventLoop
+) -> None:
+    """
+    step for navigating to a section by clicking through the left navigation bar (expands the
+    Pipelines menu if needed) and verifying successful navigation.
+    Use this form in scenarios that exercise the navigation bar itself.
     :param Dict[str, Any] page: Dictionary containing Page Object instances (from page fixture).
+    :param str section_name: Section name ("Overview", "Pipelines", "Tasks" or "Triggers").
     :return: None: Raises TimeoutError if navigation elements are not clickable within the timeout.
     Raises AssertionError if navigation verification fails.
     """
-    assert run_async(playwright_event_loop, page["nav"].navigate_to_triggers()), "Failed to navigate to Triggers page."
-    assert run_async(playwright_event_loop, page["triggers"].list.verify_on_page()), (
-        "Triggers page verification failed."
+    run_async(playwright_event_loop, _navigate_and_verify(page, section_name, ConsoleRouter.MODE_CLICK))
+
+
+async def _navigate_and_verify(page: Dict[str, Any], section_name: str, mode: str) -> None:
+    """
+    Opens a top-level section and verifies the landing page (and its data load, for list pages).
+    In direct mode the navigation is skipped when the page already shows the section in the current
+    namespace (e.g., a Background step repeated by the next scenario); the verification still runs.
+    :param Dict[str, Any] page: Dictionary containing Page Object instances (from page fixture).
+    :param str section_name: Section name ("Overview", "Pipelines", "Tasks" or "Triggers").
+    :param str mode: ConsoleRouter.MODE_DIRECT or ConsoleRouter.MODE_CLICK.
+    :return: None: Raises AssertionError if navigation or verification fails.
+    """
+    landing_pages = {
+        "Overview": page["pipelines"].overview,
+        "Pipelines": page["pipelines"].list,
+        "Tasks": page["tasks"].list,
+        "Triggers": page["triggers"].list,
+    }
+    assert section_name in landing_pages, (
+        f"Unknown section '{section_name}'. Valid options: {list(landing_pages.keys())}"
+    )
+    landing_page = landing_pages[section_name]
+
+    state = page["state"]
+    already_open = mode == ConsoleRouter.MODE_DIRECT and state.is_at(
+        page["router"].section_url(section_name.lower(), state.namespace)
     )
-    assert run_async(playwright_event_loop, page["triggers"].list.verify_data_load(tab_name="Triggers tab"))
+    if not already_open:
+        assert await page["router"].open_section(section_name.lower(), mode=mode), (
+            f"Failed to navigate to {section_name} page."
+        )
+    assert await landing_page.verify_on_page(), f"{section_name} page verification failed."
+    if section_name != "Overview":
+        assert await landing_page.verify_data_load(tab_name=f"{section_name} tab")
 
 
 @then(parsers.parse("Verify the following {links} are available under Pipelines button"))
@@ -10,7 +10,11 @@ from typing import Any, Dict, List
 
 from pytest_bdd import parsers, scenarios, then, when
 
+from framework.cli.openshift_cli import OpenShiftCLI
 from framework.fixtures.async_bridge import run_async
+from framework.fixtures.async_steps import async_then
+from framework.ui_components.commons.parameter_table import ParameterRecord
+from framework.ui_components.pipeline_builder import PipelineSpec, PipelineTaskSpec, diff_pipeline_specs
 
 # Register all scenarios from the pipeline_builder_sanity feature file
 FEATURE_FILE = Path(__file__).parent.parent / "features" / "pipeline_builder.feature"
@@ -162,7 +166,7 @@ def add_pipeline_parameter(
     Add a pipeline parameter to the pipeline definition.
 
     Pipeline parameters allow pipelines to accept input values at runtime.
-    Waits for parameter input fields to be visible before configuring.
+    The parameter is appended after the parameters already in the form.
 
     :param Dict[str, Any] page: Page object dictionary containing page components
     :param str param_name: Name of the parameter (e.g., "image-name", "revision")
@@ -172,10 +176,8 @@ def add_pipeline_parameter(
     """
 
     async def _step() -> None:
-        await page["pipelines"].builder.builder_view.click_add_parameter()
-
-        success = await page["pipelines"].builder.builder_view.configure_pipeline_parameter(
-            param_index=0, name=param_name, description=param_description
+        success = await page["pipelines"].builder.builder_view.configure_pipeline_parameters(
+            [ParameterRecord(name=param_name, description=param_description)]
         )
         assert success, f"Failed to configure pipeline parameter '{param_name}'"
 
@@ -190,7 +192,7 @@ def add_pipeline_workspace(
     Add a pipeline workspace to the pipeline definition.
 
     Workspaces provide shared storage volumes that can be passed between tasks.
-    Waits for workspace input fields to be visible before configuring.
+    The workspace is appended after the workspaces already in the form.
 
     :param Dict[str, Any] page: Page object dictionary containing page components
     :param str workspace_name: Name of the workspace (e.g., "source", "output", "cache")
@@ -199,11 +201,7 @@ def add_pipeline_workspace(
     """
 
     async def _step() -> None:
-        await page["pipelines"].builder.builder_view.click_add_workspace()
-
-        success = await page["pipelines"].builder.builder_view.configure_pipeline_workspace(
-            workspace_index=0, name=workspace_name
-        )
+        success = await page["pipelines"].builder.builder_view.configure_pipeline_workspaces([workspace_name])
         assert success, f"Failed to configure pipeline workspace '{workspace_name}'"
 
     run_async(playwright_event_loop, _step())
@@ -299,6 +297,132 @@ def configure_task_with_params(
     run_async(playwright_event_loop, _step())
 
 
+@when(
+    parsers.parse(
+        'the user builds pipeline "{pipeline_name}" as a chain of {count:d} "{task_name}" tasks '
+        'from namespace "{task_namespace}" in {mode} view'
+    ),
+    target_fixture="built_pipeline_spec",
+)
+def build_pipeline_chain(
+    page: Dict[str, Any],
+    pipeline_name: str,
+    count: int,
+    task_name: str,
+    task_namespace: str,
+    mode: str,
+    playwright_event_loop: asyncio.AbstractEventLoop,
+) -> PipelineSpec:
+    """
+    Build a pipeline whose tasks run one after another, as a single graph construction.
+
+    :param Dict[str, Any] page: Page object dictionary containing page components
+    :param str pipeline_name: Name of the pipeline
+    :param int count: Number of tasks in the chain
+    :param str task_name: Task every pipeline task references (e.g., "openshift-client")
+    :param str task_namespace: Namespace the task is resolved from (e.g., "openshift-pipelines")
+    :param str mode: "builder" (ends in builder view) or "yaml" (ends in YAML view)
+    :param asyncio.AbstractEventLoop playwright_event_loop: Event loop for async execution
+    :return: PipelineSpec: The intended pipeline graph. Raises AssertionError if it cannot be built
+    """
+
+    async def _step() -> PipelineSpec:
+        task_names = [f"{task_name}-{index + 1}" for index in range(count)]
+        spec = PipelineSpec(
+            name=pipeline_name,
+            tasks=[
+                PipelineTaskSpec(
+                    name=name,
+                    task=task_name,
+                    run_after=task_names[index - 1 : index],
+                    resolver_namespace=task_namespace,
+                )
+                for index, name in enumerate(task_names)
+            ],
+        )
+        built = await page["pipelines"].builder.build_pipeline(spec, mode=mode)
+        assert built, f"Failed to build pipeline '{pipeline_name}' with {count} tasks in {mode} view"
+        return spec
+
+    return run_async(playwright_event_loop, _step())
+
+
+@async_then("the pipeline stored in the cluster should match the built pipeline")
+async def verify_built_pipeline_in_cluster(
+    built_pipeline_spec: PipelineSpec, openshift_cli: OpenShiftCLI, test_project: str
+) -> None:
+    """
+    Verify that the saved Pipeline holds the intended graph, as read back from the cluster.
+
+    Compares tasks, runAfter edges, params and workspaces order-insensitively; all mismatches
+    are reported together. The builder's own YAML view is not used here: in YAML mode it only
+    holds the YAML the build step wrote.
+
+    :param PipelineSpec built_pipeline_spec: The intended pipeline graph
+    :param OpenShiftCLI openshift_cli: CLI wrapper instance
+    :param str test_project: The test project name from CLI fixture (module-scoped)
+    :return: None: Raises AssertionError listing every mismatch
+    """
+    stored_yaml = await openshift_cli.get_resource_yaml("pipeline", built_pipeline_spec.name, namespace=test_project)
+    assert stored_yaml, f"Pipeline '{built_pipeline_spec.name}' could not be read from the cluster"
+    mismatches = diff_pipeline_specs(built_pipeline_spec, PipelineSpec.from_yaml(stored_yaml))
+    assert not mismatches, (
+        f"Pipeline '{built_pipeline_spec.name}' in the cluster differs from the built pipeline:\n  - "
+        + "\n  - ".join(mismatches)
+    )
+
+
+@then(
+    parsers.parse(
+        'the pipeline "{pipeline_name}" in the YAML view should have task "{task_name}" of Task "{task_ref}" '
+        'using workspace "{workspace_name}"'
+    )
+)
+def verify_builder_task_in_yaml_view(
+    page: Dict[str, Any],
+    pipeline_name: str,
+    task_name: str,
+    task_ref: str,
+    workspace_name: str,
+    playwright_event_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """
+    Verify, before saving, the graph the builder form produced from the quick-search task and its side panel.
+
+    The pipeline must hold exactly one task, bound to the pipeline workspace of the same name.
+    The Task's params are filled in by the builder from its defaults and are not compared.
+
+    :param Dict[str, Any] page: Page object dictionary containing page components
+    :param str pipeline_name: Expected pipeline name
+    :param str task_name: Expected pipeline task name (the display name set in the side panel)
+    :param str task_ref: Name of the referenced Task (e.g., "git-cli")
+    :param str workspace_name: Pipeline workspace the task's workspace of the same name is bound to
+    :param asyncio.AbstractEventLoop playwright_event_loop: Event loop for async execution
+    :return: None: Raises AssertionError listing every mismatch
+    """
+
+    async def _step() -> None:
+        builder = page["pipelines"].builder
+        actual = await builder.read_pipeline_spec()
+        # Quick search resolves installed Tasks either by cluster resolver or by name; take whichever the builder chose
+        resolver_namespace = next((task.resolver_namespace for task in actual.tasks if task.task == task_ref), None)
+        expected = PipelineSpec(
+            name=pipeline_name,
+            tasks=[
+                PipelineTaskSpec(
+                    task_name,
+                    task_ref,
+                    workspaces={workspace_name: workspace_name},
+                    resolver_namespace=resolver_namespace,
+                )
+            ],
+            workspaces=[workspace_name],
+        )
+        await builder.verify_pipeline_spec(expected, ignore_params=True)
+
+    run_async(playwright_event_loop, _step())
+
+
 @then("the user should be on pipeline details page")
 def verify_on_pipeline_details_page(page: Dict[str, Any], playwright_event_loop: asyncio.AbstractEventLoop) -> None:
     """
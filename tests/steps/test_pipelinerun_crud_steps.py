@@ -11,12 +11,17 @@ from typing import Any, Dict
 
 from pytest_bdd import parsers, scenarios, then, when
 
+from framework.cli.openshift_cli import OpenShiftCLI
 from framework.fixtures.async_bridge import run_async
+from framework.helpers.prerequisite_scheduler import Prerequisite
 
 # Register all scenarios from the pipelinerun_crud_operations feature file
 FEATURE_FILE = Path(__file__).parent.parent / "features" / "pipelinerun_crud_operations.feature"
 scenarios(FEATURE_FILE)
 
+# Applied in the background while the Background logs in and navigates
+CLUSTER_PREREQUISITES = [Prerequisite("pipeline", "simple_pipeline.yaml")]
+
 
 @then(parsers.parse('validate user is redirected to pipelinerun details page for pipelinerun "{pipelinerun_name}"'))
 def validate_pipelinerun_details(
@@ -171,13 +176,19 @@ def verify_pipelinerun_status_of_given_pipeline_name(
 
 @when(parsers.parse('the user deletes the pipelinerun "{pipelinerun_name}"'))
 def delete_pipelinerun(
-    page: Dict[str, Any], pipelinerun_name: str, playwright_event_loop: asyncio.AbstractEventLoop
+    page: Dict[str, Any],
+    pipelinerun_name: str,
+    openshift_cli: OpenShiftCLI,
+    test_project: str,
+    playwright_event_loop: asyncio.AbstractEventLoop,
 ) -> None:
     """
     Delete a PipelineRun using the kebab menu and confirmation modal.
 
     :param Dict[str, Any] page: Page object dictionary
     :param str pipelinerun_name: Name or name prefix of the PipelineRun to delete
+    :param OpenShiftCLI openshift_cli: CLI wrapper instance used to confirm the resource is gone
+    :param str test_project: The test project name from CLI fixture (module-scoped)
     :param asyncio.AbstractEventLoop playwright_event_loop: Event loop for async execution
     :return: None: Raises AssertionError if deletion fails
     """
@@ -195,11 +206,11 @@ def delete_pipelinerun(
         assert delete_clicked, f"Failed to click 'Delete PipelineRun' menu item for '{pipelinerun_name}'"
 
         # Wait for confirmation modal to appear and confirm deletion using modal component
-        confirmation_success = await page["modal"].confirm_deletion(pipelinerun_name)
-        assert confirmation_success, f"Failed to confirm deletion of PipelineRun '{pipelinerun_name}'"
+        deletion = await page["modal"].start_deletion(pipelinerun_name)
 
-        # Wait for deletion to complete
-        await page["raw_page"].wait_for_timeout(2000)
+        # Wait for the DELETE API response, the modal to close and the resource to be gone from the cluster
+        deletion_complete = await deletion.wait(openshift_cli, "pipelineruns.tekton.dev", test_project)
+        assert deletion_complete, f"Failed to confirm deletion of PipelineRun '{pipelinerun_name}'"
 
     run_async(playwright_event_loop, _step())
 
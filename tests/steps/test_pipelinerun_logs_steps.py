@@ -9,11 +9,12 @@ Step definitions are reused across two feature files:
 """
 
 import asyncio
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from pytest_bdd import parsers, scenarios, then, when
 
 from framework.fixtures.async_bridge import run_async
+from framework.helpers.step_reporter import StepReporter
 
 # Register scenarios from both feature files
 scenarios("../features/pipelinerun_logs_validation.feature")
@@ -234,16 +235,22 @@ def wait_for_logs_load(page: Dict[str, Any], playwright_event_loop: asyncio.Abst
 
 @then(parsers.parse('the logs for task "{task_name}" should contain "{expected_text}"'))
 def verify_task_logs_contain_text(
-    page: Dict[str, Any], task_name: str, expected_text: str, playwright_event_loop: asyncio.AbstractEventLoop
+    page: Dict[str, Any],
+    task_name: str,
+    expected_text: str,
+    step_reporter: Optional[StepReporter],
+    playwright_event_loop: asyncio.AbstractEventLoop,
 ) -> None:
     """
     Verify task logs contain specific expected text.
 
     Navigates to the specified task and validates that its log output includes the expected content.
+    The harvested logs are attached to the ReportPortal launch when reporting is on.
 
     :param Dict[str, Any] page: Page object dictionary containing PipelineRun logs page instance
     :param str task_name: Name of the task whose logs to verify
     :param str expected_text: Text that should be present in the task logs
+    :param Optional[StepReporter] step_reporter: Step reporter, or None if reporting is off
     :param asyncio.AbstractEventLoop playwright_event_loop: Event loop for async execution
     :return: None: Raises AssertionError if expected text not found in logs
     """
@@ -251,6 +258,8 @@ def verify_task_logs_contain_text(
 
     async def _verify() -> bool:
         logs_content = await logs_page.get_logs_for_task(task_name)
+        if step_reporter is not None:
+            step_reporter.attach(f"{task_name}.log", logs_content.encode(), "text/plain", f"Logs of task {task_name}")
         return expected_text in logs_content
 
     assert run_async(playwright_event_loop, _verify()), (
@@ -10,62 +10,74 @@ This file follows the separation of concerns principle:
 - Shared/reusable steps across features belong here
 
 Following DRY (Don't Repeat Yourself) principle for better maintainability.
+
+Steps are async-native (see framework/fixtures/async_steps.py): the trigger prerequisites are
+applied in the background, so UI steps of the scenario overlap with the CLI work.
 """
 
-import asyncio
 import logging
 from typing import Any, Dict
 
-from pytest_bdd import given, parsers, when
+from pytest_bdd import parsers
 
 from framework.cli.openshift_cli import OpenShiftCLI
-from framework.fixtures.async_bridge import run_async
+from framework.fixtures.async_steps import ScenarioTaskGroup, async_given, async_when
+from framework.helpers.prerequisite_scheduler import Prerequisite, PrerequisiteScheduler
 from framework.helpers.yaml_loader import YamlLoader
 
 logger = logging.getLogger(__name__)
 
+# Trigger resources the EventListeners of the trigger features refer to
+PREREQUISITE_YAML_FILES = ["simple_triggerbinding.yaml", "simple_triggertemplate.yaml"]
 
-@given(parsers.parse('the user creates a pipeline via cli from YAML file "{pipeline_yaml_file}"'))
-@when(parsers.parse('the user creates a pipeline via cli from YAML file "{pipeline_yaml_file}"'))
-def create_pipeline_via_cli(
-    pipeline_yaml_file: str, openshift_cli: OpenShiftCLI, playwright_event_loop: asyncio.AbstractEventLoop
-) -> None:
+# Name of the background task that applies the trigger prerequisites
+TRIGGER_PREREQUISITES_TASK = "trigger-prerequisites"
+
+
+async def wait_for_trigger_prerequisites(scenario_tasks: ScenarioTaskGroup) -> None:
+    """
+    Wait for the trigger prerequisites if this scenario started creating them in the background.
+
+    :param ScenarioTaskGroup scenario_tasks: Background tasks of the scenario
+    :return: None: Raises AssertionError if the prerequisites could not be created
+    """
+    if TRIGGER_PREREQUISITES_TASK in scenario_tasks:
+        await scenario_tasks.wait_for(TRIGGER_PREREQUISITES_TASK)
+
+
+@async_given(parsers.parse('the user creates a pipeline via cli from YAML file "{pipeline_yaml_file}"'))
+@async_when(parsers.parse('the user creates a pipeline via cli from YAML file "{pipeline_yaml_file}"'))
+async def create_pipeline_via_cli(pipeline_yaml_file: str, cluster_prerequisites: PrerequisiteScheduler) -> None:
     """
     Create a Tekton Pipeline via OpenShift CLI by loading YAML from test data.
 
     This step creates the prerequisite Pipeline resource that a PipelineRun will reference.
-    The Pipeline is applied to the current project/namespace using oc apply.
+    The Pipeline is applied to the test project using oc apply. If the feature declares the file
+    in CLUSTER_PREREQUISITES, the step awaits the apply started in the background instead.
 
     :param str pipeline_yaml_file: Name of pipeline YAML file in test_data/pipelines/
-    :param OpenShiftCLI openshift_cli: CLI wrapper instance
-    :param asyncio.AbstractEventLoop playwright_event_loop: Event loop for async execution
+    :param PrerequisiteScheduler cluster_prerequisites: Scheduler of the feature's cluster prerequisites
     :return: None: Raises AssertionError if pipeline creation fails
     """
+    # Load pipeline YAML content using helper
+    yaml_content = YamlLoader.load_pipeline_yaml(pipeline_yaml_file)
+    logger.info(f"Loaded Pipeline YAML from '{pipeline_yaml_file}'")
 
-    async def _step() -> None:
-        # Load pipeline YAML content using helper
-        yaml_content = YamlLoader.load_pipeline_yaml(pipeline_yaml_file)
-        logger.info(f"Loaded Pipeline YAML from '{pipeline_yaml_file}'")
-
-        # Apply the pipeline YAML via CLI
-        success = await openshift_cli.apply_yaml(yaml_content)
-        assert success, f"Failed to create pipeline from YAML file '{pipeline_yaml_file}' via CLI"
+    # Apply the pipeline YAML via CLI (or await the scheduled apply)
+    success = await cluster_prerequisites.apply(Prerequisite("pipeline", pipeline_yaml_file))
+    assert success, f"Failed to create pipeline from YAML file '{pipeline_yaml_file}' via CLI"
 
-        # Extract pipeline name from YAML for logging
-        metadata = YamlLoader.get_pipeline_metadata(yaml_content)
-        pipeline_name = metadata.get("name", "unknown")
+    # Extract pipeline name from YAML for logging
+    metadata = YamlLoader.get_pipeline_metadata(yaml_content)
+    pipeline_name = metadata.get("name", "unknown")
 
-        # Log successful creation
-        logger.info(f"Successfully created pipeline '{pipeline_name}' via CLI")
+    # Log successful creation
+    logger.info(f"Successfully created pipeline '{pipeline_name}' via CLI")
 
-    run_async(playwright_event_loop, _step())
 
-
-@given(parsers.parse('the user creates a pipelinerun from YAML file "{yaml_file}"'))
-@when(parsers.parse('the user creates a pipelinerun from YAML file "{yaml_file}"'))
-def create_pipelinerun_from_yaml(
-    page: Dict[str, Any], yaml_file: str, playwright_event_loop: asyncio.AbstractEventLoop, config: object
-) -> None:
+@async_given(parsers.parse('the user creates a pipelinerun from YAML file "{yaml_file}"'))
+@async_when(parsers.parse('the user creates a pipelinerun from YAML file "{yaml_file}"'))
+async def create_pipelinerun_from_yaml(page: Dict[str, Any], yaml_file: str, config: object) -> None:
     """
     Create a PipelineRun by loading YAML from test data and submitting via UI.
 
@@ -74,47 +86,67 @@ def create_pipelinerun_from_yaml(
 
     :param Dict[str, Any] page: Page object dictionary
     :param str yaml_file: Name of YAML file in test_data/pipelineruns/
-    :param asyncio.AbstractEventLoop playwright_event_loop: Event loop for async execution
     :param object config: Config object for timeout values
     :return: None: Raises AssertionError if creation fails
     """
+    # Load YAML content using helper
+    yaml_content = YamlLoader.load_pipelinerun_yaml(yaml_file)
+    logger.info(f"Loaded YAML content from '{yaml_file}'")
+
+    # Wait for PipelineRuns tab data to load
+    data_loaded = await page["pipelines"].runs.verify_pipeline_runs_tab_data_load()
+    assert data_loaded, "PipelineRuns tab failed to load before creating PipelineRun"
+
+    # Click Create button and select PipelineRun from dropdown (combo method)
+    create_clicked = await page["pipelines"].list.click_create_pipeline_run()
+    assert create_clicked, "Failed to open Create dropdown and click PipelineRun option"
+
+    # Wait for Create PipelineRun page to load - Monaco editor should be visible
+    await page["raw_page"].wait_for_selector(".monaco-editor", state="visible", timeout=15000)
 
-    async def _step() -> None:
-        # Load YAML content using helper
-        yaml_content = YamlLoader.load_pipelinerun_yaml(yaml_file)
-        logger.info(f"Loaded YAML content from '{yaml_file}'")
+    # Verify we're on the Create PipelineRun page
+    on_create_page = await page["pipelines"].create_run.verify_on_page()
+    assert on_create_page, "Failed to navigate to Create PipelineRun page"
 
-        # Wait for PipelineRuns tab data to load
-        data_loaded = await page["pipelines"].runs.verify_pipeline_runs_tab_data_load()
-        assert data_loaded, "PipelineRuns tab failed to load before creating PipelineRun"
+    # Fill YAML editor using MonacoEditor component directly
+    yaml_filled = await page["pipelines"].create_run.monaco_editor.set_content(yaml_content)
+    assert yaml_filled, f"Failed to fill YAML editor with content from '{yaml_file}'"
 
-        # Click Create button and select PipelineRun from dropdown (combo method)
-        create_clicked = await page["pipelines"].list.click_create_pipeline_run()
-        assert create_clicked, "Failed to open Create dropdown and click PipelineRun option"
+    # Wait for Create button to become enabled (YAML validation completes)
+    await page["raw_page"].wait_for_selector('button:has-text("Create"):not([disabled])', timeout=15000)
 
-        # Wait for Create PipelineRun page to load - Monaco editor should be visible
-        await page["raw_page"].wait_for_selector(".monaco-editor", state="visible", timeout=15000)
+    # Click Create button to submit
+    create_submitted = await page["pipelines"].create_run.click_create()
+    assert create_submitted, "Failed to click Create button to submit PipelineRun YAML"
 
-        # Verify we're on the Create PipelineRun page
-        on_create_page = await page["pipelines"].create_run.verify_on_page()
-        assert on_create_page, "Failed to navigate to Create PipelineRun page"
+    # Wait for redirect to PipelineRun details page
+    await page["raw_page"].wait_for_load_state("networkidle", timeout=config.timeout_ms)
 
-        # Fill YAML editor using MonacoEditor component directly
-        yaml_filled = await page["pipelines"].create_run.monaco_editor.set_content(yaml_content)
-        assert yaml_filled, f"Failed to fill YAML editor with content from '{yaml_file}'"
+    # Log current URL after submission for debugging
+    current_url = page["raw_page"].url
+    logger.info(f"PipelineRun created successfully. Current URL: {current_url}")
 
-        # Wait for Create button to become enabled (YAML validation completes)
-        await page["raw_page"].wait_for_selector('button:has-text("Create"):not([disabled])', timeout=15000)
 
-        # Click Create button to submit
-        create_submitted = await page["pipelines"].create_run.click_create()
-        assert create_submitted, "Failed to click Create button to submit PipelineRun YAML"
+@async_given("the trigger prerequisites are created via cli")
+async def create_trigger_prerequisites_via_cli(
+    openshift_cli: OpenShiftCLI, test_project: str, scenario_tasks: ScenarioTaskGroup
+) -> None:
+    """
+    Start creating the ServiceAccount, RoleBinding, TriggerBinding and TriggerTemplate that the
+    EventListeners in the trigger test data refer to. oc apply is idempotent, so repeating it per scenario is cheap.
+
+    Runs in the background; steps that need the resources call wait_for_trigger_prerequisites().
 
-        # Wait for redirect to PipelineRun details page
-        await page["raw_page"].wait_for_load_state("networkidle", timeout=config.timeout_ms)
+    :param OpenShiftCLI openshift_cli: CLI wrapper instance
+    :param str test_project: The test project name from CLI fixture (module-scoped)
+    :param ScenarioTaskGroup scenario_tasks: Background tasks of the scenario
+    :return: None: Creation failures are raised by the step that waits for the prerequisites
+    """
 
-        # Log current URL after submission for debugging
-        current_url = page["raw_page"].url
-        logger.info(f"PipelineRun created successfully. Current URL: {current_url}")
+    async def _create() -> None:
+        documents = [YamlLoader.load_triggers_rbac_yaml()]
+        documents.extend(YamlLoader.load_trigger_yaml(yaml_file) for yaml_file in PREREQUISITE_YAML_FILES)
+        success = await openshift_cli.apply_yaml_documents(documents, namespace=test_project)
+        assert success, f"Failed to create trigger prerequisites in project '{test_project}' via CLI"
 
-    run_async(playwright_event_loop, _step())
+    scenario_tasks.start(TRIGGER_PREREQUISITES_TASK, _create())
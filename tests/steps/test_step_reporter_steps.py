@@ -0,0 +1,235 @@
+"""
+Step Reporter Test Steps.
+
+BDD step definitions for checking the ReportPortal step reporter against a local stand-in of
+the batch log API: batching, the switch to the spool when ReportPortal keeps failing, and
+dropping entries instead of blocking when the queue is full.
+"""
+
+import json
+import uuid
+from pathlib import Path
+
+from pytest import FixtureRequest
+from pytest_bdd import given, parsers, scenarios, then, when
+
+from framework.helpers.step_reporter import LocalReportPortalStandIn, StepReporter
+
+# Register all scenarios from the step_reporter feature file
+FEATURE_FILE = Path(__file__).parent.parent / "features" / "step_reporter.feature"
+scenarios(FEATURE_FILE)
+
+SCENARIO_NAME = "Step reporter stand-in"
+
+
+def _start_stand_in(request: FixtureRequest, status: int = 201, delay: float = 0.0) -> LocalReportPortalStandIn:
+    """
+    Start a local ReportPortal stand-in that is stopped after the scenario.
+
+    :param FixtureRequest request: Pytest request, used to stop the stand-in after the scenario
+    :param int status: HTTP status of every answer
+    :param float delay: Delay of every answer, in seconds
+    :return: LocalReportPortalStandIn: The running stand-in
+    """
+    stand_in = LocalReportPortalStandIn(status=status, response_delay_seconds=delay).start()
+    request.addfinalizer(stand_in.stop)
+    return stand_in
+
+
+@given("a local reportportal stand-in is running", target_fixture="reportportal_stand_in")
+def start_reportportal_stand_in(request: FixtureRequest) -> LocalReportPortalStandIn:
+    """
+    Start a local stand-in that accepts every batch like ReportPortal.
+
+    :param FixtureRequest request: Pytest request, used to stop the stand-in after the scenario
+    :return: LocalReportPortalStandIn: The running stand-in
+    """
+    return _start_stand_in(request)
+
+
+@given(
+    parsers.parse("a local reportportal stand-in is running that answers with status {status:d}"),
+    target_fixture="reportportal_stand_in",
+)
+def start_failing_reportportal_stand_in(request: FixtureRequest, status: int) -> LocalReportPortalStandIn:
+    """
+    Start a local stand-in that rejects every batch with the given status.
+
+    :param FixtureRequest request: Pytest request, used to stop the stand-in after the scenario
+    :param int status: HTTP status of every answer (e.g., 503)
+    :return: LocalReportPortalStandIn: The running stand-in
+    """
+    return _start_stand_in(request, status=status)
+
+
+@given(
+    parsers.parse("a local reportportal stand-in is running that answers after {delay:g} seconds"),
+    target_fixture="reportportal_stand_in",
+)
+def start_slow_reportportal_stand_in(request: FixtureRequest, delay: float) -> LocalReportPortalStandIn:
+    """
+    Start a local stand-in that accepts every batch after a delay.
+
+    :param FixtureRequest request: Pytest request, used to stop the stand-in after the scenario
+    :param float delay: Delay of every answer, in seconds
+    :return: LocalReportPortalStandIn: The running stand-in
+    """
+    return _start_stand_in(request, delay=delay)
+
+
+@given(
+    parsers.parse(
+        "a step reporter streams to the stand-in with batch size {batch_size:d} and queue size {queue_size:d}"
+    ),
+    target_fixture="local_step_reporter",
+)
+def start_local_step_reporter(
+    request: FixtureRequest,
+    tmp_path: Path,
+    reportportal_stand_in: LocalReportPortalStandIn,
+    batch_size: int,
+    queue_size: int,
+) -> StepReporter:
+    """
+    Start a step reporter that streams to the stand-in and spools to a temporary directory.
+
+    :param FixtureRequest request: Pytest request, used to close the reporter after the scenario
+    :param Path tmp_path: Temporary directory of the scenario (the spool directory goes there)
+    :param LocalReportPortalStandIn reportportal_stand_in: The running stand-in
+    :param int batch_size: Maximum number of entries per request
+    :param int queue_size: Maximum number of queued entries
+    :return: StepReporter: The started reporter
+    """
+    reporter = StepReporter(
+        reportportal_stand_in.url,
+        "release-ui",
+        "stand-in-api-key",
+        str(uuid.uuid4()),
+        tmp_path / "reportportal-spool",
+        queue_size=queue_size,
+        batch_size=batch_size,
+    ).start()
+    request.addfinalizer(reporter.close)
+    return reporter
+
+
+@when(parsers.parse("{count:d} step results are reported"))
+def report_step_results(local_step_reporter: StepReporter, count: int) -> None:
+    """
+    Report the given number of passed step results, as fast as possible.
+
+    :param StepReporter local_step_reporter: The reporter
+    :param int count: Number of step results
+    :return: None
+    """
+    for index in range(count):
+        local_step_reporter.step_result(SCENARIO_NAME, f"step {index}", "passed", 0.01)
+
+
+@when("the step reporter is closed")
+def close_step_reporter(local_step_reporter: StepReporter) -> None:
+    """
+    Close the reporter, which flushes or spools every queued entry.
+
+    :param StepReporter local_step_reporter: The reporter
+    :return: None
+    """
+    local_step_reporter.close()
+
+
+@then(
+    parsers.parse("the stand-in should have received all {count:d} step results in batches of at most {batch_size:d}")
+)
+def verify_step_results_batched(
+    reportportal_stand_in: LocalReportPortalStandIn, local_step_reporter: StepReporter, count: int, batch_size: int
+) -> None:
+    """
+    Verify that every step result reached the stand-in, in order, and that no batch was too large.
+
+    :param LocalReportPortalStandIn reportportal_stand_in: The stand-in
+    :param StepReporter local_step_reporter: The reporter
+    :param int count: Number of step results reported
+    :param int batch_size: Maximum number of entries per request
+    :return: None: Raises AssertionError if entries are missing or a batch is too large
+    """
+    messages = [entry["message"] for entry in reportportal_stand_in.entries()]
+    expected = [f"[PASSED] {SCENARIO_NAME} :: step {index}" for index in range(count)]
+    assert [message.split(" (")[0] for message in messages] == expected, (
+        f"Stand-in received {len(messages)} of {count} step results: {messages[:5]}"
+    )
+    sizes = [len(batch) for batch in reportportal_stand_in.batches]
+    assert max(sizes) <= batch_size, f"Batches larger than {batch_size} entries: {sizes}"
+    assert len(sizes) < count, f"Step results were not batched: {sizes}"
+    assert local_step_reporter.sent == count, f"Reporter counted {local_step_reporter.sent} sent entries"
+
+
+@then("no step results should be spooled or dropped")
+def verify_nothing_spooled_or_dropped(local_step_reporter: StepReporter) -> None:
+    """
+    Verify that the reporter neither spooled nor dropped any entry.
+
+    :param StepReporter local_step_reporter: The reporter
+    :return: None: Raises AssertionError if entries were spooled or dropped
+    """
+    assert local_step_reporter.spooled == 0, f"{local_step_reporter.spooled} entries were spooled"
+    assert local_step_reporter.dropped == 0, f"{local_step_reporter.dropped} entries were dropped"
+
+
+@then(parsers.parse("the stand-in should have received {count:d} batch requests"))
+def verify_batch_requests(reportportal_stand_in: LocalReportPortalStandIn, count: int) -> None:
+    """
+    Verify how many batch requests reached the stand-in (the reporter stops sending after repeated failures).
+
+    :param LocalReportPortalStandIn reportportal_stand_in: The stand-in
+    :param int count: Expected number of requests
+    :return: None: Raises AssertionError if the number differs
+    """
+    assert reportportal_stand_in.requests == count, (
+        f"Expected {count} batch requests, the stand-in received {reportportal_stand_in.requests}"
+    )
+
+
+@then(parsers.parse("all {count:d} step results should be spooled"))
+def verify_step_results_spooled(local_step_reporter: StepReporter, count: int) -> None:
+    """
+    Verify that every step result was written to the spool file instead of being sent.
+
+    :param StepReporter local_step_reporter: The reporter
+    :param int count: Number of step results reported
+    :return: None: Raises AssertionError if entries are missing from the spool
+    """
+    spool_file = local_step_reporter.spool_dir / "entries.jsonl"
+    spooled = [json.loads(line)["message"] for line in spool_file.read_text().splitlines()]
+    assert len(spooled) == count, f"Spool holds {len(spooled)} of {count} step results"
+    assert local_step_reporter.spooled == count and local_step_reporter.sent == 0, (
+        f"Reporter counted {local_step_reporter.sent} sent and {local_step_reporter.spooled} spooled entries"
+    )
+
+
+@then(parsers.parse("at least {count:d} step results should be dropped"))
+def verify_step_results_dropped(local_step_reporter: StepReporter, count: int) -> None:
+    """
+    Verify that step results beyond the queue size were dropped instead of blocking the caller.
+
+    :param StepReporter local_step_reporter: The reporter
+    :param int count: Minimum number of dropped entries
+    :return: None: Raises AssertionError if fewer entries were dropped
+    """
+    assert local_step_reporter.dropped >= count, (
+        f"Expected at least {count} dropped entries, got {local_step_reporter.dropped}"
+    )
+
+
+@then(parsers.parse("each of the {count:d} step results should be sent, spooled or dropped"))
+def verify_step_results_accounted(local_step_reporter: StepReporter, count: int) -> None:
+    """
+    Verify that the reporter's counters account for every step result.
+
+    :param StepReporter local_step_reporter: The reporter
+    :param int count: Number of step results reported
+    :return: None: Raises AssertionError if the counters do not add up
+    """
+    reporter = local_step_reporter
+    assert reporter.sent + reporter.spooled + reporter.dropped == count, (
+        f"{reporter.sent} sent + {reporter.spooled} spooled + {reporter.dropped} dropped != {count}"
+    )
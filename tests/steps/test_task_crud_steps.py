@@ -11,6 +11,7 @@ from typing import Any, Dict
 
 from pytest_bdd import parsers, scenarios, then, when
 
+from framework.cli.openshift_cli import OpenShiftCLI
 from framework.fixtures.async_bridge import run_async
 from framework.helpers.yaml_field_extractor import YamlFieldExtractor
 from framework.helpers.yaml_loader import YamlLoader
@@ -245,12 +246,20 @@ def edit_task_yaml(
 
 
 @when(parsers.parse('the user deletes the task "{task_name}"'))
-def delete_task(page: Dict[str, Any], task_name: str, playwright_event_loop: asyncio.AbstractEventLoop) -> None:
+def delete_task(
+    page: Dict[str, Any],
+    task_name: str,
+    openshift_cli: OpenShiftCLI,
+    test_project: str,
+    playwright_event_loop: asyncio.AbstractEventLoop,
+) -> None:
     """
     Delete a task using the kebab menu and confirmation modal.
 
     :param Dict[str, Any] page: Page object dictionary
     :param str task_name: Name of the task to delete
+    :param OpenShiftCLI openshift_cli: CLI wrapper instance used to confirm the resource is gone
+    :param str test_project: The test project name from CLI fixture (module-scoped)
     :param asyncio.AbstractEventLoop playwright_event_loop: Event loop for async execution
     :return: None: Raises AssertionError if deletion fails
     """
@@ -281,11 +290,11 @@ def delete_task(page: Dict[str, Any], task_name: str, playwright_event_loop: asy
         assert delete_clicked, f"Failed to click 'Delete Task' menu item for '{task_name}'"
 
         # Wait for confirmation modal to appear and confirm deletion using modal component
-        confirmation_success = await page["modal"].confirm_deletion(task_name)
-        assert confirmation_success, f"Failed to confirm deletion of task '{task_name}'"
+        deletion = await page["modal"].start_deletion(task_name)
 
-        # Wait for deletion to complete
-        await page["raw_page"].wait_for_timeout(2000)
+        # Wait for the DELETE API response, the modal to close and the resource to be gone from the cluster
+        deletion_complete = await deletion.wait(openshift_cli, "tasks.tekton.dev", test_project)
+        assert deletion_complete, f"Failed to confirm deletion of task '{task_name}'"
 
     run_async(playwright_event_loop, _step())
 
@@ -13,25 +13,32 @@ from pytest_bdd import parsers, scenarios, then, when
 
 from framework.cli.openshift_cli import OpenShiftCLI
 from framework.fixtures.async_bridge import run_async
+from framework.helpers.prerequisite_scheduler import Prerequisite, PrerequisiteScheduler
 from framework.helpers.yaml_loader import YamlLoader
 
 # Register all scenarios from the taskrun_crud_operations feature file
 FEATURE_FILE = Path(__file__).parent.parent / "features" / "taskrun_crud_operations.feature"
 scenarios(FEATURE_FILE)
 
+# Applied in the background while the Background logs in and navigates
+CLUSTER_PREREQUISITES = [Prerequisite("task", "simple_task.yaml")]
+
 
 @when(parsers.parse('the user creates a task via cli from YAML file "{task_yaml_file}"'))
 def create_task_via_cli(
-    task_yaml_file: str, openshift_cli: OpenShiftCLI, playwright_event_loop: asyncio.AbstractEventLoop
+    task_yaml_file: str,
+    cluster_prerequisites: PrerequisiteScheduler,
+    playwright_event_loop: asyncio.AbstractEventLoop,
 ) -> None:
     """
     Create a Tekton Task via OpenShift CLI by loading YAML from test data.
 
     This step creates the prerequisite Task resource that a TaskRun will reference.
-    The Task is applied to the current project/namespace using oc apply.
+    The Task is applied to the test project using oc apply. If the feature declares the file
+    in CLUSTER_PREREQUISITES, the step awaits the apply started in the background instead.
 
     :param str task_yaml_file: Name of task YAML file in test_data/tasks/
-    :param OpenShiftCLI openshift_cli: CLI wrapper instance
+    :param PrerequisiteScheduler cluster_prerequisites: Scheduler of the feature's cluster prerequisites
     :param asyncio.AbstractEventLoop playwright_event_loop: Event loop for async execution
     :return: None: Raises AssertionError if task creation fails
     """
@@ -40,8 +47,8 @@ def create_task_via_cli(
         # Load task YAML content using helper
         yaml_content = YamlLoader.load_task_yaml(task_yaml_file)
 
-        # Apply the task YAML via CLI
-        success = await openshift_cli.apply_yaml(yaml_content)
+        # Apply the task YAML via CLI (or await the scheduled apply)
+        success = await cluster_prerequisites.apply(Prerequisite("task", task_yaml_file))
         assert success, f"Failed to create task from YAML file '{task_yaml_file}' via CLI"
 
         # Extract task name from YAML for logging
@@ -267,12 +274,20 @@ def verify_taskrun_in_list(
 
 
 @when(parsers.parse('the user deletes the taskrun "{taskrun_name}"'))
-def delete_taskrun(page: Dict[str, Any], taskrun_name: str, playwright_event_loop: asyncio.AbstractEventLoop) -> None:
+def delete_taskrun(
+    page: Dict[str, Any],
+    taskrun_name: str,
+    openshift_cli: OpenShiftCLI,
+    test_project: str,
+    playwright_event_loop: asyncio.AbstractEventLoop,
+) -> None:
     """
     Delete a TaskRun using the kebab menu and confirmation modal.
 
     :param Dict[str, Any] page: Page object dictionary
     :param str taskrun_name: Name prefix of the TaskRun to delete
+    :param OpenShiftCLI openshift_cli: CLI wrapper instance used to confirm the resource is gone
+    :param str test_project: The test project name from CLI fixture (module-scoped)
     :param asyncio.AbstractEventLoop playwright_event_loop: Event loop for async execution
     :return: None: Raises AssertionError if deletion fails
     """
@@ -310,11 +325,11 @@ def delete_taskrun(page: Dict[str, Any], taskrun_name: str, playwright_event_loo
         assert delete_clicked, f"Failed to click 'Delete TaskRun' menu item for '{taskrun_name}'"
 
         # Wait for confirmation modal to appear and confirm deletion using modal component
-        confirmation_success = await page["modal"].confirm_deletion(taskrun_name)
-        assert confirmation_success, f"Failed to confirm deletion of TaskRun '{taskrun_name}'"
+        deletion = await page["modal"].start_deletion(taskrun_name)
 
-        # Wait for deletion to complete
-        await page["raw_page"].wait_for_timeout(2000)
+        # Wait for the DELETE API response, the modal to close and the resource to be gone from the cluster
+        deletion_complete = await deletion.wait(openshift_cli, "taskruns.tekton.dev", test_project)
+        assert deletion_complete, f"Failed to confirm deletion of TaskRun '{taskrun_name}'"
 
     run_async(playwright_event_loop, _step())
 
@@ -0,0 +1,139 @@
+"""
+Trigger Bulk Operations Test Steps.
+
+BDD step definitions for creating trigger resources (via CLI and UI) and verifying them in the
+Triggers list, including lists of hundreds of EventListeners that the virtualized grid only
+renders partially. Steps are async-native (see framework/fixtures/async_steps.py).
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, Dict
+
+from pytest_bdd import parsers, scenarios
+
+from framework.cli.openshift_cli import OpenShiftCLI
+from framework.config.config import Config
+from framework.fixtures.async_steps import ScenarioTaskGroup, async_then, async_when
+from framework.helpers.resource_factory import ResourceFactory
+from framework.helpers.yaml_loader import YamlLoader
+from tests.steps.test_shared_steps import wait_for_trigger_prerequisites
+
+logger = logging.getLogger(__name__)
+
+# Register all scenarios from the triggers_bulk_operations feature file
+FEATURE_FILE = Path(__file__).parent.parent / "features" / "triggers_bulk_operations.feature"
+scenarios(FEATURE_FILE)
+
+
+@async_when(parsers.parse('the user creates {count:d} eventlisteners via cli with name prefix "{name_prefix}"'))
+async def create_eventlisteners_via_cli(
+    count: int,
+    name_prefix: str,
+    openshift_cli: OpenShiftCLI,
+    test_project: str,
+    scenario_tasks: ScenarioTaskGroup,
+) -> None:
+    """
+    Create many EventListeners via OpenShift CLI in batched oc apply calls.
+
+    :param int count: Number of EventListeners to create
+    :param str name_prefix: Prefix of the EventListener names (numbered copies, e.g. "scale-el-000")
+    :param OpenShiftCLI openshift_cli: CLI wrapper instance
+    :param str test_project: The test project name from CLI fixture (module-scoped)
+    :param ScenarioTaskGroup scenario_tasks: Background tasks of the scenario (trigger prerequisites)
+    :return: None: Raises AssertionError if creation fails
+    """
+    await wait_for_trigger_prerequisites(scenario_tasks)
+    yaml_content = YamlLoader.load_trigger_yaml("simple_eventlistener.yaml")
+    names, documents = ResourceFactory.render_copies(yaml_content, count, name_prefix)
+
+    success = await openshift_cli.apply_yaml_documents(documents, namespace=test_project)
+    assert success, f"Failed to create {count} EventListeners with prefix '{name_prefix}' via CLI"
+
+    # Confirm through the API before looking at the UI, so UI failures are not CLI failures
+    existing = set(await openshift_cli.get_resource_names("eventlisteners.triggers.tekton.dev", test_project) or [])
+    missing = [name for name in names if name not in existing]
+    assert not missing, f"{len(missing)} EventListeners were not created via CLI: {missing[:10]}"
+    logger.info("Created %s EventListeners with prefix '%s' via CLI", count, name_prefix)
+
+
+@async_when(parsers.parse('the user creates an eventlistener from YAML file "{yaml_file}"'))
+async def create_eventlistener_from_yaml(
+    page: Dict[str, Any], yaml_file: str, scenario_tasks: ScenarioTaskGroup
+) -> None:
+    """
+    Create an EventListener by loading YAML from test data and submitting it in the YAML editor.
+
+    :param Dict[str, Any] page: Page object dictionary
+    :param str yaml_file: Name of YAML file in test_data/triggers/
+    :param ScenarioTaskGroup scenario_tasks: Background tasks of the scenario (trigger prerequisites)
+    :return: None: Raises AssertionError if creation fails
+    """
+    yaml_content = YamlLoader.load_trigger_yaml(yaml_file)
+    await wait_for_trigger_prerequisites(scenario_tasks)
+
+    # Open the Create EventListener page in the current project
+    await page["router"].open_resource("EventListener", "~new")
+    assert await page["triggers"].create.eventlistener.verify_on_page(), "Create EventListener page did not load"
+
+    created = await page["triggers"].create.eventlistener.create_from_yaml(yaml_content)
+    assert created, f"Failed to submit EventListener YAML from '{yaml_file}'"
+
+    # Wait for redirect to the EventListener details page
+    assert await page["triggers"].eventlistener.details.verify_on_page(), (
+        "Not redirected to EventListener details page after creation"
+    )
+
+
+@async_then(parsers.parse('the eventlistener "{eventlistener_name}" should appear in the EventListeners tab'))
+async def verify_eventlistener_in_list(page: Dict[str, Any], eventlistener_name: str) -> None:
+    """
+    Verify that an EventListener appears in the EventListeners tab of the Triggers page.
+
+    :param Dict[str, Any] page: Page object dictionary
+    :param str eventlistener_name: Name of the EventListener
+    :return: None: Raises AssertionError if the EventListener is not listed
+    """
+    assert await page["router"].open_section("triggers"), "Failed to navigate to Triggers page"
+    row = await page["triggers"].list.find_row(eventlistener_name, wait_ms=5000)
+    assert row is not None, f"EventListener '{eventlistener_name}' does not appear in the EventListeners tab"
+
+
+@async_then(
+    parsers.parse(
+        'all {count:d} eventlisteners with name prefix "{name_prefix}" should appear in the EventListeners tab'
+    )
+)
+async def verify_all_eventlisteners_in_list(page: Dict[str, Any], count: int, name_prefix: str, config: Config) -> None:
+    """
+    Verify that every seeded EventListener appears in the EventListeners tab.
+
+    Filters the list by the name prefix and scrolls through the virtualized grid, so rows outside
+    the rendered window are counted too. Retries while the console's watch catches up.
+
+    :param Dict[str, Any] page: Page object dictionary
+    :param int count: Number of EventListeners expected
+    :param str name_prefix: Prefix of the EventListener names
+    :param Config config: Config object for timeout values
+    :return: None: Raises AssertionError if any EventListener is missing from the list
+    """
+    expected = set(ResourceFactory.copy_names(name_prefix, count))
+    retry_interval_seconds = 5
+    max_attempts = max(1, config.timeout_ms // (retry_interval_seconds * 1000))
+    missing = expected
+
+    assert await page["router"].open_section("triggers"), "Failed to navigate to Triggers page"
+    for attempt in range(1, max_attempts + 1):
+        await page["triggers"].list.verify_data_load(tab_name="EventListeners tab")
+        snapshot = await page["triggers"].list.resource_table.collect_rows(name_filter=name_prefix)
+        missing = expected - set(snapshot.names())
+        logger.info("Attempt %s/%s: %s/%s EventListeners listed", attempt, max_attempts, count - len(missing), count)
+        if not missing:
+            return
+        await asyncio.sleep(retry_interval_seconds)
+
+    raise AssertionError(
+        f"{len(missing)} of {count} EventListeners are missing from the EventListeners tab: {sorted(missing)[:10]}"
+    )
@@ -0,0 +1,192 @@
+"""
+EventListener Webhook Load Test Steps.
+
+BDD step definitions for firing bursts of webhook events at an EventListener (or a local
+stand-in receiver) and verifying that every triggered PipelineRun is created and shown in
+the PipelineRuns list, including how long the console took to show them. Steps are
+async-native (see framework/fixtures/async_steps.py).
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from pytest import FixtureRequest
+from pytest_bdd import given, parsers, scenarios, then
+
+from framework.cli.openshift_cli import OpenShiftCLI
+from framework.fixtures.async_steps import ScenarioTaskGroup, async_given, async_then, async_when
+from framework.helpers.webhook_load_driver import (
+    EVENT_ID_LABEL,
+    LoadReport,
+    LocalEventListenerReceiver,
+    WebhookLoadDriver,
+)
+from framework.helpers.yaml_loader import YamlLoader
+from tests.steps.test_shared_steps import wait_for_trigger_prerequisites
+
+logger = logging.getLogger(__name__)
+
+# Register all scenarios from the triggers_webhook_load feature file
+FEATURE_FILE = Path(__file__).parent.parent / "features" / "triggers_webhook_load.feature"
+scenarios(FEATURE_FILE)
+
+# generateName of the PipelineRuns created by simple-triggertemplate
+TRIGGERED_PIPELINERUN_PREFIX = "triggered-pipelinerun-"
+
+
+@given("a local eventlistener receiver is running", target_fixture="eventlistener_url")
+def start_local_eventlistener_receiver(request: FixtureRequest) -> str:
+    """
+    Start a local stand-in that answers like an EventListener, for runs without a cluster.
+
+    :param FixtureRequest request: Pytest request, used to stop the receiver after the scenario
+    :return: str: URL of the local receiver
+    """
+    receiver = LocalEventListenerReceiver().start()
+    request.addfinalizer(receiver.stop)
+    return receiver.url
+
+
+@async_given(
+    parsers.parse('the eventlistener from YAML file "{yaml_file}" is created and exposed via cli'),
+    target_fixture="eventlistener_url",
+)
+async def create_and_expose_eventlistener_via_cli(
+    yaml_file: str, openshift_cli: OpenShiftCLI, test_project: str, scenario_tasks: ScenarioTaskGroup
+) -> str:
+    """
+    Create an EventListener via OpenShift CLI and expose its service through a Route.
+
+    :param str yaml_file: Name of YAML file in test_data/triggers/
+    :param OpenShiftCLI openshift_cli: CLI wrapper instance
+    :param str test_project: The test project name from CLI fixture (module-scoped)
+    :param ScenarioTaskGroup scenario_tasks: Background tasks of the scenario (trigger prerequisites)
+    :return: str: Webhook URL of the EventListener
+    """
+    yaml_content = YamlLoader.load_trigger_yaml(yaml_file)
+    eventlistener_name = YamlLoader.get_resource_metadata(yaml_content)["name"]
+    await wait_for_trigger_prerequisites(scenario_tasks)
+
+    success = await openshift_cli.apply_yaml(yaml_content, namespace=test_project)
+    assert success, f"Failed to create EventListener from YAML file '{yaml_file}' via CLI"
+
+    url = await openshift_cli.expose_eventlistener(eventlistener_name, namespace=test_project)
+    assert url, f"Failed to expose EventListener '{eventlistener_name}' in project '{test_project}'"
+    return url
+
+
+@async_when(
+    parsers.parse("{count:d} webhook events are sent to the eventlistener within {seconds:d} seconds"),
+    target_fixture="webhook_load_report",
+)
+async def send_webhook_events(count: int, seconds: int, eventlistener_url: str) -> LoadReport:
+    """
+    Send a burst of webhook events, spread evenly over the given time.
+
+    :param int count: Number of webhook events
+    :param int seconds: Time to spread the events over
+    :param str eventlistener_url: EventListener (or local receiver) URL
+    :return: LoadReport: Outcome of every event
+    """
+    driver = WebhookLoadDriver(eventlistener_url)
+    return await driver.fire_burst(count, duration_seconds=seconds)
+
+
+@then(parsers.parse("all {count:d} webhook events should be accepted"))
+def verify_webhook_events_accepted(count: int, webhook_load_report: LoadReport) -> None:
+    """
+    Verify that the EventListener accepted every webhook event and returned an event ID for each.
+
+    :param int count: Number of webhook events sent
+    :param LoadReport webhook_load_report: Outcome of the burst
+    :return: None: Raises AssertionError if any event was rejected
+    """
+    failed = webhook_load_report.failed
+    assert not failed, (
+        f"{webhook_load_report.summary()}; first failures: "
+        f"{[(event.index, event.status, event.error) for event in failed[:5]]}"
+    )
+    assert len(set(webhook_load_report.event_ids)) == count, (
+        f"Expected {count} distinct event IDs, got {len(set(webhook_load_report.event_ids))}"
+    )
+
+
+@async_then(
+    parsers.parse("a pipelinerun should be created for every accepted webhook event within {timeout:d} seconds"),
+    target_fixture="triggered_pipelineruns",
+)
+async def verify_pipelineruns_created_for_events(
+    timeout: int, webhook_load_report: LoadReport, openshift_cli: OpenShiftCLI, test_project: str
+) -> list[str]:
+    """
+    Resolve every accepted event to the PipelineRun it triggered, using the event ID label.
+
+    :param int timeout: Maximum time to wait for the PipelineRuns, in seconds
+    :param LoadReport webhook_load_report: Outcome of the burst
+    :param OpenShiftCLI openshift_cli: CLI wrapper instance
+    :param str test_project: The test project name from CLI fixture (module-scoped)
+    :return: list[str]: Names of the triggered PipelineRuns
+    """
+    event_ids = set(webhook_load_report.event_ids)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        labels = await openshift_cli.get_resource_label_values("pipelinerun", EVENT_ID_LABEL, test_project)
+        runs = {name: event_id for name, event_id in (labels or {}).items() if event_id in event_ids}
+        missing = event_ids - set(runs.values())
+        logger.info("%s/%s events have a PipelineRun", len(event_ids) - len(missing), len(event_ids))
+        if not missing:
+            return sorted(runs)
+        assert loop.time() < deadline, (
+            f"{len(missing)} of {len(event_ids)} accepted events have no PipelineRun after {timeout}s"
+        )
+        await asyncio.sleep(2)
+
+
+@async_then(
+    parsers.parse("all triggered pipelineruns should appear in the PipelineRuns list within {timeout:d} seconds")
+)
+async def verify_triggered_pipelineruns_listed(
+    page: Dict[str, Any],
+    timeout: int,
+    triggered_pipelineruns: list[str],
+    webhook_load_report: LoadReport,
+    test_project: str,
+) -> None:
+    """
+    Verify that the PipelineRuns list shows every triggered PipelineRun, and log how quickly it did.
+
+    :param Dict[str, Any] page: Page object dictionary
+    :param int timeout: Maximum time to wait for the list, in seconds
+    :param list[str] triggered_pipelineruns: Names of the triggered PipelineRuns
+    :param LoadReport webhook_load_report: Outcome of the burst (latencies are measured from its start)
+    :param str test_project: The test project name from CLI fixture (module-scoped)
+    :return: None: Raises AssertionError if any PipelineRun is missing from the list
+    """
+    assert await page["router"].open_section("pipelines", namespace=test_project, tab="pipeline-runs"), (
+        "Failed to navigate to PipelineRuns list"
+    )
+    first_listed: Dict[str, Optional[float]] = await page["pipelines"].runs.track_pipelineruns_listed(
+        triggered_pipelineruns,
+        since=webhook_load_report.started_at,
+        timeout_ms=timeout * 1000,
+        name_filter=TRIGGERED_PIPELINERUN_PREFIX,
+    )
+
+    missing = sorted(name for name, seconds in first_listed.items() if seconds is None)
+    latencies = sorted(seconds for seconds in first_listed.values() if seconds is not None)
+    if latencies:
+        logger.info(
+            "Console listed %s/%s triggered PipelineRuns; "
+            "first after %.1fs, last after %.1fs from the first webhook event",
+            len(latencies),
+            len(first_listed),
+            latencies[0],
+            latencies[-1],
+        )
+    assert not missing, (
+        f"{len(missing)} of {len(first_listed)} triggered PipelineRuns are missing from the PipelineRuns list "
+        f"after {timeout}s: {missing[:10]}"
+    )